@@ -37,7 +37,7 @@ from core.config import (  # noqa: E402
     load_json,
 )
 from core.simulator import Simulator  # noqa: E402
-from apps.shared_ui import list_scenarios, draw_polygon, world_to_screen, screen_to_world, HoverMenu  # noqa: E402
+from apps.shared_ui import list_scenarios, draw_polygon, world_to_screen, world_to_screen_many, screen_to_world, HoverMenu  # noqa: E402
 from low_level_mechanics.geometry import Polygon  # noqa: E402
 from low_level_mechanics.world import Pose2D  # noqa: E402
 
@@ -1131,13 +1131,17 @@ class DesignerApp:
             return None
         thresh = pixel_radius / max(self.scale, 1e-6)
         best: Optional[Tuple[str, str]] = None
-        best_d = thresh
+        # Compare squared distances; only the ordering matters.
+        best_d = thresh * thresh
+        wx, wy = world_point
         for name, motor in self.sim.motors.items():
             parent = motor.parent
             if not parent:
                 continue
             pose = parent.pose.compose(motor.mount_pose)
-            d = math.hypot(world_point[0] - pose.x, world_point[1] - pose.y)
+            dx = wx - pose.x
+            dy = wy - pose.y
+            d = dx * dx + dy * dy
             if d < best_d:
                 best_d = d
                 best = ("actuator", name)
@@ -1146,7 +1150,9 @@ class DesignerApp:
             if not parent:
                 continue
             pose = parent.pose.compose(sensor.mount_pose)
-            d = math.hypot(world_point[0] - pose.x, world_point[1] - pose.y)
+            dx = wx - pose.x
+            dy = wy - pose.y
+            d = dx * dx + dy * dy
             if d < best_d:
                 best_d = d
                 best = ("sensor", name)
@@ -2064,14 +2070,14 @@ class DesignerApp:
                     (b.max_x, b.max_y),
                     (b.max_x, b.min_y),
                 ]
-                pts = [world_to_screen(c, self.viewport_rect, self.scale, self.offset, rot) for c in corners]
+                pts = world_to_screen_many(corners, self.viewport_rect, self.scale, self.offset, rot)
                 pygame.draw.polygon(self.window_surface, (60, 80, 110), pts, max(1, int(0.02 * self.scale)))
             strokes = getattr(self.world_cfg, "drawings", []) or []
             for stroke in strokes:
                 if not getattr(stroke, "points", None) or len(stroke.points) < 2:
                     continue
                 color = tuple(getattr(stroke, "color", self._stroke_color("mark")))
-                pts = [world_to_screen(p, self.viewport_rect, self.scale, self.offset, rot) for p in stroke.points]
+                pts = world_to_screen_many(stroke.points, self.viewport_rect, self.scale, self.offset, rot)
                 width = max(1, int(max(1.0, stroke.thickness * self.scale)))
                 pygame.draw.lines(self.window_surface, color, False, pts, width)
                 if getattr(stroke, "kind", "mark") == "wall":
@@ -2080,23 +2086,23 @@ class DesignerApp:
                 pts = self.env_stroke_points.copy()
                 if self.hover_world:
                     pts.append(self.hover_world)
-                scr = [world_to_screen(p, self.viewport_rect, self.scale, self.offset, rot) for p in pts]
+                scr = world_to_screen_many(pts, self.viewport_rect, self.scale, self.offset, rot)
                 pygame.draw.lines(self.window_surface, (150, 200, 240), False, scr, max(1, int(self.env_brush_thickness * self.scale)))
             if self.bounds_mode and self.bounds_start and self.bounds_preview:
                 x0, y0 = self.bounds_start
                 x1, y1 = self.bounds_preview
                 corners = [(x0, y0), (x0, y1), (x1, y1), (x1, y0)]
-                scr = [world_to_screen(c, self.viewport_rect, self.scale, self.offset, rot) for c in corners]
+                scr = world_to_screen_many(corners, self.viewport_rect, self.scale, self.offset, rot)
                 pygame.draw.polygon(self.window_surface, (120, 160, 200), scr, 1)
         if self.mode == "draw_shape" and self.shape_start and self.shape_preview:
             preview_body = self._build_shape_body(self.shape_start, self.shape_preview)
             if preview_body:
-                pts = [world_to_screen(p, self.viewport_rect, self.scale, self.offset, rot) for p in preview_body.points]
+                pts = world_to_screen_many(preview_body.points, self.viewport_rect, self.scale, self.offset, rot)
                 if len(pts) >= 2:
                     pygame.draw.polygon(self.window_surface, (120, 200, 255), pts, 2)
         if self.active_tab == "custom" and self.custom_active:
             body = self.custom_active.body
-            pts = [world_to_screen(p, self.viewport_rect, self.scale, self.offset, rot) for p in body.points]
+            pts = world_to_screen_many(body.points, self.viewport_rect, self.scale, self.offset, rot)
             if len(pts) >= 3:
                 pygame.draw.polygon(self.window_surface, (150, 180, 240), pts, 0)
                 pygame.draw.polygon(self.window_surface, (60, 80, 120), pts, 2)
@@ -5,10 +5,13 @@ import csv
 import json
 import math
 import sys
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Callable, Set, Tuple
+from typing import Any, Optional, List, Dict, Callable, Set, Tuple
 
 import pygame
 import pygame_gui
@@ -16,7 +19,7 @@ from pygame_gui.windows import UIFileDialog
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from core import load_scenario, save_scenario, load_robot_design, Simulator, save_snapshot, load_snapshot  # noqa: E402
+from core import load_scenario, save_scenario, load_robot_design, Simulator, save_snapshot_async, flush_snapshots, load_snapshot  # noqa: E402
 from core.config import WorldConfig, RobotConfig  # noqa: E402
 from apps.help_content import (  # noqa: E402
     HELP_TOPICS,
@@ -25,10 +28,38 @@ from apps.help_content import (  # noqa: E402
     serialize_help_topics,
     serialize_capture_menu,
 )
-from apps.shared_ui import list_scenarios, SimpleTextEditor, world_to_screen, screen_to_world, HoverMenu  # noqa: E402
+from apps.shared_ui import list_scenarios, SimpleTextEditor, world_to_screen, world_to_screen_many, screen_to_world, HoverMenu, GlyphAtlas, blit_batch  # noqa: E402
 from low_level_mechanics.geometry import Polygon  # noqa: E402
 
 
+# SDL event types nothing in the runner (or pygame_gui) consumes; dropped at the source.
+UNUSED_EVENT_NAMES = (
+    "JOYAXISMOTION",
+    "JOYBALLMOTION",
+    "JOYHATMOTION",
+    "JOYBUTTONDOWN",
+    "JOYBUTTONUP",
+    "JOYDEVICEADDED",
+    "JOYDEVICEREMOVED",
+    "CONTROLLERAXISMOTION",
+    "CONTROLLERBUTTONDOWN",
+    "CONTROLLERBUTTONUP",
+    "CONTROLLERDEVICEADDED",
+    "CONTROLLERDEVICEREMOVED",
+    "CONTROLLERDEVICEREMAPPED",
+    "FINGERDOWN",
+    "FINGERUP",
+    "FINGERMOTION",
+    "MULTIGESTURE",
+    "AUDIODEVICEADDED",
+    "AUDIODEVICEREMOVED",
+    "DROPFILE",
+    "DROPTEXT",
+    "DROPBEGIN",
+    "DROPCOMPLETE",
+)
+
+
 def frange(start: float, stop: float, step: float):
     x = start
     while x <= stop + 1e-9:
@@ -66,13 +97,24 @@ class DockItem:
     visible: bool = True
     min_size: Tuple[int, int] = (260, 200)
     z: int = 0
+    # Off-screen copy of the panel body; re-rendered only when dirty or stale.
+    content_surf: Optional[pygame.Surface] = None
+    content_dirty: bool = True
+    content_ms: int = 0
 
 
 class RunnerApp:
+    # Robot-center grab radius in pixels, squared for sqrt-free hit tests.
+    _HOVER_RADIUS_SQ = 14 * 14
+    # Text panels rendered off-screen; live values refresh at ~15 Hz rather than every frame.
+    _CACHED_PANELS = ("devices", "state", "logs", "console")
+    _LIVE_PANEL_REFRESH_MS = 66
+
     def __init__(self) -> None:
         pygame.init()
         # Enable key repeat for held keys (e.g., arrows, delete)
         pygame.key.set_repeat(300, 35)
+        pygame.event.set_blocked([getattr(pygame, n) for n in UNUSED_EVENT_NAMES if hasattr(pygame, n)])
         pygame.display.set_caption("Runner")
         self.window_size = (1280, 760)
         self.window_surface = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
@@ -114,9 +156,29 @@ class RunnerApp:
         self.panel_menu_anchor = "right"
         self.dock_z_counter = 0
         self.panel_layout_path = self.base_path / "runner_layout.json"
+        # Layout writes are debounced and run on a worker thread so dock drags never block on disk.
+        self._layout_dirty = False
+        self._layout_last_save = 0.0
+        self._layout_io = ThreadPoolExecutor(max_workers=1)
+        # Snapshots are captured on the main thread but serialized/written in the background.
+        self._snap_futures: List[Tuple[Path, Future]] = []
         self.reposition_target: Optional[Tuple[float, float]] = None
         self.reposition_angle: float = 0.0
         self._stepped_this_frame = False
+        # Redraw only when something changed; the grid layer is cached per view transform.
+        # _needs_redraw presents the whole window, _dirty_rects only the listed regions.
+        self._needs_redraw = True
+        self._dirty_rects: List[pygame.Rect] = []
+        self._frame_mods = 0
+        self._grid_cache: Optional[pygame.Surface] = None
+        # Fonts are created once per (name, size, bold); building them every frame is expensive.
+        self._fonts: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+        self._mono_widths: Dict[pygame.font.Font, int] = {}
+        self._wrap_cache: Dict[Tuple[pygame.font.Font, int, str], List[str]] = {}
+        self._atlases: Dict[Tuple[pygame.font.Font, Tuple[int, int, int]], GlyphAtlas] = {}
+        # Panel and status-bar line slots -> (text, rendered surface); re-rendered only when the text changes.
+        self._state_text_cache: Dict[str, Tuple[str, pygame.Surface]] = {}
+        self._grid_cache_key: Optional[Tuple[object, ...]] = None
         self.robot_dragging = False
         self.robot_drag_start: Optional[Tuple[float, float]] = None
         self.robot_drag_center: Optional[Tuple[float, float]] = None
@@ -125,7 +187,8 @@ class RunnerApp:
         self.show_device_help = True
         self.pose_history: List[Tuple[float, float, float]] = []
         self.pose_redo: List[Tuple[float, float, float]] = []
-        self.error_log: List[Dict[str, str]] = []
+        self.error_log: List[Dict[str, Any]] = []
+        self._last_error_hash: Optional[int] = None  # dedups repeats of error_log[-1]
         self.console_lines: List[str] = []
         self._console_buffer: str = ""
         self.path_trace: List[Tuple[float, float]] = []
@@ -139,6 +202,7 @@ class RunnerApp:
         self._logger_elapsed = 0.0
         self.logger_status = "Logger idle"
         self.signal_hitboxes: Dict[str, pygame.Rect] = {}
+        self._signal_hitboxes_local: Dict[str, pygame.Rect] = {}
         self.plot_data: Dict[str, List[Optional[float]]] = {}
         self.plot_selected_cols: Set[str] = set()
         self.plot_source: Optional[Path] = None
@@ -292,6 +356,10 @@ class RunnerApp:
         for i, item in enumerate(self.dock_items.values()):
             item.z = i
         self.panel_inner_rects = {}
+        # Draw order (docked first, then floating by z); rebuilt only when visibility/dock/z change.
+        self._ordered_panels: List[DockItem] = []
+        self._panels_dirty = True
+        self._chrome_cache: Dict[str, Tuple[Tuple[object, ...], pygame.Surface]] = {}
 
     def _init_hover_menu(self) -> None:
         # Initialize hover menu with the dynamic builder.
@@ -310,7 +378,7 @@ class RunnerApp:
             self.btn_play.set_text("Play" if not self.playing else "Pause")
         except Exception:
             pass
-        self._refresh_hover_menu()
+        self._sync_hover_menu_labels()
 
     def _step_once(self) -> None:
         self.playing = False
@@ -326,7 +394,7 @@ class RunnerApp:
             if self.sim and self.sim.last_controller_error:
                 self._record_error("Controller error", self.sim.last_controller_error)
                 self.sim.clear_controller_error()
-        self._refresh_hover_menu()
+        self._sync_hover_menu_labels()
 
     def _set_playback_rate(self, value: float) -> None:
         self.playback_rate = max(0.05, float(value))
@@ -335,7 +403,7 @@ class RunnerApp:
         if self.speed_label:
             self.speed_label.set_text(f"Speed: {self.playback_rate:.2f}x")
         self.status_text = f"Speed {self.playback_rate:.2f}x"
-        self._refresh_hover_menu()
+        self._sync_hover_menu_labels()
 
     def _open_speed_slider(self) -> None:
         if self.speed_slider_window:
@@ -390,8 +458,7 @@ class RunnerApp:
         item.visible = not item.visible
         self._bump_panel(pid)
         self._update_layout()
-        self._save_panel_layout()
-        self._refresh_hover_menu()
+        self._layout_dirty = True
 
     def _panel_header_rect(self, item: DockItem) -> pygame.Rect:
         return pygame.Rect(item.rect.x, item.rect.y, item.rect.width, self.panel_header_h)
@@ -437,6 +504,7 @@ class RunnerApp:
             return
         self.dock_z_counter += 1
         item.z = self.dock_z_counter
+        self._panels_dirty = True
 
     def _load_panel_layout(self) -> None:
         if not self.panel_layout_path.exists():
@@ -460,23 +528,42 @@ class RunnerApp:
             if isinstance(visible, bool):
                 item.visible = visible
 
-    def _save_panel_layout(self) -> None:
-        try:
-            payload = {
-                "panels": {
-                    pid: {
-                        "rect": [item.rect.x, item.rect.y, item.rect.width, item.rect.height],
-                        "dock": item.dock,
-                        "visible": item.visible,
-                    }
-                    for pid, item in self.dock_items.items()
+    def _panel_layout_payload(self) -> Dict[str, object]:
+        return {
+            "panels": {
+                pid: {
+                    "rect": [item.rect.x, item.rect.y, item.rect.width, item.rect.height],
+                    "dock": item.dock,
+                    "visible": item.visible,
                 }
+                for pid, item in self.dock_items.items()
             }
+        }
+
+    def _write_panel_layout(self, payload: Dict[str, object]) -> None:
+        try:
             self.panel_layout_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
         except Exception:
             # Persistence is best-effort; avoid crashing on save errors.
             pass
 
+    def _save_panel_layout(self) -> None:
+        """Write the layout synchronously (shutdown path)."""
+        self._layout_dirty = False
+        self._write_panel_layout(self._panel_layout_payload())
+
+    def _flush_panel_layout(self) -> None:
+        """Persist a dirty layout at most once per second without blocking the frame."""
+        if not self._layout_dirty:
+            return
+        now = time.monotonic()
+        if now - self._layout_last_save <= 1.0:
+            return
+        self._layout_dirty = False
+        self._layout_last_save = now
+        # Snapshot rects on the UI thread; serialization + disk write happen on the worker.
+        self._layout_io.submit(self._write_panel_layout, self._panel_layout_payload())
+
     def _load_editor(self) -> SimpleTextEditor:
         # Prefer a compact monospace font for code
         font = (
@@ -507,8 +594,10 @@ class RunnerApp:
         self.logger_status = "Logger idle"
         self._logger_timer = 0.0
         self._logger_elapsed = 0.0
+        self._mark_content_dirty()
 
     def _update_layout(self) -> None:
+        self._panels_dirty = True
         w, h = self.window_size
         margin = 20
         top_y = 70
@@ -609,11 +698,9 @@ class RunnerApp:
             self.btn_toggle_panel.set_relative_position((item.rect.x + 8, item.rect.y + self.panel_header_h + 4))
 
     def _panel_at_point(self, pos: Tuple[int, int]) -> Optional[DockItem]:
-        visible_items = [i for i in self.dock_items.values() if i.visible]
-        for item in sorted(visible_items, key=lambda d: d.z, reverse=True):
-            if item.rect.collidepoint(pos):
-                return item
-        return None
+        visible_items = sorted((i for i in self.dock_items.values() if i.visible), key=lambda d: d.z, reverse=True)
+        idx = pygame.Rect(pos, (1, 1)).collidelist([i.rect for i in visible_items])
+        return visible_items[idx] if idx >= 0 else None
 
     def _snap_panel(self, panel_id: Optional[str]) -> None:
         if not panel_id:
@@ -645,16 +732,17 @@ class RunnerApp:
             return False
         if self._panel_close_rect(target).collidepoint(event.pos):
             target.visible = False
-            self._save_panel_layout()
+            self._layout_dirty = True
             self._update_layout()
             return True
-        for mode, rect in self._panel_resize_handles(target):
-            if rect.collidepoint(event.pos):
-                self.dock_resizing = (target.id, mode, (event.pos[0], event.pos[1]))
-                self.dock_active_panel = target.id
-                self._bump_panel(target.id)
-                self.dock_last_action = "resize"
-                return True
+        handles = self._panel_resize_handles(target)
+        idx = pygame.Rect(event.pos, (1, 1)).collidelist([rect for _, rect in handles])
+        if idx >= 0:
+            self.dock_resizing = (target.id, handles[idx][0], (event.pos[0], event.pos[1]))
+            self.dock_active_panel = target.id
+            self._bump_panel(target.id)
+            self.dock_last_action = "resize"
+            return True
         if self._panel_header_rect(target).collidepoint(event.pos):
             self.dock_dragging = (target.id, (event.pos[0] - target.rect.x, event.pos[1] - target.rect.y))
             self.dock_active_panel = target.id
@@ -670,6 +758,7 @@ class RunnerApp:
             item = self.dock_items.get(pid)
             if item:
                 item.dock = "floating"
+                self._panels_dirty = True
                 self.dock_last_action = "drag"
                 item.rect.x = event.pos[0] - offset[0]
                 item.rect.y = event.pos[1] - offset[1]
@@ -679,6 +768,7 @@ class RunnerApp:
             item = self.dock_items.get(pid)
             if item:
                 item.dock = "floating"
+                self._panels_dirty = True
                 self.dock_last_action = "resize"
                 start_x, start_y = start
                 dx = event.pos[0] - start[0]
@@ -715,18 +805,20 @@ class RunnerApp:
             self._update_layout()
         return handled
 
-    def _handle_dock_mouse_up(self, event: pygame.event.Event) -> None:
+    def _handle_dock_mouse_up(self, event: pygame.event.Event) -> bool:
         if event.button != 1:
-            return
+            return False
         active = self.dock_active_panel
+        handled = bool(self.dock_dragging or self.dock_resizing)
         self.dock_dragging = None
         self.dock_resizing = None
         if active and self.dock_last_action == "drag":
             self._snap_panel(active)
             self._update_layout()
-            self._save_panel_layout()
+            self._layout_dirty = True
         self.dock_active_panel = None
         self.dock_last_action = None
+        return handled
 
     def _load_sim(self) -> None:
         if not self.scenario_name:
@@ -734,6 +826,7 @@ class RunnerApp:
         self._clear_errors()
         self._clear_console()
         self._clear_plot_data()
+        self._state_text_cache.clear()
         self.world_cfg = None
         self.robot_cfg = None
         scenario_path = self.scenario_root / self.scenario_name
@@ -811,7 +904,16 @@ class RunnerApp:
             while self.running:
                 dt = self.clock.tick(60) / 1000.0
                 self._stepped_this_frame = False
-                for event in pygame.event.get():
+                events = pygame.event.get()
+                if not events and self._is_idle():
+                    # Nothing animating: block until input arrives instead of spinning the loop.
+                    first = pygame.event.wait(250)
+                    if first.type != pygame.NOEVENT:
+                        events = [first] + pygame.event.get()
+                # Modifier state is sampled once per frame (after the pump) rather than per motion event.
+                self._frame_mods = pygame.key.get_mods()
+                for event in events:
+                    self._needs_redraw = True
                     if event.type == pygame.QUIT:
                         self.running = False
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -870,13 +972,16 @@ class RunnerApp:
                             self.pan_start = None
                         if event.button == 1:
                             self._finalize_reposition()
-                            self._handle_dock_mouse_up(event)
+                            # A finished dock drag/resize never started on a widget; skip UI forwarding.
+                            if self._handle_dock_mouse_up(event):
+                                continue
                     if event.type == pygame.MOUSEMOTION:
                         if self.hover_menu:
                             self.hover_menu.handle_event(event)
                         if self._handle_dock_mouse_motion(event):
                             continue
-                        self._handle_pan_motion(event)
+                        if self._handle_pan_motion(event):
+                            continue
                     if event.type == pygame.MOUSEWHEEL:
                         if self._handle_help_mouse(event):
                             continue
@@ -916,13 +1021,74 @@ class RunnerApp:
                 # Only log when the sim actually advances
                 self._update_live_state(sim_advanced if self._stepped_this_frame else 0.0, self._stepped_this_frame)
                 if self.hover_menu:
+                    menu_state = (self.hover_menu.open_menu, self.hover_menu.open_submenu)
                     self.hover_menu.update_hover(pygame.mouse.get_pos())
-                self._draw()
+                    if menu_state != (self.hover_menu.open_menu, self.hover_menu.open_submenu):
+                        self._needs_redraw = True
+                if self._needs_redraw or self._ui_windows_open():
+                    self._draw()
+                elif self.playing or self._stepped_this_frame or self._dirty_rects:
+                    # Only the sim view and live panels change while playing.
+                    self._draw(self._live_rects() if (self.playing or self._stepped_this_frame) else [])
+                self._needs_redraw = False
+                self._dirty_rects = []
+                self._flush_panel_layout()
         finally:
+            self._layout_io.shutdown(wait=True)
+            flush_snapshots()
+            self._poll_snapshot_saves()
             self._save_panel_layout()
             sys.stdout = self._orig_stdout
         pygame.quit()
 
+    def _is_idle(self) -> bool:
+        if self.playing or self._needs_redraw or self._dirty_rects or self._snap_futures:
+            return False
+        if self.hover_menu and self.hover_menu.open_menu is not None:
+            return False  # hover menus close on a timer
+        return not self._ui_windows_open()
+
+    def _invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        if rect is None:
+            self._needs_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def _live_rects(self) -> List[pygame.Rect]:
+        rects = [self.viewport_rect, pygame.Rect(0, self.window_size[1] - 48, self.window_size[0], 48)]
+        rects.extend(item.rect for item in self.dock_items.values() if item.visible and item.id != "code")
+        return rects
+
+    @staticmethod
+    def _hit_region(regions: Dict[str, pygame.Rect], pos: Tuple[int, int]) -> Optional[str]:
+        """First key whose rect contains ``pos``; the scan runs in C via ``collidelist``."""
+        keys = list(regions)
+        idx = pygame.Rect(pos, (1, 1)).collidelist(list(regions.values()))
+        return keys[idx] if idx >= 0 else None
+
+    @staticmethod
+    def _coalesce_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            i = 0
+            while i < len(merged):
+                other = merged[i]
+                union = rect.union(other)
+                # Merge overlapping rects unless the union would push lots of unchanged pixels.
+                if rect.colliderect(other) and union.w * union.h <= rect.w * rect.h + other.w * other.h:
+                    rect = union
+                    merged.pop(i)
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged
+
+    def _ui_windows_open(self) -> bool:
+        # pygame_gui windows animate (cursor blink, hover) without posting events.
+        return any((self.snapshot_dialog, self.plot_dialog, self.robot_dialog, self.speed_slider_window))
+
     def _handle_ui_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame_gui.UI_FILE_DIALOG_PATH_PICKED:
             if self.snapshot_dialog and event.ui_element == self.snapshot_dialog:
@@ -1008,7 +1174,19 @@ class RunnerApp:
             self._export_logger()
 
     def _record_error(self, title: str, details: str, pause: bool = True) -> None:
-        entry: Dict[str, str] = {"title": title, "details": details}
+        self._mark_content_dirty("logs")
+        h = hash((title, details))
+        if self.error_log and self._last_error_hash == h:
+            # Same error again (e.g. controller failing every step): just count it.
+            self.error_log[-1]["count"] += 1
+            if pause and self.playing:
+                self.playing = False
+                self.btn_play.set_text("Play")
+                self.status_text = f"{title} (paused)"
+            self._needs_redraw = True
+            return
+        self._last_error_hash = h
+        entry: Dict[str, Any] = {"title": title, "details": details, "count": 1}
         hint = self._extract_line_hint(details)
         if hint:
             entry["line"] = hint
@@ -1027,6 +1205,8 @@ class RunnerApp:
 
     def _clear_errors(self) -> None:
         self.error_log.clear()
+        self._last_error_hash = None
+        self._mark_content_dirty("logs")
         if self.sim:
             self.sim.clear_controller_error()
         self.status_text = "Errors cleared; ready to run"
@@ -1034,6 +1214,7 @@ class RunnerApp:
     def _clear_console(self) -> None:
         self.console_lines.clear()
         self._console_buffer = ""
+        self._mark_content_dirty("console")
         self.status_text = "Console cleared"
 
     def _append_console(self, data: str) -> None:
@@ -1042,17 +1223,92 @@ class RunnerApp:
         while "\n" in self._console_buffer:
             line, self._console_buffer = self._console_buffer.split("\n", 1)
             self.console_lines.append(line)
+            console = self.dock_items.get("console")
+            if console:
+                console.content_dirty = True
+            if console and console.visible:
+                self._invalidate(console.rect)
         if len(self.console_lines) > 200:
             self.console_lines = self.console_lines[-200:]
 
-    def _extract_line_hint(self, tb: str) -> Optional[str]:
-        for line in reversed(tb.splitlines()):
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _extract_line_hint(tb: str) -> Optional[str]:
+        # Walk lines from the end without materializing the whole traceback as a list.
+        end = len(tb)
+        while end > 0:
+            start = tb.rfind("\n", 0, end)
+            line = tb[start + 1:end]
             if "controller.py" in line:
                 return line.strip()
+            end = start
         return None
 
+    def _font(self, size: int, name: Optional[str] = None, bold: bool = False) -> pygame.font.Font:
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            if name:
+                font = pygame.font.SysFont(name, size, bold=bold)
+            else:
+                font = pygame.font.Font(pygame.font.get_default_font(), size)
+            self._fonts[key] = font
+        return font
+
+    def _blit_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int], pos: Tuple[int, int]) -> None:
+        """Draw frequently changing panel text through a cached glyph atlas."""
+        atlas = self._atlases.get((font, color))
+        if atlas is None:
+            atlas = GlyphAtlas(font, color)
+            self._atlases[(font, color)] = atlas
+        atlas.draw(self.window_surface, text, pos)
+
+    def _cached_text(self, key: str, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        cached = self._state_text_cache.get(key)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surf = font.render(text, True, color)
+        self._state_text_cache[key] = (text, surf)
+        return surf
+
+    def _mono_char_width(self, font: pygame.font.Font) -> int:
+        """Return the glyph advance for monospace fonts, 0 for proportional ones."""
+        char_w = self._mono_widths.get(font)
+        if char_w is None:
+            char_w = font.size("M")[0]
+            if not char_w or font.size("i")[0] != char_w:
+                char_w = 0
+            self._mono_widths[font] = char_w
+        return char_w
+
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+        # Log/console lines rarely change between frames; reuse earlier wraps (callers only read them).
+        key = (font, max_width, text)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            if len(self._wrap_cache) > 4096:
+                self._wrap_cache.clear()
+            lines = self._wrap_text_uncached(text, font, max_width)
+            self._wrap_cache[key] = lines
+        return lines
+
+    def _wrap_text_uncached(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
         lines: List[str] = []
+        char_w = self._mono_char_width(font)
+        if char_w:
+            # Monospace: width is len * advance, so wrap by character count without measuring.
+            max_chars = max_width // char_w
+            for raw_line in text.splitlines():
+                current = ""
+                for w in raw_line.split(" "):
+                    trial = f"{current} {w}".strip()
+                    if len(trial) > max_chars and current:
+                        lines.append(current)
+                        current = w
+                    else:
+                        current = trial
+                lines.append(current)
+            return lines
         for raw_line in text.splitlines():
             words = raw_line.split(" ")
             current = ""
@@ -1091,7 +1347,7 @@ class RunnerApp:
         if self.help_open:
             self.help_scroll = 0
         self.status_text = "Help open" if self.help_open else "Help closed"
-        self._refresh_hover_menu()
+        self._sync_hover_menu_labels()
 
     def _open_help_topic(self, topic_id: str) -> None:
         if any(t["id"] == topic_id for t in self.help_topics):
@@ -1112,10 +1368,10 @@ class RunnerApp:
             if self.help_close_rect and self.help_close_rect.collidepoint(event.pos):
                 self._toggle_help_overlay()
                 return True
-            for tid, rect in self.help_nav_hitboxes.items():
-                if rect.collidepoint(event.pos):
-                    self._open_help_topic(tid)
-                    return True
+            tid = self._hit_region(self.help_nav_hitboxes, event.pos)
+            if tid is not None:
+                self._open_help_topic(tid)
+                return True
         if event.type == pygame.MOUSEWHEEL and self.help_content_rect:
             self.help_scroll += event.y * 24
             self._clamp_help_scroll(self.help_last_content_height, self.help_content_rect.height)
@@ -1123,6 +1379,8 @@ class RunnerApp:
         return False
 
     def _update_live_state(self, sim_dt: float, stepped: bool) -> None:
+        if self._snap_futures:
+            self._poll_snapshot_saves()
         if not self.sim:
             self.live_state = {"motors": {}, "sensors": {}}
             return
@@ -1155,6 +1413,7 @@ class RunnerApp:
                 if len(self.logger_samples) > 1000:
                     self.logger_samples = self.logger_samples[-1000:]
                 self.logger_status = "Logging"
+                self._mark_content_dirty("state")
             if self.logger_duration > 0 and self._logger_elapsed >= self.logger_duration:
                 self.logger_enabled = False
                 self.logger_status = "Logger stopped (duration reached)"
@@ -1180,8 +1439,10 @@ class RunnerApp:
         near_center = False
         if center:
             cx, cy = world_to_screen(center, self.viewport_rect, self.scale, self.offset)
-            dist = math.hypot(event.pos[0] - cx, event.pos[1] - cy)
-            near_center = dist <= 14
+            px, py = event.pos
+            dx = px - cx
+            dy = py - cy
+            near_center = dx * dx + dy * dy <= self._HOVER_RADIUS_SQ
         if event.button == 1 and near_center and self.sim:
             pose = self._robot_pose_now()
             if pose:
@@ -1197,15 +1458,14 @@ class RunnerApp:
             self.pan_active = True
             self.pan_start = event.pos
 
-    def _handle_pan_motion(self, event: pygame.event.Event) -> None:
+    def _handle_pan_motion(self, event: pygame.event.Event) -> bool:
         if self.robot_dragging and self.sim:
             world_point = screen_to_world(event.pos, self.viewport_rect, self.scale, self.offset)
             start = self.robot_drag_start or world_point
             center = self.robot_drag_center or start
             dx = world_point[0] - start[0]
             dy = world_point[1] - start[1]
-            mods = pygame.key.get_mods()
-            if mods & pygame.KMOD_SHIFT:
+            if self._frame_mods & pygame.KMOD_SHIFT:
                 start_angle = math.atan2(start[1] - center[1], start[0] - center[0])
                 curr_angle = math.atan2(world_point[1] - center[1], world_point[0] - center[0])
                 dtheta = curr_angle - start_angle
@@ -1214,15 +1474,16 @@ class RunnerApp:
             else:
                 self.reposition_target = (center[0] + dx, center[1] + dy)
                 self._apply_robot_reposition(self.reposition_target, self.robot_drag_theta)
-            return
+            return True
         if self.pan_active and self.pan_start:
             dx = (event.pos[0] - self.pan_start[0]) / max(self.scale, 1e-6)
             dy = (event.pos[1] - self.pan_start[1]) / max(self.scale, 1e-6)
             # Dragging right moves view right (invert previous direction)
             self.offset = (self.offset[0] + dx, self.offset[1] - dy)
             self.pan_start = event.pos
-        else:
-            self._update_hover_center(event.pos)
+            return True
+        self._update_hover_center(event.pos)
+        return False
 
     def _view_reset(self) -> None:
         self.offset = (0.0, 0.0)
@@ -1270,7 +1531,9 @@ class RunnerApp:
             self.hover_robot_center = False
             return
         sx, sy = world_to_screen(center, self.viewport_rect, self.scale, self.offset)
-        self.hover_robot_center = math.hypot(mouse_pos[0] - sx, mouse_pos[1] - sy) <= 14
+        dx = mouse_pos[0] - sx
+        dy = mouse_pos[1] - sy
+        self.hover_robot_center = dx * dx + dy * dy <= self._HOVER_RADIUS_SQ
 
     def _finalize_reposition(self) -> None:
         if self.robot_dragging:
@@ -1338,13 +1601,14 @@ class RunnerApp:
         panel = self.dock_items.get("state")
         if not panel or not panel.visible or not panel.rect.collidepoint(event.pos):
             return
-        for sig, rect in self.signal_hitboxes.items():
-            if rect.collidepoint(event.pos):
-                if sig in self.logger_selected:
-                    self.logger_selected.remove(sig)
-                else:
-                    self.logger_selected.add(sig)
-                return
+        sig = self._hit_region(self.signal_hitboxes, event.pos)
+        if sig is None:
+            return
+        if sig in self.logger_selected:
+            self.logger_selected.remove(sig)
+        else:
+            self.logger_selected.add(sig)
+        self._mark_content_dirty("state")
 
     def _handle_plot_click(self, event: pygame.event.Event) -> None:
         if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
@@ -1352,18 +1616,16 @@ class RunnerApp:
         panel = self.dock_items.get("plot")
         if not panel or not panel.visible or not panel.rect.collidepoint(event.pos):
             return
-        for key, rect in self.plot_hitboxes.items():
-            if rect.collidepoint(event.pos):
-                if key == "__open__":
-                    self._open_plot_dialog()
-                elif key == "__clear__":
-                    self._clear_plot_data()
-                else:
-                    if key in self.plot_selected_cols:
-                        self.plot_selected_cols.remove(key)
-                    else:
-                        self.plot_selected_cols.add(key)
-                return
+        key = self._hit_region(self.plot_hitboxes, event.pos)
+        if key == "__open__":
+            self._open_plot_dialog()
+        elif key == "__clear__":
+            self._clear_plot_data()
+        elif key is not None:
+            if key in self.plot_selected_cols:
+                self.plot_selected_cols.remove(key)
+            else:
+                self.plot_selected_cols.add(key)
 
     def _set_logger_rate(self, label: str) -> None:
         mapping = {"120 Hz": 1.0 / 120.0, "60 Hz": 1.0 / 60.0, "30 Hz": 1.0 / 30.0, "10 Hz": 0.1}
@@ -1455,12 +1717,35 @@ class RunnerApp:
         snap = self.sim.snapshot()
         snap_dir = self.scenario_root / self.scenario_name / "snapshots"
         snap_path = snap_dir / f"snap_{self.sim.step_index:06d}.json"
-        save_snapshot(snap_path, snap)
-        print(f"Saved snapshot {snap_path}")
+        # Quick snapshots are frequent and machine-read; keep them compact.
+        self._queue_snapshot_save(snap_path, snap, indent=False)
+
+    def _queue_snapshot_save(self, path: Path, snap, indent: bool = True) -> None:
+        self._snap_futures.append((path, save_snapshot_async(path, snap, indent=indent)))
+
+    def _poll_snapshot_saves(self, wait: bool = False) -> None:
+        pending: List[Tuple[Path, Future]] = []
+        saved = False
+        for path, fut in self._snap_futures:
+            if not wait and not fut.done():
+                pending.append((path, fut))
+                continue
+            try:
+                fut.result()
+            except Exception:
+                self._record_error("Snapshot save failed", traceback.format_exc(), pause=False)
+            else:
+                saved = True
+                print(f"Saved snapshot {path}")
+        self._snap_futures = pending
+        if saved:
+            self._sync_snapshot_menu()
 
     def _load_snapshot(self) -> None:
         if not self.scenario_name or not self.sim:
             return
+        # Make sure a just-queued quick snapshot is on disk before listing.
+        self._poll_snapshot_saves(wait=True)
         snaps = self._list_snapshots(limit=1)
         if not snaps:
             print("No snapshots found")
@@ -1475,12 +1760,12 @@ class RunnerApp:
             return
         path = path.with_suffix(".json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        save_snapshot(path, self.sim.snapshot())
-        print(f"Saved snapshot {path}")
+        self._queue_snapshot_save(path, self.sim.snapshot(), indent=True)
 
     def _load_snapshot_from_path(self, path: Path) -> None:
         if not self.sim:
             return
+        self._poll_snapshot_saves(wait=True)
         if not path.exists():
             print(f"Snapshot not found: {path}")
             return
@@ -1628,8 +1913,8 @@ class RunnerApp:
 
     def _toggle_device_help(self) -> None:
         self.show_device_help = not self.show_device_help
+        self._mark_content_dirty("devices")
         self.status_text = "Device tips on" if self.show_device_help else "Device tips off"
-        self._refresh_hover_menu()
 
     def _current_controller_module(self) -> Optional[str]:
         if self.sim and self.sim.robot_cfg:
@@ -1668,8 +1953,36 @@ class RunnerApp:
                 pass
         self._refresh_hover_menu()
 
+    def _sync_hover_menu_labels(self) -> None:
+        """Update the state-dependent menu labels without rebuilding the whole menu."""
+        labels = getattr(self, "_hover_labels", None)
+        if not labels:
+            return
+        labels["play"]["label"] = "Play" if not self.playing else "Pause"
+        labels["speed"]["label"] = f"Speed {self.playback_rate:.2f}x"
+        labels["help"]["label"] = "Open help overlay" if not self.help_open else "Close help overlay"
+
+    def _recent_snapshot_entries(self) -> List[Dict[str, object]]:
+        snapshots = self._list_snapshots(limit=6)
+        entries: List[Dict[str, object]] = []
+        if snapshots:
+            latest = snapshots[-1]
+            entries.append({"label": f"Latest ({latest.name})", "action": lambda p=latest: self._load_snapshot_from_path(p)})
+            for snap in reversed(snapshots):
+                entries.append({"label": snap.name, "action": lambda p=snap: self._load_snapshot_from_path(p)})
+        else:
+            entries.append({"label": "No recent snapshots", "action": lambda: None})
+        return entries
+
+    def _sync_snapshot_menu(self) -> None:
+        """Rebuild only the Run > Resume from snapshot list (e.g. once a queued save lands)."""
+        entries = getattr(self, "_resume_entries", None)
+        if entries is None:
+            return
+        entries[1:] = self._recent_snapshot_entries()
+
     def _refresh_hover_menu(self) -> None:
-        font = pygame.font.Font(pygame.font.get_default_font(), 14)
+        font = self._font(14)
 
         def panel_toggle(pid: str, title: str) -> Dict[str, object]:
             return {
@@ -1696,18 +2009,6 @@ class RunnerApp:
             {"label": "Quick snapshot", "action": self._save_snapshot},
             {"label": "Save snapshot as...", "action": lambda: self._open_snapshot_dialog("save")},
         ]
-        snapshots = self._list_snapshots(limit=6)
-        recent_snapshot_entries: List[Dict[str, object]] = []
-        if snapshots:
-            latest = snapshots[-1]
-            recent_snapshot_entries.append(
-                {"label": f"Latest ({latest.name})", "action": lambda p=latest: self._load_snapshot_from_path(p)}
-            )
-            for snap in reversed(snapshots):
-                recent_snapshot_entries.append({"label": snap.name, "action": lambda p=snap: self._load_snapshot_from_path(p)})
-        else:
-            recent_snapshot_entries.append({"label": "No recent snapshots", "action": lambda: None})
-
         logger_entries = [
             {"label": "Start/Stop logging", "action": self._toggle_logging},
             {"label": "Export log", "action": self._export_logger},
@@ -1744,8 +2045,18 @@ class RunnerApp:
             {"label": "Logging", "children": logger_entries},
         ]
 
+        # Kept so _sync_snapshot_menu can refresh the recent list in place after a save.
         resume_entries: List[Dict[str, object]] = [{"label": "Load snapshot from file", "action": lambda: self._open_snapshot_dialog("load")}]
-        resume_entries.extend(recent_snapshot_entries)
+        resume_entries.extend(self._recent_snapshot_entries())
+        self._resume_entries = resume_entries
+
+        # Entries whose label tracks live state; _sync_hover_menu_labels edits these in place.
+        self._hover_labels = {
+            "play": {"label": "", "action": self._toggle_play},
+            "speed": {"label": "", "children": speed_entries},
+            "help": {"label": "", "action": self._toggle_help_overlay},
+        }
+        self._sync_hover_menu_labels()
 
         self.hover_menu = HoverMenu(
             [
@@ -1757,9 +2068,9 @@ class RunnerApp:
                 (
                     "Run",
                     [
-                        {"label": "Play" if not self.playing else "Pause", "action": self._toggle_play},
+                        self._hover_labels["play"],
                         {"label": "Step", "action": self._step_once},
-                        {"label": f"Speed {self.playback_rate:.2f}x", "children": speed_entries},
+                        self._hover_labels["speed"],
                         {"label": "Resume from snapshot", "children": resume_entries},
                     ],
                 ),
@@ -1803,7 +2114,7 @@ class RunnerApp:
                 (
                     "Help",
                     [
-                        {"label": "Open help overlay" if not self.help_open else "Close help overlay", "action": self._toggle_help_overlay},
+                        self._hover_labels["help"],
                         {
                             "label": "Device tips",
                             "action": self._toggle_device_help,
@@ -1829,9 +2140,9 @@ class RunnerApp:
         outer = pygame.Rect(40, 40, max(400, w - 80), max(320, h - 80))
         nav_w = 220
         padding = 12
-        font_title = pygame.font.Font(pygame.font.get_default_font(), 18)
-        font_nav = pygame.font.Font(pygame.font.get_default_font(), 15)
-        font_body = pygame.font.Font(pygame.font.get_default_font(), 14)
+        font_title = self._font(18)
+        font_nav = self._font(15)
+        font_body = self._font(14)
         pygame.draw.rect(self.window_surface, (18, 20, 26), outer)
         pygame.draw.rect(self.window_surface, (90, 110, 140), outer, 2)
         nav_rect = pygame.Rect(outer.x + padding, outer.y + padding + 34, nav_w - padding * 2, outer.height - padding * 2 - 42)
@@ -1871,7 +2182,8 @@ class RunnerApp:
         # Footer
         footer = font_body.render("Topics snapshotted for deterministic help", True, (150, 170, 190))
         self.window_surface.blit(footer, (outer.x + padding, outer.bottom - padding - 16))
-    def _draw(self) -> None:
+    def _draw(self, dirty: Optional[List[pygame.Rect]] = None) -> None:
+        """Render the frame; present only `dirty` (plus queued rects) when given."""
         self.window_surface.fill((18, 18, 18))
         pygame.draw.rect(self.window_surface, (10, 10, 10), self.viewport_rect)
         pygame.draw.rect(self.window_surface, (80, 80, 80), self.viewport_rect, 1)
@@ -1887,7 +2199,7 @@ class RunnerApp:
             overlay_rect = pygame.Rect(self.viewport_rect.x + 12, self.viewport_rect.y + 12, 280, 60)
             pygame.draw.rect(self.window_surface, (60, 30, 30), overlay_rect)
             pygame.draw.rect(self.window_surface, (160, 80, 80), overlay_rect, 1)
-            font_small = pygame.font.Font(pygame.font.get_default_font(), 14)
+            font_small = self._font(14)
             self.window_surface.blit(
                 font_small.render("Paused due to errors.", True, (240, 180, 180)),
                 (overlay_rect.x + 8, overlay_rect.y + 8),
@@ -1896,47 +2208,105 @@ class RunnerApp:
                 font_small.render("Open the Logs panel to inspect.", True, (220, 200, 200)),
                 (overlay_rect.x + 8, overlay_rect.y + 30),
             )
-        visible_panels = [item for item in self.dock_items.values() if item.visible]
-        ordered = sorted(visible_panels, key=lambda d: (0 if d.dock != "floating" else 1, d.z))
-        for item in ordered:
+        if self._panels_dirty:
+            visible_panels = [item for item in self.dock_items.values() if item.visible]
+            self._ordered_panels = sorted(visible_panels, key=lambda d: (0 if d.dock != "floating" else 1, d.z))
+            self._panels_dirty = False
+        for item in self._ordered_panels:
             self._render_panel(item)
         self.manager.draw_ui(self.window_surface)
         if self.hover_menu:
             self.hover_menu.draw(self.window_surface)
-        font = pygame.font.Font(pygame.font.get_default_font(), 16)
+        font = self._font(16)
         status = f"Scenario: {self.scenario_name or '<none>'} | Scale: {self.scale:.1f} | Offset: ({self.offset[0]:.2f},{self.offset[1]:.2f})"
-        status_surf = font.render(status, True, (220, 220, 220))
+        # Both lines are usually unchanged between frames; only re-rasterize when the string differs.
+        status_surf = self._cached_text("status", font, status, (220, 220, 220))
         self.window_surface.blit(status_surf, (20, self.window_size[1] - 44))
-        hint_surf = font.render(self.status_text, True, (190, 210, 230))
+        hint_surf = self._cached_text("status_hint", font, self.status_text, (190, 210, 230))
         self.window_surface.blit(hint_surf, (20, self.window_size[1] - 24))
         self._draw_help_overlay()
-        pygame.display.update()
+        if dirty is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._coalesce_rects(dirty + self._dirty_rects))
 
     def _render_panel(self, item: DockItem) -> None:
-        rect = item.rect
-        header_rect = self._panel_header_rect(item)
         inner_rect = self.panel_inner_rects.get(item.id, self._panel_inner_rect(item))
+        # Resize handles stick out half a handle past the panel edge, hence the 7px pad.
+        self.window_surface.blit(self._panel_chrome(item), (item.rect.x - 7, item.rect.y - 7))
+        if inner_rect.width > 0 and inner_rect.height > 0:
+            self._draw_panel_content(item.id, inner_rect)
+
+    def _panel_chrome(self, item: DockItem) -> pygame.Surface:
+        """Panel frame, header, close box and resize handles, cached until size/dock/title change."""
+        key = (item.rect.size, item.dock, item.title, self.panel_header_h)
+        cached = self._chrome_cache.get(item.id)
+        if cached and cached[0] == key:
+            return cached[1]
+        w, h = item.rect.size
+        surface = pygame.Surface((w + 14, h + 14), pygame.SRCALPHA)
+        local = DockItem(item.id, item.title, pygame.Rect(7, 7, w, h), item.dock)
+        rect = local.rect
+        header_rect = self._panel_header_rect(local)
+        close_rect = self._panel_close_rect(local)
         panel_radius = 8
-        pygame.draw.rect(self.window_surface, (24, 28, 32), rect, border_radius=panel_radius)
-        pygame.draw.rect(self.window_surface, (90, 110, 130), rect, 1, border_radius=panel_radius)
-        pygame.draw.rect(self.window_surface, (36, 42, 50), header_rect, border_radius=panel_radius)
-        pygame.draw.rect(self.window_surface, (110, 130, 150), header_rect, 1, border_radius=panel_radius)
-        font = pygame.font.Font(pygame.font.get_default_font(), 14)
-        self.window_surface.blit(font.render(item.title, True, (210, 220, 230)), (header_rect.x + 8, header_rect.y + 5))
+        pygame.draw.rect(surface, (24, 28, 32), rect, border_radius=panel_radius)
+        pygame.draw.rect(surface, (90, 110, 130), rect, 1, border_radius=panel_radius)
+        pygame.draw.rect(surface, (36, 42, 50), header_rect, border_radius=panel_radius)
+        pygame.draw.rect(surface, (110, 130, 150), header_rect, 1, border_radius=panel_radius)
+        pygame.draw.rect(surface, (70, 50, 50), close_rect, border_radius=4)
+        pygame.draw.rect(surface, (140, 110, 110), close_rect, 1, border_radius=4)
+        for _, hrect in self._panel_resize_handles(local):
+            pygame.draw.rect(surface, (50, 60, 70), hrect, border_radius=4)
+            pygame.draw.rect(surface, (120, 140, 160), hrect, 1, border_radius=4)
+        font = self._font(14)
+        surface.blit(font.render(item.title, True, (210, 220, 230)), (header_rect.x + 8, header_rect.y + 5))
         dock_label = {"left": "L", "right": "R", "bottom": "B", "floating": "F"}.get(item.dock, "")
         if dock_label:
-            self.window_surface.blit(font.render(dock_label, True, (160, 190, 210)), (header_rect.right - 60, header_rect.y + 5))
-        close_rect = self._panel_close_rect(item)
-        pygame.draw.rect(self.window_surface, (70, 50, 50), close_rect, border_radius=4)
-        pygame.draw.rect(self.window_surface, (140, 110, 110), close_rect, 1, border_radius=4)
-        self.window_surface.blit(font.render("×", True, (240, 200, 200)), (close_rect.x + 5, close_rect.y + 2))
-        for _, hrect in self._panel_resize_handles(item):
-            pygame.draw.rect(self.window_surface, (50, 60, 70), hrect, border_radius=4)
-            pygame.draw.rect(self.window_surface, (120, 140, 160), hrect, 1, border_radius=4)
-        if inner_rect.width > 0 and inner_rect.height > 0:
-            self._draw_panel_content(item.id, inner_rect)
+            surface.blit(font.render(dock_label, True, (160, 190, 210)), (header_rect.right - 60, header_rect.y + 5))
+        surface.blit(font.render("×", True, (240, 200, 200)), (close_rect.x + 5, close_rect.y + 2))
+        self._chrome_cache[item.id] = (key, surface)
+        return surface
+
+    def _mark_content_dirty(self, *panel_ids: str) -> None:
+        for pid in panel_ids or self._CACHED_PANELS:
+            item = self.dock_items.get(pid)
+            if item:
+                item.content_dirty = True
+
+    def _draw_cached_panel_content(self, item: DockItem, inner_rect: pygame.Rect) -> None:
+        surf = item.content_surf
+        if surf is None or surf.get_size() != inner_rect.size:
+            surf = item.content_surf = pygame.Surface(inner_rect.size, pygame.SRCALPHA)
+            item.content_dirty = True
+        now = pygame.time.get_ticks()
+        if item.id == "state" and now - item.content_ms >= self._LIVE_PANEL_REFRESH_MS:
+            item.content_dirty = True
+        if item.content_dirty:
+            surf.fill((0, 0, 0, 0))
+            target = self.window_surface
+            self.window_surface = surf
+            try:
+                self._draw_panel_body(item.id, surf.get_rect())
+            finally:
+                self.window_surface = target
+            item.content_dirty = False
+            item.content_ms = now
+            if item.id == "state":
+                self._signal_hitboxes_local = self.signal_hitboxes
+        if item.id == "state":
+            ox, oy = inner_rect.topleft
+            self.signal_hitboxes = {k: r.move(ox, oy) for k, r in self._signal_hitboxes_local.items()}
+        self.window_surface.blit(surf, inner_rect.topleft)
 
     def _draw_panel_content(self, panel_id: str, inner_rect: pygame.Rect) -> None:
+        item = self.dock_items.get(panel_id)
+        if item and panel_id in self._CACHED_PANELS:
+            self._draw_cached_panel_content(item, inner_rect)
+        else:
+            self._draw_panel_body(panel_id, inner_rect)
+
+    def _draw_panel_body(self, panel_id: str, inner_rect: pygame.Rect) -> None:
         if panel_id == "code":
             self.editor.rect = inner_rect
             self.editor.draw(self.window_surface)
@@ -1951,39 +2321,67 @@ class RunnerApp:
         elif panel_id == "plot":
             self._draw_plot_panel(inner_rect)
 
-    def _draw_grid(self) -> None:
-        min_x, min_y = screen_to_world(self.viewport_rect.bottomleft, self.viewport_rect, self.scale, self.offset)
-        max_x, max_y = screen_to_world(self.viewport_rect.topright, self.viewport_rect, self.scale, self.offset)
-        min_x, max_x = sorted([min_x, max_x])
-        min_y, max_y = sorted([min_y, max_y])
-        spacing = 0.25
+    def _grid_spacing(self) -> float:
         if self.scale > 600:
-            spacing = 0.1
-        elif self.scale < 150:
-            spacing = 0.5
-        start_x = math.floor(min_x / spacing) * spacing
-        start_y = math.floor(min_y / spacing) * spacing
-        end_x = math.ceil(max_x / spacing) * spacing
-        end_y = math.ceil(max_y / spacing) * spacing
+            return 0.1
+        if self.scale < 150:
+            return 0.5
+        return 0.25
+
+    def _draw_grid(self) -> None:
+        # The grid is periodic, so one oversized tile per zoom level serves every pan offset.
+        spacing = self._grid_spacing()
+        period = spacing * self.scale
+        key = (self.scale, spacing, self.viewport_rect.size)
+        if self._grid_cache is None or self._grid_cache_key != key:
+            self._grid_cache = self._render_grid_surface(period)
+            self._grid_cache_key = key
+        w, h = self.viewport_rect.size
+        phase_x = (w // 2 + self.offset[0] * self.scale) % period
+        phase_y = (h // 2 - self.offset[1] * self.scale) % period
+        area = pygame.Rect(int(-phase_x % period), int(-phase_y % period), w, h)
+        self.window_surface.blit(self._grid_cache, self.viewport_rect.topleft, area)
+
+    def _render_grid_surface(self, period: float) -> pygame.Surface:
+        """Rasterize one viewport plus one grid period of lines into a colorkeyed surface."""
+        w, h = self.viewport_rect.size
+        pad = int(math.ceil(period)) + 1
+        surface = pygame.Surface((w + pad, h + pad))
+        surface.fill((0, 0, 0))
+        surface.set_colorkey((0, 0, 0))
         color = (28, 32, 36)
-        for x in frange(start_x, end_x + spacing, spacing):
-            p1 = world_to_screen((x, min_y), self.viewport_rect, self.scale, self.offset)
-            p2 = world_to_screen((x, max_y), self.viewport_rect, self.scale, self.offset)
-            pygame.draw.line(self.window_surface, color, p1, p2, 1)
-        for y in frange(start_y, end_y + spacing, spacing):
-            p1 = world_to_screen((min_x, y), self.viewport_rect, self.scale, self.offset)
-            p2 = world_to_screen((max_x, y), self.viewport_rect, self.scale, self.offset)
-            pygame.draw.line(self.window_surface, color, p1, p2, 1)
+        width, height = w + pad, h + pad
+        # One zigzag polyline per axis. The connecting runs land on the u=0 grid line or
+        # just past the far edge (clipped), so they add no visible pixels.
+        vertical: List[Tuple[int, int]] = []
+        horizontal: List[Tuple[int, int]] = []
+        j = 0
+        while True:
+            u = int(j * period)
+            if u > width and u > height:
+                break
+            if u <= width:
+                ends = ((u, 0), (u, height)) if j % 2 == 0 else ((u, height), (u, 0))
+                vertical.extend(ends)
+            if u <= height:
+                ends = ((0, u), (width, u)) if j % 2 == 0 else ((width, u), (0, u))
+                horizontal.extend(ends)
+            j += 1
+        for points in (vertical, horizontal):
+            if len(points) >= 2:
+                pygame.draw.lines(surface, color, False, points, 1)
+        return surface
 
     def _draw_devices_panel(self, rect: pygame.Rect) -> None:
         pygame.draw.rect(self.window_surface, (24, 28, 32), rect, border_radius=8)
         pygame.draw.rect(self.window_surface, (90, 110, 140), rect, 1, border_radius=8)
-        header = pygame.font.SysFont(pygame.font.get_default_font(), 18, bold=True)
-        section = pygame.font.SysFont(pygame.font.get_default_font(), 15, bold=True)
-        body = pygame.font.Font(pygame.font.get_default_font(), 14)
-        mono = pygame.font.SysFont("Menlo", 14) or body
+        header = self._font(18, pygame.font.get_default_font(), bold=True)
+        section = self._font(15, pygame.font.get_default_font(), bold=True)
+        body = self._font(14)
+        mono = self._font(14, "Menlo")
+        texts: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
 
-        self.window_surface.blit(header.render("Available devices", True, (200, 220, 240)), (rect.x + 10, rect.y + 8))
+        texts.append((header.render("Available devices", True, (200, 220, 240)), (rect.x + 10, rect.y + 8)))
         y = rect.y + 38
 
         motors_list: List[str] = []
@@ -1998,15 +2396,15 @@ class RunnerApp:
 
         def draw_list(title: str, items: List[str]) -> None:
             nonlocal y
-            self.window_surface.blit(section.render(title, True, (190, 205, 230)), (rect.x + 10, y))
+            texts.append((section.render(title, True, (190, 205, 230)), (rect.x + 10, y)))
             y += 22
             if not items:
-                self.window_surface.blit(body.render("• none detected", True, (180, 185, 190)), (rect.x + 18, y))
+                texts.append((body.render("• none detected", True, (180, 185, 190)), (rect.x + 18, y)))
                 y += 20
                 return
             for idx, item in enumerate(items, 1):
                 text = f"{idx}. {item}"
-                self.window_surface.blit(body.render(text, True, (210, 215, 225)), (rect.x + 16, y))
+                texts.append((self._cached_text(f"dev:{title}:{idx}", body, text, (210, 215, 225)), (rect.x + 16, y)))
                 y += 18
             y += 10
 
@@ -2014,9 +2412,10 @@ class RunnerApp:
         draw_list("Sensors", sensors_list)
 
         if not self.show_device_help:
+            blit_batch(self.window_surface, texts)
             return
 
-        self.window_surface.blit(section.render("Controller hints", True, (190, 205, 230)), (rect.x + 10, y))
+        texts.append((section.render("Controller hints", True, (190, 205, 230)), (rect.x + 10, y)))
         y += 22
         examples = [
             "Command: sim.motors['left'].command(0.5, sim, dt)",
@@ -2024,7 +2423,7 @@ class RunnerApp:
             "Encoders: sensors['enc'].value",
         ]
         for line in examples:
-            self.window_surface.blit(mono.render(line, True, (205, 220, 235)), (rect.x + 16, y))
+            texts.append((mono.render(line, True, (205, 220, 235)), (rect.x + 16, y)))
             y += 18
         y += 6
         tips = [
@@ -2032,37 +2431,40 @@ class RunnerApp:
             "Hover menu holds view and snapshot toggles.",
         ]
         for line in tips:
-            self.window_surface.blit(body.render(f"• {line}", True, (190, 205, 215)), (rect.x + 16, y))
+            texts.append((body.render(f"• {line}", True, (190, 205, 215)), (rect.x + 16, y)))
             y += 18
+        blit_batch(self.window_surface, texts)
 
     def _draw_state_panel(self, rect: pygame.Rect) -> None:
         pygame.draw.rect(self.window_surface, (22, 24, 28), rect, border_radius=8)
         pygame.draw.rect(self.window_surface, (70, 90, 120), rect, 1, border_radius=8)
-        font = pygame.font.Font(pygame.font.get_default_font(), 16)
-        small = pygame.font.Font(pygame.font.get_default_font(), 14)
+        font = self._font(16)
+        small = self._font(14)
         self.signal_hitboxes = {}
-        self.window_surface.blit(font.render("Live state + logger", True, (190, 210, 230)), (rect.x + 8, rect.y + 6))
+        # Text never overlaps the checkbox shapes, so collect it and blit once at the end.
+        texts: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        texts.append((font.render("Live state + logger", True, (190, 210, 230)), (rect.x + 8, rect.y + 6)))
         control_rows = 2 * 28
         y = rect.y + control_rows
         logger_line = f"{self.logger_status} | samples: {len(self.logger_samples)} | rate: {1.0/self.logger_interval:.1f} Hz"
-        self.window_surface.blit(small.render(logger_line, True, (200, 210, 220)), (rect.x + 8, y))
+        texts.append((self._cached_text("logger", small, logger_line, (200, 210, 220)), (rect.x + 8, y)))
         y += 20
-        self.window_surface.blit(small.render("Use Capture menu to start/stop and export logs.", True, (170, 190, 210)), (rect.x + 8, y))
+        texts.append((small.render("Use Capture menu to start/stop and export logs.", True, (170, 190, 210)), (rect.x + 8, y)))
         y += 20
-        self.window_surface.blit(small.render("Live signals:", True, (180, 200, 220)), (rect.x + 8, y))
+        texts.append((small.render("Live signals:", True, (180, 200, 220)), (rect.x + 8, y)))
         y += 18
         motors = self.live_state.get("motors", {})
         sensors = self.live_state.get("sensors", {})
         for name, val in motors.items():
             line = f"motor {name}: {self._fmt_value(val)}"
-            self.window_surface.blit(small.render(line, True, (180, 220, 180)), (rect.x + 16, y))
+            texts.append((self._cached_text(f"motor:{name}", small, line, (180, 220, 180)), (rect.x + 16, y)))
             y += 16
         for name, val in sensors.items():
             line = f"sensor {name}: {self._fmt_value(val)}"
-            self.window_surface.blit(small.render(line, True, (200, 200, 180)), (rect.x + 16, y))
+            texts.append((self._cached_text(f"sensor:{name}", small, line, (200, 200, 180)), (rect.x + 16, y)))
             y += 16
         y = max(y + 10, rect.y + 140)
-        self.window_surface.blit(small.render("Signals to log (click to toggle):", True, (170, 200, 220)), (rect.x + 8, y))
+        texts.append((small.render("Signals to log (click to toggle):", True, (170, 200, 220)), (rect.x + 8, y)))
         y += 18
         box_x = rect.x + 12
         box_w = rect.width - 24
@@ -2071,8 +2473,8 @@ class RunnerApp:
             pygame.draw.rect(self.window_surface, (60, 70, 80), box, 1)
             if enabled:
                 pygame.draw.rect(self.window_surface, (80, 200, 140), box.inflate(-4, -4))
-            text = small.render(label, True, (210, 220, 230))
-            self.window_surface.blit(text, (box.right + 6, y_pos - 2))
+            text = self._cached_text(f"sig:{label}", small, label, (210, 220, 230))
+            texts.append((text, (box.right + 6, y_pos - 2)))
             self.signal_hitboxes[label] = pygame.Rect(box)
         for name in motors.keys():
             draw_sig(f"motor:{name}", f"motor:{name}" in self.logger_selected, y)
@@ -2080,6 +2482,7 @@ class RunnerApp:
         for name in sensors.keys():
             draw_sig(f"sensor:{name}", f"sensor:{name}" in self.logger_selected, y)
             y += 20
+        blit_batch(self.window_surface, texts)
 
     def _panel_menu_options(self) -> List[Tuple[str, str]]:
         return [
@@ -2100,15 +2503,15 @@ class RunnerApp:
             return True
         if not self.panel_menu_open:
             return False
-        for pid, rect in self.panel_menu_regions.items():
-            if rect.collidepoint(event.pos):
-                item = self.dock_items.get(pid)
-                if item:
-                    item.visible = not item.visible
-                    self._bump_panel(pid)
-                    self._update_layout()
-                    self._save_panel_layout()
-                return True
+        pid = self._hit_region(self.panel_menu_regions, event.pos)
+        if pid is not None:
+            item = self.dock_items.get(pid)
+            if item:
+                item.visible = not item.visible
+                self._bump_panel(pid)
+                self._update_layout()
+                self._layout_dirty = True
+            return True
         # Close if clicked outside menu
         self.panel_menu_open = False
         return False
@@ -2117,7 +2520,7 @@ class RunnerApp:
         btn_rect = self._panel_menu_rect()
         pygame.draw.rect(self.window_surface, (30, 34, 38), btn_rect)
         pygame.draw.rect(self.window_surface, (90, 110, 130), btn_rect, 1)
-        font = pygame.font.Font(pygame.font.get_default_font(), 14)
+        font = self._font(14)
         label = "Panels ▼" if not self.panel_menu_open else "Panels ▲"
         self.window_surface.blit(font.render(label, True, (200, 210, 220)), (btn_rect.x + 8, btn_rect.y + 6))
         if not self.panel_menu_open:
@@ -2144,8 +2547,8 @@ class RunnerApp:
             self.panel_menu_regions[pid] = row
 
     def _draw_logs_panel(self, rect: pygame.Rect) -> None:
-        content_font = pygame.font.Font(pygame.font.get_default_font(), 14)
-        font = pygame.font.Font(pygame.font.get_default_font(), 15)
+        content_font = self._font(14)
+        font = self._font(15)
         has_error = bool(self.error_log)
         bg = (30, 22, 22) if has_error else (22, 26, 22)
         pygame.draw.rect(self.window_surface, bg, rect, border_radius=8)
@@ -2166,20 +2569,28 @@ class RunnerApp:
         latest = self.error_log[-1]
         body_lines: List[str] = []
         if latest.get("title"):
-            body_lines.extend(self._wrap_text(latest["title"], content_font, max_width))
+            title = latest["title"]
+            if latest["count"] > 1:
+                title = f"{title} (x{latest['count']})"
+            body_lines.extend(self._wrap_text(title, content_font, max_width))
         if latest.get("line"):
             body_lines.append(latest["line"])
-        detail_lines = self._wrap_text(latest.get("details", ""), content_font, max_width)
+        # Only the last 8 wrapped detail lines are shown; wrap from the end and stop once we have them.
+        detail_lines: List[str] = []
+        for raw_line in reversed(latest.get("details", "").splitlines()):
+            detail_lines[:0] = self._wrap_text(raw_line, content_font, max_width) or [""]
+            if len(detail_lines) >= 8:
+                break
         body_lines.extend(detail_lines[-8:])
         for line in body_lines:
             if y > rect.bottom - 18:
                 break
-            self.window_surface.blit(content_font.render(line, True, (230, 200, 200)), (rect.x + 8, y))
+            self._blit_text(content_font, line, (230, 200, 200), (rect.x + 8, y))
             y += 18
 
     def _draw_console_panel(self, rect: pygame.Rect) -> None:
-        content_font = pygame.font.Font(pygame.font.get_default_font(), 14)
-        font = pygame.font.Font(pygame.font.get_default_font(), 15)
+        content_font = self._font(14)
+        font = self._font(15)
         bg = (22, 26, 30)
         pygame.draw.rect(self.window_surface, bg, rect, border_radius=8)
         pygame.draw.rect(self.window_surface, (70, 90, 120), rect, 1, border_radius=8)
@@ -2187,23 +2598,25 @@ class RunnerApp:
         self.window_surface.blit(font.render(header, True, (180, 210, 240)), (rect.x + 8, rect.y + 6))
         y = rect.y + 28
         max_width = rect.width - 16
-        lines = self.console_lines[-20:] if self.console_lines else []
-        if not lines:
+        if not self.console_lines:
             self.window_surface.blit(
                 content_font.render("No prints yet.", True, (170, 190, 210)), (rect.x + 8, y)
             )
             return
-        for line in lines:
-            wrapped = self._wrap_text(line, content_font, max_width)
-            for w in wrapped:
-                if y > rect.bottom - 18:
-                    return
-                self.window_surface.blit(content_font.render(w, True, (210, 220, 230)), (rect.x + 8, y))
-                y += 18
+        # Fill the panel from the newest print upwards so lines that cannot fit are never wrapped.
+        rows = (rect.bottom - 18 - y) // 18 + 1
+        visible: List[str] = []
+        for line in reversed(self.console_lines[-20:]):
+            if len(visible) >= rows:
+                break
+            visible[:0] = self._wrap_text(line, content_font, max_width)
+        for w in visible[-rows:] if rows > 0 else []:
+            self._blit_text(content_font, w, (210, 220, 230), (rect.x + 8, y))
+            y += 18
 
     def _draw_plot_panel(self, rect: pygame.Rect) -> None:
-        font = pygame.font.Font(pygame.font.get_default_font(), 15)
-        small = pygame.font.Font(pygame.font.get_default_font(), 13)
+        font = self._font(15)
+        small = self._font(13)
         bg = (22, 26, 30)
         pygame.draw.rect(self.window_surface, bg, rect, border_radius=8)
         pygame.draw.rect(self.window_surface, (70, 90, 120), rect, 1, border_radius=8)
@@ -2324,14 +2737,14 @@ class RunnerApp:
                 (b.max_x, b.max_y),
                 (b.max_x, b.min_y),
             ]
-            pts = [world_to_screen(c, self.viewport_rect, self.scale, self.offset, rot) for c in corners]
+            pts = world_to_screen_many(corners, self.viewport_rect, self.scale, self.offset, rot)
             pygame.draw.polygon(self.window_surface, (70, 90, 120), pts, max(1, int(0.02 * self.scale)))
         strokes = getattr(self.world_cfg, "drawings", []) or []
         for stroke in strokes:
             if not getattr(stroke, "points", None) or len(stroke.points) < 2:
                 continue
             color = tuple(getattr(stroke, "color", (140, 200, 255)))
-            pts = [world_to_screen(p, self.viewport_rect, self.scale, self.offset, rot) for p in stroke.points]
+            pts = world_to_screen_many(stroke.points, self.viewport_rect, self.scale, self.offset, rot)
             width = max(1, int(max(1.0, stroke.thickness * self.scale)))
             pygame.draw.lines(self.window_surface, color, False, pts, width)
             if getattr(stroke, "kind", "mark") != "wall":
@@ -2340,15 +2753,33 @@ class RunnerApp:
 
     def _draw_world(self) -> None:
         assert self.sim
-        for body in self.sim.bodies.values():
-            color = getattr(body.material, "custom", {}).get("color", None) or (140, 140, 140)
-            if isinstance(body.shape, Polygon):
-                verts = body.shape._world_vertices(body.pose)
-                pts = [world_to_screen(v, self.viewport_rect, self.scale, self.offset) for v in verts]
-                pygame.draw.polygon(self.window_surface, color, pts, 0)
-                pygame.draw.polygon(self.window_surface, (30, 30, 30), pts, 1)
+        # Same math as world_to_screen, hoisted so each body pays for one cos/sin and no per-vertex calls.
+        scale = self.scale
+        cx = self.viewport_rect.x + self.viewport_rect.width // 2
+        cy = self.viewport_rect.y + self.viewport_rect.height // 2
+        ox, oy = self.offset
+        self.window_surface.lock()
+        try:
+            for body in self.sim.bodies.values():
+                color = getattr(body.material, "custom", {}).get("color", None) or (140, 140, 140)
+                if isinstance(body.shape, Polygon):
+                    pose = body.pose
+                    cos_t = math.cos(pose.theta)
+                    sin_t = math.sin(pose.theta)
+                    bx, by = pose.x, pose.y
+                    pts = [
+                        (
+                            int(cx + (bx + cos_t * px - sin_t * py + ox) * scale),
+                            int(cy - (by + sin_t * px + cos_t * py + oy) * scale),
+                        )
+                        for px, py in body.shape.vertices
+                    ]
+                    pygame.draw.polygon(self.window_surface, color, pts, 0)
+                    pygame.draw.polygon(self.window_surface, (30, 30, 30), pts, 1)
+        finally:
+            self.window_surface.unlock()
         if self.view_options.get("path_trace", False) and self.path_trace:
-            pts = [world_to_screen(p, self.viewport_rect, self.scale, self.offset) for p in self.path_trace]
+            pts = [(int(cx + (x + ox) * scale), int(cy - (y + oy) * scale)) for x, y in self.path_trace]
             if len(pts) >= 2:
                 pygame.draw.lines(self.window_surface, (90, 160, 230), False, pts, 2)
             else:
@@ -2381,13 +2812,14 @@ class RunnerApp:
                 if not parent:
                     continue
                 pose = parent.pose.compose(motor.mount_pose)
-                direction = (pygame.math.Vector2(1, 0).rotate_rad(pose.theta).x, pygame.math.Vector2(1, 0).rotate_rad(pose.theta).y)
+                dir_x = math.cos(pose.theta)
+                dir_y = math.sin(pose.theta)
                 sign = 1 if motor.last_command >= 0 else -1
                 length = 0.06 + abs(motor.last_command) * 0.09
-                start_world = (pose.x + direction[0] * 0.02 * sign, pose.y + direction[1] * 0.02 * sign)
-                end_world = (pose.x + direction[0] * (length + 0.02) * sign, pose.y + direction[1] * (length + 0.02) * sign)
-                start = world_to_screen(start_world, self.viewport_rect, self.scale, self.offset)
-                end = world_to_screen(end_world, self.viewport_rect, self.scale, self.offset)
+                start_world = (pose.x + dir_x * 0.02 * sign, pose.y + dir_y * 0.02 * sign)
+                end_world = (pose.x + dir_x * (length + 0.02) * sign, pose.y + dir_y * (length + 0.02) * sign)
+                start = (int(cx + (start_world[0] + ox) * scale), int(cy - (start_world[1] + oy) * scale))
+                end = (int(cx + (end_world[0] + ox) * scale), int(cy - (end_world[1] + oy) * scale))
                 color = (0, 200, 120) if motor.last_command >= 0 else (200, 80, 80)
                 wheel_radius = max(3, int(self.scale * 0.01))
                 pygame.draw.circle(self.window_surface, (28, 34, 42), start, wheel_radius)
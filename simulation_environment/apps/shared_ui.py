@@ -45,6 +45,28 @@ def world_to_screen(
     return (int(cx + x * scale), int(cy - y * scale))
 
 
+def world_to_screen_many(
+    points: Iterable[Tuple[float, float]],
+    viewport: pygame.Rect,
+    scale: float,
+    offset: Tuple[float, float],
+    rotation: float = 0.0,
+) -> List[Tuple[int, int]]:
+    """world_to_screen over a whole point list with the view transform computed once."""
+    ox, oy = offset
+    cx = viewport.x + viewport.width // 2
+    cy = viewport.y + viewport.height // 2
+    if not rotation:
+        return [(int(cx + (x + ox) * scale), int(cy - (y + oy) * scale)) for x, y in points]
+    cos_r = math.cos(rotation)
+    sin_r = math.sin(rotation)
+    out: List[Tuple[int, int]] = []
+    for px, py in points:
+        x, y = px + ox, py + oy
+        out.append((int(cx + (x * cos_r - y * sin_r) * scale), int(cy - (x * sin_r + y * cos_r) * scale)))
+    return out
+
+
 def screen_to_world(
     pos: Tuple[int, int],
     viewport: pygame.Rect,
@@ -64,6 +86,57 @@ def screen_to_world(
     return (x, y)
 
 
+def blit_batch(dest: pygame.Surface, seq: Sequence[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+    """Issue many (surface, pos) blits in one call; fblits on pygame-ce, blits otherwise."""
+    if hasattr(dest, "fblits"):
+        dest.fblits(seq)
+    else:
+        dest.blits(seq, doreturn=False)
+
+
+class GlyphAtlas:
+    """Printable-ASCII glyphs for one (font, color), pre-rendered into a single surface.
+
+    Drawing a string is then a batch blit of cached glyphs instead of a fresh
+    font.render() surface per call. Kerning is not applied, so this is meant for
+    small panel text that changes every frame (live values, console lines).
+    Advances are fractional (measured over a run of 64 copies), but without
+    kerning a long line can still end a few pixels off from font.render().
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int]):
+        self.font = font
+        self.color = color
+        chars = [chr(c) for c in range(32, 127)]
+        renders = [font.render(c, True, color) for c in chars]
+        width = sum(r.get_width() for r in renders)
+        height = max(r.get_height() for r in renders)
+        self.surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        self.glyphs: Dict[str, Tuple[pygame.Surface, float]] = {}
+        x = 0
+        for c, r in zip(chars, renders):
+            self.surface.blit(r, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)  # exact copy, no blending
+            glyph = self.surface.subsurface(pygame.Rect(x, 0, r.get_width(), r.get_height()))
+            self.glyphs[c] = (glyph, font.size(c * 64)[0] / 64.0)
+            x += r.get_width()
+
+    def draw(self, dest: pygame.Surface, text: str, pos: Tuple[int, int]) -> None:
+        glyphs = self.glyphs
+        x0, y = pos
+        pen = 0.0
+        seq = []
+        for c in text:
+            entry = glyphs.get(c)
+            if entry is None:
+                # Outside the atlas (unicode etc.): fall back to a normal render.
+                dest.blit(self.font.render(text, True, self.color), pos)
+                return
+            if c != " ":
+                seq.append((entry[0], (x0 + int(pen), y)))
+            pen += entry[1]
+        blit_batch(dest, seq)
+
+
 class HoverMenu:
     """Lightweight hover-to-open menu bar for pygame surfaces."""
 
@@ -18,11 +18,15 @@ from .persistence import (  # noqa: F401
     save_scenario,
     load_snapshot,
     save_snapshot,
+    save_snapshot_async,
+    save_snapshot_binary,
+    flush_snapshots,
     save_robot_design,
     load_robot_design,
     save_environment_design,
     load_environment_design,
     save_custom_asset,
     load_custom_asset,
+    reset_persistence_caches,
 )
 
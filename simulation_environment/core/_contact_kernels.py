@@ -0,0 +1,182 @@
+"""Scalar kernels for the contact and joint solvers.
+
+Plain float math only, so they compile under Numba when it is installed and run
+as ordinary Python otherwise. Arithmetic order matches the original inline code,
+which keeps results bit-identical between the two paths.
+"""
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+try:  # optional: compile the per-pair math to native code
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def contact_correction(penetration: float, inv_mass_sum: float, percent: float, slop: float, max_correction: float) -> float:
+    """Baumgarte-style positional correction magnitude (may be non-finite; callers check)."""
+    correction_mag = max(penetration - slop, 0.0) * percent / inv_mass_sum
+    return min(correction_mag, max_correction)
+
+
+@njit(cache=True)
+def contact_impulse(
+    nx: float,
+    ny: float,
+    vax: float,
+    vay: float,
+    vbx: float,
+    vby: float,
+    inv_mass_a: float,
+    inv_mass_b: float,
+    inv_mass_sum: float,
+    restitution: float,
+    mu: float,
+) -> Tuple[int, float, float, float, float, float, float]:
+    """Restitution + Coulomb friction impulses for one contact (normal points from A to B).
+
+    Returns ``(stage, vax, vay, vbx, vby, jn, jt)``: stage 0 means no change (separating
+    or invalid), 1 means only the normal impulse ``jn`` applied, 2 means both impulses
+    applied. A zero inverse mass marks a static body whose velocity is left untouched.
+    """
+    rvx = vax - vbx
+    rvy = vay - vby
+    vel_along_normal = rvx * nx + rvy * ny
+    if vel_along_normal > 0 or not math.isfinite(vel_along_normal):
+        return 0, vax, vay, vbx, vby, 0.0, 0.0
+    j = -(1 + restitution) * vel_along_normal
+    j /= inv_mass_sum
+    if not math.isfinite(j):
+        return 0, vax, vay, vbx, vby, 0.0, 0.0
+    ix = j * nx
+    iy = j * ny
+    if inv_mass_a != 0.0:
+        vax = vax - inv_mass_a * ix
+        vay = vay - inv_mass_a * iy
+    if inv_mass_b != 0.0:
+        vbx = vbx + inv_mass_b * ix
+        vby = vby + inv_mass_b * iy
+    # friction (Coulomb)
+    rvx = vax - vbx
+    rvy = vay - vby
+    tx = -ny
+    ty = nx
+    vt = rvx * tx + rvy * ty
+    jt = -vt / inv_mass_sum
+    if not math.isfinite(jt):
+        return 1, vax, vay, vbx, vby, j, 0.0
+    jt_limit = mu * abs(j)
+    jt = max(-jt_limit, min(jt_limit, jt))
+    tix = jt * tx
+    tiy = jt * ty
+    if inv_mass_a != 0.0:
+        vax = vax - inv_mass_a * tix
+        vay = vay - inv_mass_a * tiy
+    if inv_mass_b != 0.0:
+        vbx = vbx + inv_mass_b * tix
+        vby = vby + inv_mass_b * tiy
+    return 2, vax, vay, vbx, vby, j, jt
+
+
+@njit(cache=True)
+def contact_apply_impulse(
+    nx: float,
+    ny: float,
+    vax: float,
+    vay: float,
+    vbx: float,
+    vby: float,
+    inv_mass_a: float,
+    inv_mass_b: float,
+    jn: float,
+    jt: float,
+) -> Tuple[float, float, float, float]:
+    """Apply normal/tangent impulses ``jn``/``jt`` (e.g. a warm start) along the current contact frame."""
+    px = jn * nx - jt * ny
+    py = jn * ny + jt * nx
+    if inv_mass_a != 0.0:
+        vax = vax - inv_mass_a * px
+        vay = vay - inv_mass_a * py
+    if inv_mass_b != 0.0:
+        vbx = vbx + inv_mass_b * px
+        vby = vby + inv_mass_b * py
+    return vax, vay, vbx, vby
+
+
+@njit(cache=True)
+def contact_warm_impulse(
+    nx: float,
+    ny: float,
+    vax: float,
+    vay: float,
+    vbx: float,
+    vby: float,
+    inv_mass_a: float,
+    inv_mass_b: float,
+    inv_mass_sum: float,
+    mu: float,
+    prev_jn: float,
+    prev_jt: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """Accumulated impulses for a persistent contact warm-started with ``(prev_jn, prev_jt)``.
+
+    Applies last step's impulses, then only the change to the clamped totals: the
+    normal total stays >= 0 (it can push the bodies apart, never pull them together)
+    and the tangent total within ``mu`` times it. The normal target is zero approach
+    speed, with no restitution bias on a resting contact, so re-applying the cache
+    never adds energy. With the normal pointing from A to B, ``(va - vb) . n > 0`` is
+    approach and a positive ``jn`` moves A along -n and B along +n.
+    Returns ``(vax, vay, vbx, vby, jn_total, jt_total)``; a zero normal total means the
+    cached impulse was fully withdrawn.
+    """
+    wax, way, wbx, wby = contact_apply_impulse(nx, ny, vax, vay, vbx, vby, inv_mass_a, inv_mass_b, prev_jn, prev_jt)
+    approach = (wax - wbx) * nx + (way - wby) * ny
+    jn = max(prev_jn + approach / inv_mass_sum, 0.0)
+    if not math.isfinite(jn):
+        return vax, vay, vbx, vby, 0.0, 0.0
+    wax, way, wbx, wby = contact_apply_impulse(nx, ny, wax, way, wbx, wby, inv_mass_a, inv_mass_b, jn - prev_jn, 0.0)
+    vt = (wax - wbx) * -ny + (way - wby) * nx
+    jt_limit = mu * jn
+    jt = max(-jt_limit, min(jt_limit, prev_jt + vt / inv_mass_sum))
+    if not math.isfinite(jt):
+        jt = prev_jt
+    wax, way, wbx, wby = contact_apply_impulse(nx, ny, wax, way, wbx, wby, inv_mass_a, inv_mass_b, 0.0, jt - prev_jt)
+    return wax, way, wbx, wby, jn, jt
+
+
+@njit(cache=True)
+def joint_projection(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    target: float,
+    inv_mass_a: float,
+    inv_mass_b: float,
+    compliance: float,
+    dt: float,
+) -> Tuple[float, float, float]:
+    """XPBD distance-constraint step between two anchors: ``(dlambda, nx, ny)``.
+
+    ``dlambda`` is NaN when the constraint is already satisfied or cannot be solved.
+    """
+    dx = bx - ax
+    dy = by - ay
+    dist = math.hypot(dx, dy)
+    error = dist - target
+    if abs(error) < 1e-5:
+        return math.nan, 0.0, 0.0
+    nx = dx / (dist + 1e-6)
+    ny = dy / (dist + 1e-6)
+    w = inv_mass_a + inv_mass_b
+    if w == 0:
+        return math.nan, 0.0, 0.0
+    alpha = 1.0 / (compliance + 1e-9)
+    dlambda = -(error) * alpha / (w + alpha * dt * dt)
+    return dlambda, nx, ny
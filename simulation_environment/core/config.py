@@ -1,11 +1,20 @@
 """Data models and JSON helpers for sim scenarios."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 import json
+import math
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, get_type_hints, get_origin, get_args
 
+from low_level_mechanics.world import slotted_dataclass
+
+try:  # optional: Rust JSON encoder/decoder, serializes dataclasses natively
+    import orjson
+except ImportError:
+    orjson = None
+
 PoseTuple = Tuple[float, float, float]
 Point = Tuple[float, float]
 Edge = Tuple[int, int]
@@ -23,16 +32,32 @@ class MaterialConfig:
     thickness: float = 0.02
     custom: Dict[str, object] = field(default_factory=dict)
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "color": self.color,
+            "roughness": self.roughness,
+            "friction": self.friction,
+            "traction": self.traction,
+            "restitution": self.restitution,
+            "reflect_line": self.reflect_line,
+            "reflect_distance": self.reflect_distance,
+            "thickness": self.thickness,
+            "custom": self.custom,
+        }
+
+
+@slotted_dataclass
 class StrokeConfig:
     kind: str = "mark"  # "mark" (visual) | "wall" (collision)
     thickness: float = 0.05
     points: List[Point] = field(default_factory=list)
     color: Tuple[int, int, int] = (140, 180, 240)
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"kind": self.kind, "thickness": self.thickness, "points": self.points, "color": self.color}
 
-@dataclass
+
+@slotted_dataclass
 class DesignerState:
     """Lightweight persisted UI state for the designer."""
 
@@ -42,16 +67,28 @@ class DesignerState:
     brush_thickness: float = 0.05
     shape_tool: str = "rect"  # rect | triangle | line
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "creation_context": self.creation_context,
+            "mode": self.mode,
+            "brush_kind": self.brush_kind,
+            "brush_thickness": self.brush_thickness,
+            "shape_tool": self.shape_tool,
+        }
 
-@dataclass
+
+@slotted_dataclass
 class EnvironmentBounds:
     min_x: float = -1.0
     min_y: float = -1.0
     max_x: float = 1.0
     max_y: float = 1.0
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"min_x": self.min_x, "min_y": self.min_y, "max_x": self.max_x, "max_y": self.max_y}
 
-@dataclass
+
+@slotted_dataclass
 class BodyConfig:
     name: str
     points: List[Point]
@@ -62,6 +99,18 @@ class BodyConfig:
     inertia: float = 1.0
     material: MaterialConfig = field(default_factory=MaterialConfig)
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "points": self.points,
+            "edges": self.edges,
+            "pose": self.pose,
+            "can_move": self.can_move,
+            "mass": self.mass,
+            "inertia": self.inertia,
+            "material": self.material.to_dict(),
+        }
+
 
 @dataclass
 class JointConfig:
@@ -76,6 +125,20 @@ class JointConfig:
     stiffness: float = 1000.0
     damping: float = 10.0
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "child": self.child,
+            "type": self.type,
+            "anchor_parent": self.anchor_parent,
+            "anchor_child": self.anchor_child,
+            "lower_limit": self.lower_limit,
+            "upper_limit": self.upper_limit,
+            "stiffness": self.stiffness,
+            "damping": self.damping,
+        }
+
 
 @dataclass
 class ActuatorConfig:
@@ -85,6 +148,9 @@ class ActuatorConfig:
     mount_pose: PoseTuple = (0.0, 0.0, 0.0)
     params: Dict[str, object] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"name": self.name, "type": self.type, "body": self.body, "mount_pose": self.mount_pose, "params": self.params}
+
 
 @dataclass
 class SensorConfig:
@@ -94,6 +160,9 @@ class SensorConfig:
     mount_pose: PoseTuple = (0.0, 0.0, 0.0)
     params: Dict[str, object] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"name": self.name, "type": self.type, "body": self.body, "mount_pose": self.mount_pose, "params": self.params}
+
 
 @dataclass
 class MeasurementConfig:
@@ -102,6 +171,9 @@ class MeasurementConfig:
     body: Optional[str] = None
     window: float = 5.0
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"name": self.name, "signal": self.signal, "body": self.body, "window": self.window}
+
 
 @dataclass
 class RobotConfig:
@@ -113,14 +185,28 @@ class RobotConfig:
     measurements: List[MeasurementConfig] = field(default_factory=list)
     controller_module: str = "controller"
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "spawn_pose": self.spawn_pose,
+            "bodies": [b.to_dict() for b in self.bodies],
+            "joints": [j.to_dict() for j in self.joints],
+            "actuators": [a.to_dict() for a in self.actuators],
+            "sensors": [s.to_dict() for s in self.sensors],
+            "measurements": [m.to_dict() for m in self.measurements],
+            "controller_module": self.controller_module,
+        }
 
-@dataclass
+
+@slotted_dataclass
 class WorldObjectConfig:
     name: str
     body: BodyConfig
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"name": self.name, "body": self.body.to_dict()}
 
-@dataclass
+
+@slotted_dataclass
 class CustomObjectConfig:
     """Standalone custom asset that can be placed in robot or environment."""
 
@@ -129,6 +215,9 @@ class CustomObjectConfig:
     kind: str = "custom"
     metadata: Dict[str, object] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"name": self.name, "body": self.body.to_dict(), "kind": self.kind, "metadata": self.metadata}
+
 
 @dataclass
 class WorldConfig:
@@ -144,51 +233,114 @@ class WorldConfig:
     custom_objects: List[CustomObjectConfig] = field(default_factory=list)
     designer_state: DesignerState = field(default_factory=DesignerState)
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "seed": self.seed,
+            "gravity": self.gravity,
+            "timestep": self.timestep,
+            "terrain": [t.to_dict() for t in self.terrain],
+            "metadata": self.metadata,
+            "drawings": [d.to_dict() for d in self.drawings],
+            "bounds": self.bounds.to_dict() if self.bounds is not None else None,
+            "shape_objects": [o.to_dict() for o in self.shape_objects],
+            "custom_objects": [o.to_dict() for o in self.custom_objects],
+            "designer_state": self.designer_state.to_dict(),
+        }
+
+
+@slotted_dataclass
 class SnapshotState:
     time: float
     step: int
     bodies: Dict[str, Dict[str, object]]
     controller_state: Optional[Dict[str, object]] = None
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"time": self.time, "step": self.step, "bodies": self.bodies, "controller_state": self.controller_state}
 
-def _dataclass_from_dict(cls, data: Dict) -> object:
-    field_types = get_type_hints(cls)
-    kwargs = {}
-    for key, value in data.items():
-        expected = field_types.get(key)
+
+@lru_cache(maxsize=None)
+def _field_plan(cls) -> Dict[str, Tuple[str, type]]:
+    """Per-class decode table: field -> ("list" | "optional" | "nested", dataclass type).
+
+    Resolving type hints evaluates string annotations, so do it once per class
+    instead of once per decoded object. Plain fields are left out of the table.
+    """
+    plan: Dict[str, Tuple[str, type]] = {}
+    for key, expected in get_type_hints(cls).items():
         origin = get_origin(expected)
         if origin is list:
             inner = get_args(expected)[0]
             if hasattr(inner, "__dataclass_fields__"):
-                kwargs[key] = [_dataclass_from_dict(inner, v) for v in value]
+                plan[key] = ("list", inner)
                 continue
         if origin is not None:
             args = [a for a in get_args(expected) if a is not type(None)]
             if len(args) == 1 and hasattr(args[0], "__dataclass_fields__"):
-                if value is None:
-                    kwargs[key] = None
-                else:
-                    kwargs[key] = _dataclass_from_dict(args[0], value)
-                continue
+                plan[key] = ("optional", args[0])
+            continue
         if hasattr(expected, "__dataclass_fields__"):
-            kwargs[key] = _dataclass_from_dict(expected, value)
+            plan[key] = ("nested", expected)
+    return plan
+
+
+_MISSING = object()
+
+
+def _dataclass_from_dict(cls, data: Dict) -> object:
+    plan = _field_plan(cls)
+    if not plan:
+        return cls(**data)
+    kwargs = dict(data)
+    for key, (kind, target) in plan.items():
+        value = kwargs.get(key, _MISSING)
+        if value is _MISSING or value is None and kind == "optional":
+            continue
+        if kind == "list":
+            kwargs[key] = [_dataclass_from_dict(target, item) for item in value]
         else:
-            kwargs[key] = value
+            kwargs[key] = _dataclass_from_dict(target, value)
     return cls(**kwargs)
 
 
 def load_json(path: Path, cls):
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        raw = path.read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals (written by the stdlib path) are not strict JSON.
+            data = json.loads(raw)
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
     return _dataclass_from_dict(cls, data)
 
 
+def _has_non_finite(o) -> bool:
+    if isinstance(o, float):
+        return not math.isfinite(o)
+    if isinstance(o, dict):
+        return any(_has_non_finite(v) for v in o.values())
+    if isinstance(o, (list, tuple)):
+        return any(_has_non_finite(v) for v in o)
+    return False
+
+
 def save_json(path: Path, obj) -> None:
+    """Write a config dataclass as indented JSON.
+
+    With orjson the file holds the same data as the stdlib output but not the same bytes
+    (raw UTF-8 instead of ``\\u`` escapes, ``1e16`` instead of ``1e+16``); ``load_json``
+    reads either. Data holding NaN or infinities goes through the stdlib encoder, which
+    keeps them (orjson would write ``null``).
+    """
+
     def _encode(o):
+        # Fallback for dataclasses without a hand-written to_dict(); still avoids asdict()'s deep copy.
         if hasattr(o, "__dataclass_fields__"):
-            return {k: _encode(v) for k, v in asdict(o).items()}
+            return {f.name: _encode(getattr(o, f.name)) for f in fields(o)}
         if isinstance(o, (list, tuple)):
             return [_encode(v) for v in o]
         if isinstance(o, dict):
@@ -196,6 +348,10 @@ def save_json(path: Path, obj) -> None:
         return o
 
     path.parent.mkdir(parents=True, exist_ok=True)
+    data = obj.to_dict() if hasattr(obj, "to_dict") else _encode(obj)
+    if orjson is not None and not _has_non_finite(data):
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as f:
-        json.dump(_encode(obj), f, indent=2)
+        json.dump(data, f, indent=2)
 
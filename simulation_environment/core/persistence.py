@@ -1,9 +1,21 @@
 """File I/O helpers for scenarios and snapshots."""
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import copy
+from dataclasses import replace
+import hashlib
+from operator import attrgetter
 from pathlib import Path
 import json
-from typing import Tuple
+import os
+import struct
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:  # optional: much faster float-heavy dumps/loads for snapshots
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import (
     EnvironmentBounds,
@@ -14,34 +26,81 @@ from .config import (
     WorldObjectConfig,
     CustomObjectConfig,
     DesignerState,
+    StrokeConfig,
     load_json,
     save_json,
 )
 
 
-def _resolve_asset(base: Path, ref: str) -> Path:
-    """Resolve an asset reference relative to the scenario folder or repository root."""
+# (scenario dir, asset ref) -> resolved path. Only hits are cached, so an asset
+# created after a failed lookup is still found on the next load.
+_asset_cache: Dict[Tuple[str, str], Path] = {}
+# path -> (digest of the normalized config written there, st_mtime_ns, st_size)
+_last_saved: Dict[Path, Tuple[bytes, int, int]] = {}
+
+
+def reset_persistence_caches() -> None:
+    """Forget cached asset resolutions and save digests (e.g. after moving scenario files around)."""
+    _asset_cache.clear()
+    _last_saved.clear()
+
+
+def _dir_names(path: Path) -> Set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {e.name for e in entries}
+    except OSError:
+        return set()
+
+
+def _resolve_asset(base: Path, ref: str, listings: Optional[Tuple[Set[str], Set[str]]] = None) -> Path:
+    """Resolve an asset reference relative to the scenario folder or repository root.
+
+    ``listings`` holds the entry names of ``base`` and ``base.parent``; when given,
+    bare file names are checked against them instead of stat'ing each candidate.
+    """
+    key = (str(base), ref)
+    cached = _asset_cache.get(key)
+    if cached is not None:
+        return cached
     ref_path = Path(ref)
     if ref_path.is_absolute():
         return ref_path
+    bare = listings is not None and len(ref_path.parts) == 1
     # First try relative to scenario directory
     candidate = (base / ref_path).resolve()
-    if candidate.exists():
+    if (ref in listings[0]) if bare else candidate.exists():
+        _asset_cache[key] = candidate
         return candidate
     # Then try relative to repo root (scenario_dir/..)
     repo_root = base.parent
     candidate = (repo_root / ref_path).resolve()
-    if candidate.exists():
+    if (ref in listings[1]) if bare else candidate.exists():
+        _asset_cache[key] = candidate
         return candidate
     # Fall back to original reference (may raise later)
     return ref_path.resolve()
 
 
+_scenario_io: Optional[ThreadPoolExecutor] = None
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    """Shared pool for overlapping the independent world/robot file reads and writes."""
+    global _scenario_io
+    if _scenario_io is None:
+        _scenario_io = ThreadPoolExecutor(max_workers=4, thread_name_prefix="scenario-io")
+    return _scenario_io
+
+
 def load_scenario(path: Path) -> Tuple[WorldConfig, RobotConfig]:
     descriptor_path = path / "scenario.json"
     if descriptor_path.exists():
-        with descriptor_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(descriptor_path.read_bytes())
+        else:
+            with descriptor_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
         env_ref = data.get("environment") or data.get("env")
         robot_ref = data.get("robot")
         robots_ref = data.get("robots") or []
@@ -51,12 +110,16 @@ def load_scenario(path: Path) -> Tuple[WorldConfig, RobotConfig]:
             robot_ref = robots_ref[0]
         if not robot_ref:
             raise ValueError(f"scenario.json missing 'robot': {descriptor_path}")
-        env_path = _resolve_asset(path, env_ref)
-        robot_path = _resolve_asset(path, robot_ref)
-        world_cfg = load_environment_design(env_path)
+        # Bare file names are probed against one directory listing each rather than a stat per candidate.
+        listings = None
+        if any(len(Path(r).parts) == 1 for r in (env_ref, robot_ref)):
+            listings = (_dir_names(path), _dir_names(path.parent))
+        env_path = _resolve_asset(path, env_ref, listings)
+        robot_path = _resolve_asset(path, robot_ref, listings)
+        world_loading = _io_pool().submit(load_environment_design, env_path)
         robot_cfg = load_robot_design(robot_path)
         _normalize_robot(robot_cfg)
-        return world_cfg, robot_cfg
+        return world_loading.result(), robot_cfg
 
     # legacy pair in-place
     world_cfg = load_json(path / "world.json", WorldConfig)
@@ -66,128 +129,330 @@ def load_scenario(path: Path) -> Tuple[WorldConfig, RobotConfig]:
 
 
 def save_scenario(path: Path, world_cfg: WorldConfig, robot_cfg: RobotConfig) -> None:
-    _normalize_world(world_cfg)
-    _normalize_robot(robot_cfg)
-    save_json(path / "world.json", world_cfg)
-    save_json(path / "robot.json", robot_cfg)
+    # The two files are independent; write the world on the I/O pool while this thread does the robot.
+    world_done = _io_pool().submit(_save_config, path / "world.json", world_cfg, _normalize_world)
+    _save_config(path / "robot.json", robot_cfg, _normalize_robot)
+    world_done.result()
+
+
+def _config_digest(cfg) -> bytes:
+    return hashlib.blake2b(repr(cfg).encode("utf-8"), digest_size=16).digest()
+
+
+def _save_config(path: Path, cfg, normalize: Callable[[object], None]) -> None:
+    """Normalize + write ``cfg`` unless it is exactly what we last wrote to ``path``.
 
+    The digest is taken after normalization, so re-saving an unchanged (hence already
+    normalized) config matches it; the file's stat guards against outside edits.
+    """
+    digest = _config_digest(cfg)
+    entry = _last_saved.get(path)
+    if entry is not None and entry[0] == digest:
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is not None and (st.st_mtime_ns, st.st_size) == entry[1:]:
+            return
+    normalize(cfg)
+    save_json(path, cfg)
+    st = path.stat()
+    _last_saved[path] = (_config_digest(cfg), st.st_mtime_ns, st.st_size)
 
-def save_snapshot(path: Path, snap: SnapshotState) -> None:
+
+_SNAPSHOT_BUFFER = 1 << 20
+
+
+def save_snapshot(path: Path, snap: SnapshotState, indent: bool = True) -> None:
+    """Write a snapshot; pass ``indent=False`` for compact output on frequent/automatic saves.
+
+    The orjson path writes the same JSON data as the stdlib one but not the same bytes:
+    strings stay raw UTF-8 instead of ``\\u`` escapes and some floats are spelled
+    differently (``0.00001`` vs ``1e-05``). ``load_snapshot`` reads either.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "time": snap.time,
-                "step": snap.step,
-                "bodies": snap.bodies,
-                "controller_state": snap.controller_state,
-            },
-            f,
-            indent=2,
-        )
+    if orjson is not None and not indent:
+        _stream_snapshot(path, snap)
+        return
+    data = snap.to_dict()
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2))
+        return
+    # json.dump encodes incrementally; a large buffer keeps that from turning into many small writes.
+    with path.open("w", encoding="utf-8", buffering=_SNAPSHOT_BUFFER) as f:
+        if indent:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def _stream_snapshot(path: Path, snap: SnapshotState) -> None:
+    """Compact orjson snapshot written body by body instead of as one document-sized buffer."""
+    dumps = orjson.dumps
+    with path.open("wb", buffering=_SNAPSHOT_BUFFER) as f:
+        f.write(b'{"time":' + dumps(snap.time) + b',"step":' + dumps(snap.step) + b',"bodies":{')
+        sep = b""
+        for name, state in snap.bodies.items():
+            f.write(sep + dumps(str(name)) + b":" + dumps(state, option=orjson.OPT_NON_STR_KEYS))
+            sep = b","
+        f.write(b'},"controller_state":' + dumps(snap.controller_state, option=orjson.OPT_NON_STR_KEYS) + b"}")
+
+
+_snapshot_io: Optional[ThreadPoolExecutor] = None
+_pending_snapshots: List[Future] = []
+
+
+def save_snapshot_async(path: Path, snap: SnapshotState, indent: bool = True) -> Future:
+    """Queue ``save_snapshot`` on a background writer and return its future.
+
+    One worker thread keeps writes in submission order while the caller keeps
+    stepping; call ``flush_snapshots()`` before reading snapshots back or exiting.
+    The controller state is copied here because the controller keeps mutating it
+    while the worker encodes.
+    """
+    global _snapshot_io
+    if _snapshot_io is None:
+        _snapshot_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-io")
+    snap = replace(snap, controller_state=copy.deepcopy(snap.controller_state))
+    fut = _snapshot_io.submit(save_snapshot, path, snap, indent)
+    _pending_snapshots[:] = [f for f in _pending_snapshots if not f.done()]
+    _pending_snapshots.append(fut)
+    return fut
+
+
+def flush_snapshots() -> None:
+    """Wait for all queued snapshot writes; failures stay on their futures."""
+    pending = list(_pending_snapshots)
+    _pending_snapshots.clear()
+    wait(pending)
 
 
 def load_snapshot(path: Path) -> SnapshotState:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    bodies = data.get("bodies", {})
+    if "bodies_file" in data:
+        bodies = _read_packed_bodies(path.with_name(data["bodies_file"]), data.get("body_names", []))
     return SnapshotState(
         time=data.get("time", 0.0),
         step=data.get("step", 0),
-        bodies=data.get("bodies", {}),
+        bodies=bodies,
         controller_state=data.get("controller_state"),
     )
 
 
+# Packed body record: pose x, y, theta, linear velocity x, y, angular velocity (little-endian doubles).
+_BODY_FIELDS = ("x", "y", "theta", "vx", "vy", "omega")
+_BODY_RECORD = struct.Struct("<6d")
+
+
+def save_snapshot_binary(path: Path, snap: SnapshotState) -> None:
+    """Write ``snap`` as JSON metadata plus a packed ``.bodies.bin`` sidecar of body state.
+
+    Only the numeric pose/velocity fields produced by ``Simulator.snapshot`` are kept
+    per body. ``load_snapshot`` reads either layout.
+    """
+    path = path.with_suffix(".json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    bin_path = path.with_suffix(".bodies.bin")
+    names = list(snap.bodies)
+    pack = _BODY_RECORD.pack
+    records = []
+    for name in names:
+        state = snap.bodies[name]
+        pose = state.get("pose", {})
+        vx, vy = state.get("lin_vel", (0.0, 0.0))
+        records.append(
+            pack(pose.get("x", 0.0), pose.get("y", 0.0), pose.get("theta", 0.0), vx, vy, state.get("ang_vel", 0.0))
+        )
+    bin_path.write_bytes(b"".join(records))
+    meta = {
+        "time": snap.time,
+        "step": snap.step,
+        "body_names": names,
+        "body_fields": list(_BODY_FIELDS),
+        "bodies_file": bin_path.name,
+        "controller_state": snap.controller_state,
+    }
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
+def _read_packed_bodies(bin_path: Path, names: List[str]) -> Dict[str, Dict[str, object]]:
+    data = bin_path.read_bytes()
+    if len(data) != len(names) * _BODY_RECORD.size:
+        raise ValueError(
+            f"{bin_path.name}: expected {len(names)} body records ({len(names) * _BODY_RECORD.size} bytes), "
+            f"found {len(data)} bytes"
+        )
+    bodies: Dict[str, Dict[str, object]] = {}
+    for name, (x, y, theta, vx, vy, omega) in zip(names, _BODY_RECORD.iter_unpack(data)):
+        bodies[name] = {"pose": {"x": x, "y": y, "theta": theta}, "lin_vel": [vx, vy], "ang_vel": omega}
+    return bodies
+
+
+def _clean_points(points) -> List[Tuple[float, float]]:
+    """Coerce a point list to float (x, y) tuples; shared by drawings and bodies."""
+    return [(float(p[0]), float(p[1])) for p in points]
+
+
+def _clean_edges(edges) -> List[Tuple[int, int]]:
+    return [(int(a), int(b)) for a, b in edges]
+
+
+def _canonical_points(points) -> bool:
+    return type(points) is list and all(
+        type(p) is tuple and len(p) == 2 and type(p[0]) is float and type(p[1]) is float for p in points
+    )
+
+
+def _is_canonical_body(body) -> bool:
+    """True when ``body`` already has exactly the types normalization would produce."""
+    return (
+        type(body) is BodyConfig
+        and type(body.name) is str
+        and type(body.pose) is tuple
+        and all(type(v) is float for v in body.pose)
+        and type(body.can_move) is bool
+        and type(body.mass) is float
+        and type(body.inertia) is float
+        and _canonical_points(body.points)
+        and type(body.edges) is list
+        and all(type(e) is tuple and len(e) == 2 and type(e[0]) is int and type(e[1]) is int for e in body.edges)
+    )
+
+
+def _normalize_body(body, seen: Dict[int, BodyConfig]) -> BodyConfig:
+    cached = seen.get(id(body))
+    if cached is not None:
+        return cached
+    if _is_canonical_body(body):
+        norm_body = body
+    else:
+        pose = body.pose
+        if type(pose) is not tuple or not all(type(v) is float for v in pose):
+            pose = tuple(float(v) for v in pose)
+        norm_body = BodyConfig(
+            name=str(body.name),
+            points=_clean_points(body.points),
+            edges=_clean_edges(body.edges),
+            pose=pose,
+            can_move=bool(body.can_move),
+            mass=float(body.mass),
+            inertia=float(body.inertia),
+            material=body.material,  # already dataclass
+        )
+    seen[id(body)] = norm_body
+    return norm_body
+
+
+def _drawing_sort_key(s) -> tuple:
+    # All-tuple key: ties on kind/thickness/length fall through to C-level tuple compares.
+    return (s.kind, round(s.thickness, 6), len(s.points), tuple((round(p[0], 6), round(p[1], 6)) for p in s.points))
+
+
+# Allowed DesignerState values; anything else is reset to its default on save.
+_BRUSH_KINDS = frozenset({"mark", "wall"})
+_SHAPE_TOOLS = frozenset({"rect", "triangle", "line"})
+_CREATION_CONTEXTS = frozenset({"robot", "environment", "custom"})
+
+
+def _as_list(items) -> list:
+    return items if type(items) is list else list(items or [])
+
+
+def _normalize_drawing(d):
+    # Config dataclasses always define their fields, so read them directly (no getattr defaults).
+    if (
+        type(d) is StrokeConfig
+        and type(d.kind) is str
+        and type(d.thickness) is float
+        and d.thickness >= 1e-4
+        and type(d.color) is tuple
+        and _canonical_points(d.points)
+    ):
+        return d  # re-save of an already normalized stroke
+    return type(d)(
+        kind=str(d.kind),
+        thickness=max(1e-4, float(d.thickness)),
+        points=_clean_points(d.points),
+        color=tuple(d.color),
+    )
+
+
+def _normalize_shape(obj, seen: Dict[int, BodyConfig]) -> WorldObjectConfig:
+    body = obj.body
+    norm_body = _normalize_body(body, seen)
+    if norm_body is body and type(obj) is WorldObjectConfig and type(obj.name) is str:
+        return obj  # already canonical; nothing to rebuild
+    return WorldObjectConfig(name=str(obj.name), body=norm_body)
+
+
+def _normalize_custom(obj, seen: Dict[int, BodyConfig]) -> CustomObjectConfig:
+    body = obj.body
+    norm_body = _normalize_body(body, seen)
+    if (
+        norm_body is body
+        and type(obj) is CustomObjectConfig
+        and type(obj.name) is str
+        and type(obj.kind) is str
+        and type(obj.metadata) is dict
+    ):
+        return obj
+    return CustomObjectConfig(
+        name=str(obj.name),
+        body=norm_body,
+        kind=str(obj.kind),
+        metadata=dict(obj.metadata or {}),
+    )
+
+
+def _normalize_objects(objects: List, normalize, seen: Dict[int, BodyConfig]) -> List:
+    """Normalize ``objects`` in place, dropping bodiless entries, then sort by name."""
+    kept = 0
+    for obj in objects:
+        if not obj.body:
+            continue
+        objects[kept] = normalize(obj, seen)  # kept never passes the read position
+        kept += 1
+    del objects[kept:]
+    objects.sort(key=lambda o: o.name)
+    return objects
+
+
 def _normalize_world(world_cfg: WorldConfig) -> None:
     """Ensure world config fields stay deterministic when saving."""
     # Normalize bounds ordering
-    if getattr(world_cfg, "bounds", None):
-        b = world_cfg.bounds
-        assert b
+    b = world_cfg.bounds
+    if b:
         min_x = min(b.min_x, b.max_x)
         max_x = max(b.min_x, b.max_x)
         min_y = min(b.min_y, b.max_y)
         max_y = max(b.min_y, b.max_y)
         world_cfg.bounds = EnvironmentBounds(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
-    # Normalize drawings (sort + clamp small negative thickness)
-    drawings = getattr(world_cfg, "drawings", []) or []
-    normalized = []
-    for d in drawings:
-        pts = [(float(p[0]), float(p[1])) for p in d.points]
-        normalized.append(
-            type(d)(
-                kind=str(getattr(d, "kind", "mark")),
-                thickness=max(1e-4, float(getattr(d, "thickness", 0.05))),
-                points=pts,
-                color=tuple(getattr(d, "color", (140, 180, 240))),
-            )
-        )
-    world_cfg.drawings = sorted(
-        normalized,
-        key=lambda s: (
-            s.kind,
-            round(s.thickness, 6),
-            len(s.points),
-            [(round(p[0], 6), round(p[1], 6)) for p in s.points],
-        ),
-    )
+    # Normalize drawings (sort + clamp small negative thickness); lists are rewritten in place.
+    drawings = _as_list(world_cfg.drawings)
+    for i, d in enumerate(drawings):
+        drawings[i] = _normalize_drawing(d)
+    drawings.sort(key=_drawing_sort_key)
+    world_cfg.drawings = drawings
+    # Bodies shared between shape and custom objects are normalized once (keyed by identity).
+    seen: Dict[int, BodyConfig] = {}
     # Normalize shape objects (static or decorative geometry)
-    shape_objects = getattr(world_cfg, "shape_objects", []) or []
-    norm_shapes: list[WorldObjectConfig] = []
-    for obj in shape_objects:
-        body = getattr(obj, "body", None)
-        if not body:
-            continue
-        pts = [(float(p[0]), float(p[1])) for p in body.points]
-        edges = [(int(a), int(b)) for a, b in body.edges]
-        norm_body = BodyConfig(
-            name=str(body.name),
-            points=pts,
-            edges=edges,
-            pose=tuple(float(v) for v in body.pose),
-            can_move=bool(getattr(body, "can_move", False)),
-            mass=float(getattr(body, "mass", 1.0)),
-            inertia=float(getattr(body, "inertia", 1.0)),
-            material=body.material,  # already dataclass
-        )
-        norm_shapes.append(WorldObjectConfig(name=str(obj.name), body=norm_body))
-    world_cfg.shape_objects = sorted(norm_shapes, key=lambda o: o.name)
+    world_cfg.shape_objects = _normalize_objects(_as_list(world_cfg.shape_objects), _normalize_shape, seen)
     # Normalize custom objects (metadata + geometry)
-    custom_objects = getattr(world_cfg, "custom_objects", []) or []
-    norm_customs: list[CustomObjectConfig] = []
-    for obj in custom_objects:
-        body = getattr(obj, "body", None)
-        if not body:
-            continue
-        pts = [(float(p[0]), float(p[1])) for p in body.points]
-        edges = [(int(a), int(b)) for a, b in body.edges]
-        norm_body = BodyConfig(
-            name=str(body.name),
-            points=pts,
-            edges=edges,
-            pose=tuple(float(v) for v in body.pose),
-            can_move=bool(getattr(body, "can_move", False)),
-            mass=float(getattr(body, "mass", 1.0)),
-            inertia=float(getattr(body, "inertia", 1.0)),
-            material=body.material,
-        )
-        norm_customs.append(
-            CustomObjectConfig(
-                name=str(getattr(obj, "name", body.name)),
-                body=norm_body,
-                kind=str(getattr(obj, "kind", "custom")),
-                metadata=dict(getattr(obj, "metadata", {}) or {}),
-            )
-        )
-    world_cfg.custom_objects = sorted(norm_customs, key=lambda o: o.name)
+    world_cfg.custom_objects = _normalize_objects(_as_list(world_cfg.custom_objects), _normalize_custom, seen)
     # Normalize designer state to keep numeric values stable
-    ds = getattr(world_cfg, "designer_state", None) or DesignerState()
-    ds.brush_thickness = max(1e-4, float(getattr(ds, "brush_thickness", 0.05)))
-    if getattr(ds, "brush_kind", "") not in ("mark", "wall"):
+    ds = world_cfg.designer_state or DesignerState()
+    ds.brush_thickness = max(1e-4, float(ds.brush_thickness))
+    if ds.brush_kind not in _BRUSH_KINDS:
         ds.brush_kind = "mark"
-    if getattr(ds, "shape_tool", "") not in ("rect", "triangle", "line"):
+    if ds.shape_tool not in _SHAPE_TOOLS:
         ds.shape_tool = "rect"
-    if getattr(ds, "creation_context", "") not in ("robot", "environment", "custom"):
+    if ds.creation_context not in _CREATION_CONTEXTS:
         ds.creation_context = "robot"
     world_cfg.designer_state = ds
 
@@ -205,16 +470,24 @@ def _normalize_robot(robot_cfg: RobotConfig) -> None:
                 can_move=True,
             )
         ]
-    robot_cfg.actuators = sorted(robot_cfg.actuators, key=lambda a: a.name)
-    robot_cfg.sensors = sorted(robot_cfg.sensors, key=lambda s: s.name)
-    robot_cfg.bodies = sorted(robot_cfg.bodies, key=lambda b: b.name)
+    # Steady-state saves are already ordered: check in one pass and only sort (in place) when needed.
+    robot_cfg.actuators = _sorted_by_name(robot_cfg.actuators)
+    robot_cfg.sensors = _sorted_by_name(robot_cfg.sensors)
+    robot_cfg.bodies = _sorted_by_name(robot_cfg.bodies)
+
+
+def _sorted_by_name(items) -> list:
+    items = _as_list(items)
+    names = [item.name for item in items]
+    if any(a > b for a, b in zip(names, names[1:])):
+        items.sort(key=attrgetter("name"))
+    return items
 
 
 # --- Design helpers (robot/env/custom) ---------------------------------------
 def save_robot_design(path: Path, robot_cfg: RobotConfig) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    _normalize_robot(robot_cfg)
-    save_json(path, robot_cfg)
+    _save_config(path, robot_cfg, _normalize_robot)
 
 
 def load_robot_design(path: Path) -> RobotConfig:
@@ -225,8 +498,7 @@ def load_robot_design(path: Path) -> RobotConfig:
 
 def save_environment_design(path: Path, world_cfg: WorldConfig) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    _normalize_world(world_cfg)
-    save_json(path, world_cfg)
+    _save_config(path, world_cfg, _normalize_world)
 
 
 def load_environment_design(path: Path) -> WorldConfig:
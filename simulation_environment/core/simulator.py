@@ -1,13 +1,15 @@
 """High-level simulator with XPBD-style joints and impulse contacts."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+import gzip
 import json
 import importlib
 import math
+from operator import attrgetter
 import sys
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, TextIO, Tuple
 import random
 import traceback
 
@@ -18,7 +20,7 @@ from low_level_mechanics.geometry import (
     collision_manifold,
 )
 from low_level_mechanics.materials import MaterialProperties
-from low_level_mechanics.world import Pose2D
+from low_level_mechanics.world import Pose2D, slotted_dataclass
 
 from middle_level_library.motors import WheelMotor, WheelMotorDetailed
 from middle_level_library.sensors import DistanceSensor, LineSensor, LineSensorArray, IMUSensor, EncoderSensor
@@ -38,6 +40,138 @@ from .config import (
     StrokeConfig,
     EnvironmentBounds,
 )
+from ._contact_kernels import contact_correction, contact_impulse, contact_warm_impulse, joint_projection
+
+try:  # optional: Rust JSON encoder for trace output
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Trace fields for a motor that has not reported yet (command is filled in per step).
+_EMPTY_MOTOR_TRACE: Dict[str, object] = {
+    "command": 0.0,
+    "slip_ratio": None,
+    "lateral_slip": None,
+    "wheel_speed": None,
+    "preferred_speed": None,
+    "contact_speed": None,
+    "contact_speed_after": None,
+    "applied_longitudinal_impulse": None,
+    "applied_lateral_impulse": None,
+    "applied_longitudinal_force": None,
+    "applied_lateral_force": None,
+    "normal_load": None,
+    "step": None,
+}
+
+
+_MOTOR_REPORT_FIELDS = (
+    "slip_ratio",
+    "lateral_slip",
+    "wheel_speed",
+    "preferred_speed",
+    "contact_speed",
+    "contact_speed_after",
+    "applied_longitudinal_impulse",
+    "applied_lateral_impulse",
+    "normal_load",
+    "step",
+)
+_MOTOR_REPORT_GETTER = attrgetter(*_MOTOR_REPORT_FIELDS)
+
+
+def _motor_trace(command: float, report, dt: float) -> Dict[str, object]:
+    if report is None:
+        return dict(_EMPTY_MOTOR_TRACE, command=command)
+    # One C-level fetch of every report field; key order matches the empty template.
+    slip, lateral, wheel, preferred, contact, contact_after, long_imp, lat_imp, load, step = _MOTOR_REPORT_GETTER(report)
+    return {
+        "command": command,
+        "slip_ratio": slip,
+        "lateral_slip": lateral,
+        "wheel_speed": wheel,
+        "preferred_speed": preferred,
+        "contact_speed": contact,
+        "contact_speed_after": contact_after,
+        "applied_longitudinal_impulse": long_imp,
+        "applied_lateral_impulse": lat_imp,
+        "applied_longitudinal_force": long_imp / dt if dt > 0 else None,
+        "applied_lateral_force": lat_imp / dt if dt > 0 else None,
+        "normal_load": load,
+        "step": step,
+    }
+
+
+class _TraceRow(NamedTuple):
+    """One step as recorded by ``Simulator._record_trace``; no per-row ``__dict__``."""
+
+    layout: Tuple[Tuple[str, ...], list, Tuple[str, ...], List[SimObject]]
+    step: int
+    time: float
+    dt: float
+    motors: List[tuple]
+    bodies: List[tuple]
+
+
+def _trace_entry(row: _TraceRow) -> Dict[str, object]:
+    """Build the public trace dict for one recorded row."""
+    (motor_names, _, body_names, _), step, time, dt, motors, bodies = row
+    return {
+        "step": step,
+        "time": time,
+        "dt": dt,
+        "motors": {name: _motor_trace(command, report, dt) for name, (command, report) in zip(motor_names, motors)},
+        "bodies": {
+            name: {"pose": pose.as_dict(), "lin_vel": lin_vel, "ang_vel": ang_vel}
+            for name, (pose, lin_vel, ang_vel) in zip(body_names, bodies)
+        },
+    }
+
+
+_TRACE_BODY_FIELDS = ("x", "y", "theta", "vx", "vy", "omega")
+
+
+def _trace_value(value) -> float:
+    return math.nan if value is None else value
+
+
+def load_trace_log_compact(path: Path) -> List[Dict[str, object]]:
+    """Rebuild trace entries written by ``Simulator.save_trace_log_compact``.
+
+    Values come back at float32 precision; NaN report fields become None again.
+    """
+    path = path.with_suffix(".json")
+    meta = json.loads(path.read_text(encoding="utf-8"))
+    values = array("f")
+    values.frombytes(gzip.decompress((path.parent / meta["values_file"]).read_bytes()))
+    if sys.byteorder == "big":
+        values.byteswap()
+    motor_names, motor_fields = meta["motor_names"], meta["motor_fields"]
+    body_names = meta["body_names"]
+    n_fields = len(motor_fields)
+    entries: List[Dict[str, object]] = []
+    for row in (values[i : i + meta["row_width"]] for i in range(0, len(values), meta["row_width"])):
+        step, time, dt = row[0], row[1], row[2]
+        col = 3
+        motors: Dict[str, object] = {}
+        for name in motor_names:
+            fields = row[col : col + n_fields]
+            col += n_fields
+            if math.isnan(fields[0]):  # command is always set, so NaN marks an absent motor
+                continue
+            motor = {key: None if math.isnan(v) else v for key, v in zip(motor_fields, fields)}
+            if motor.get("step") is not None:
+                motor["step"] = int(motor["step"])
+            motors[name] = motor
+        bodies: Dict[str, object] = {}
+        for name in body_names:
+            x, y, theta, vx, vy, omega = row[col : col + 6]
+            col += 6
+            if not math.isnan(x):
+                bodies[name] = {"pose": {"x": x, "y": y, "theta": theta}, "lin_vel": (vx, vy), "ang_vel": omega}
+        entries.append({"step": int(step), "time": time, "dt": dt, "motors": motors, "bodies": bodies})
+    return entries
 
 
 def _pose_from_tuple(p: PoseTuple) -> Pose2D:
@@ -66,13 +200,35 @@ def _material_from_config(cfg) -> MaterialProperties:
     )
 
 
-@dataclass
+@slotted_dataclass
 class JointRuntime:
     cfg: JointConfig
     # XPBD params
     compliance: float = 0.0
     damping: float = 0.01
     lambda_accum: float = 0.0
+    # Solve batch from _wavefront_colors(); joints sharing a movable body never share a color
+    color: int = 0
+
+
+def _wavefront_colors(constraints: List[Tuple[Optional[SimObject], Optional[SimObject]]]) -> List[int]:
+    """Color constraints so that no color holds two touching the same movable body.
+
+    Each constraint takes one more than the highest color its movable bodies already
+    used (static bodies are only read by the solvers, so they never link). Solving
+    colors in ascending order, original order within a color, therefore replays each
+    body's constraints in their original sequence: results match the plain loop while
+    every color batch is free of shared writes.
+    """
+    next_free: Dict[int, int] = {}
+    colors: List[int] = []
+    for a, b in constraints:
+        movable = [body for body in (a, b) if body is not None and body.can_move]
+        color = max((next_free.get(id(body), 0) for body in movable), default=0)
+        for body in movable:
+            next_free[id(body)] = color + 1
+        colors.append(color)
+    return colors
 
 
 class Simulator:
@@ -91,6 +247,14 @@ class Simulator:
         self.motors: Dict[str, WheelMotor] = {}
         self.controller_module: Optional[object] = None
         self.controller_instance: Optional[object] = None
+        # (instance, its step/update method) resolved once per controller instance
+        self._controller_tick: Tuple[Optional[object], Optional[Callable]] = (None, None)
+        # (instance, its get_state, its set_state) resolved once per controller instance
+        self._controller_state_hooks: Tuple[Optional[object], Optional[Callable], Optional[Callable]] = (
+            None,
+            None,
+            None,
+        )
         self.controller_state: Optional[dict] = None
         self.scenario_path: Optional[Path] = None
         self._rng = random.Random()
@@ -108,10 +272,32 @@ class Simulator:
         self.max_penetration_correction: float = 0.05
         self.max_step_translation: float = 0.5
         self.debug_checks: bool = False
+        # Run the velocity/pose sanity pass in integration every N steps (always with debug_checks).
+        # 1 keeps the speed limits exact; larger values trade that for less per-body work.
+        self.sanitize_every_n_steps: int = 1
+        # Re-apply last step's contact impulses before solving (persistent contacts); off by default
+        self.contact_warm_start: bool = False
+        # (id(a), id(b)) -> (normal impulse, tangent impulse, step_index last touched)
+        self._warm_impulses: Dict[Tuple[int, int], Tuple[float, float, int]] = {}
+        # Bodies split by can_move at load; rebuilt by _index_bodies() if self.bodies changes size
+        self._movable_bodies: List[SimObject] = []
+        # (name, body) for the movable ones, in self.bodies order (step-sanity snapshots)
+        self._movable_items: List[Tuple[str, SimObject]] = []
+        self._static_bodies: List[SimObject] = []
+        # Contact candidates without static-static pairs, grouped by wavefront color:
+        # (a, b, restitution, friction)
+        self._contact_pairs: List[Tuple[SimObject, SimObject, float, float]] = []
+        # self.joints grouped by color (rebuilt when the joint count changes)
+        self._joint_order: List[JointRuntime] = []
         # Optional per-step trace logging
         self.trace_enabled: bool = False
-        self.trace_log: List[Dict[str, object]] = []
+        # Entries are recorded as compact rows of immutable references and turned into
+        # dicts only when trace_log is read (see _record_trace / _trace_entry).
+        self._trace_entries: List[Dict[str, object]] = []
+        self._trace_rows: List[_TraceRow] = []
+        self._trace_layout: Optional[tuple] = None
         self.trace_callback: Optional[Callable[[Dict[str, object]], None]] = None
+        self._trace_fp: Optional[TextIO] = None
 
     # --- Loading ---------------------------------------------------------
     def load(
@@ -135,7 +321,13 @@ class Simulator:
         self.last_controller_error = None
         self.last_physics_warning = None
         self.bodies.clear()
+        if self._close_trace_file():
+            # The streamed trace belonged to the previous scenario.
+            self.trace_enabled = False
+        self._trace_layout = None
+        self._warm_impulses.clear()
         self.joints.clear()
+        self._joint_order = []
         self.sensors.clear()
         self.motors.clear()
         self.last_sensor_readings = {}
@@ -147,10 +339,15 @@ class Simulator:
                 sim_obj.can_move = False
                 self.bodies[obj.name] = sim_obj
         self._inject_environment(world_cfg)
+        # Static geometry never moves: transform it once here instead of on the first contact pass.
+        for body in self.bodies.values():
+            if not body.can_move:
+                body.world_geometry()
         # Robot bodies
         for body_cfg in robot_cfg.bodies:
             sim_obj = self._make_body(body_cfg, spawn_pose=robot_cfg.spawn_pose)
             self.bodies[body_cfg.name] = sim_obj
+        self._index_bodies()
         # Joints
         for joint_cfg in robot_cfg.joints:
             self.joints.append(JointRuntime(cfg=joint_cfg))
@@ -386,22 +583,18 @@ class Simulator:
                 continue
             thickness = max(1e-4, float(getattr(stroke, "thickness", 0.05)))
             color = tuple(getattr(stroke, "color", (160, 160, 180)))
-            for i in range(len(pts) - 1):
-                p0 = pts[i]
-                p1 = pts[i + 1]
-                dx = p1[0] - p0[0]
-                dy = p1[1] - p0[1]
+            half = thickness / 2.0
+            # One pass over consecutive point pairs; each segment becomes a rectangle
+            # offset by the half-thickness normal (same arithmetic as per-point indexing).
+            for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
+                dx = x1 - x0
+                dy = y1 - y0
                 seg_len = math.hypot(dx, dy)
                 if seg_len < 1e-6:
                     continue
-                nx = -dy / seg_len * (thickness / 2.0)
-                ny = dx / seg_len * (thickness / 2.0)
-                rect = [
-                    (p0[0] + nx, p0[1] + ny),
-                    (p1[0] + nx, p1[1] + ny),
-                    (p1[0] - nx, p1[1] - ny),
-                    (p0[0] - nx, p0[1] - ny),
-                ]
+                nx = -dy / seg_len * half
+                ny = dx / seg_len * half
+                rect = [(x0 + nx, y0 + ny), (x1 + nx, y1 + ny), (x1 - nx, y1 - ny), (x0 - nx, y0 - ny)]
                 configs.append(self._make_static_body_cfg(f"env_wall_{seg_idx}", rect, color=color))
                 seg_idx += 1
         return configs
@@ -411,7 +604,13 @@ class Simulator:
         if dt is None:
             dt = self.dt
         self.last_physics_warning = None
-        prev_poses = {name: body.pose for name, body in self.bodies.items()}
+        self._ensure_body_index()
+        self._refresh_inverse_mass()
+        # Only movable bodies can fail the step check, and only when it is enabled.
+        if self.max_step_translation > 0.0:
+            prev_poses = [(name, body, body.pose) for name, body in self._movable_items]
+        else:
+            prev_poses = []
         # Sensors read before controller
         sensor_readings = self._update_sensors(dt)
         self.last_sensor_readings = sensor_readings
@@ -436,25 +635,108 @@ class Simulator:
         callback: Optional[Callable[[Dict[str, object]], None]] = None,
         *,
         clear_existing: bool = True,
+        path: Optional[Path] = None,
     ) -> None:
-        """Toggle per-step trace capture; optional callback for streaming."""
+        """Toggle per-step trace capture; optional callback for streaming.
+
+        With ``path``, entries are written there as JSON lines (one compact object per
+        step) instead of accumulating in ``trace_log``; the file is truncated when
+        ``clear_existing`` is set, appended to otherwise, and line-buffered so each step is
+        on disk once it is recorded. The file is closed on the next call, or by ``load()``,
+        which also stops tracing.
+        """
         self.trace_enabled = enabled
         self.trace_callback = callback
         if clear_existing:
-            self.trace_log.clear()
+            self.clear_trace_log()
+        self._close_trace_file()
+        if enabled and path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._trace_fp = path.open("w" if clear_existing else "a", encoding="utf-8", buffering=1)
+
+    def _close_trace_file(self) -> bool:
+        """Close the streaming trace file, if any; returns whether one was open."""
+        if self._trace_fp is None:
+            return False
+        self._trace_fp.close()
+        self._trace_fp = None
+        return True
+
+    @property
+    def trace_log(self) -> List[Dict[str, object]]:
+        """Recorded trace entries (materialized from the compact rows on access)."""
+        if self._trace_rows:
+            self._trace_entries.extend(_trace_entry(row) for row in self._trace_rows)
+            self._trace_rows.clear()
+        return self._trace_entries
 
     def export_trace_log(self) -> List[Dict[str, object]]:
         return list(self.trace_log)
 
     def clear_trace_log(self) -> None:
-        self.trace_log.clear()
+        self._trace_entries.clear()
+        self._trace_rows.clear()
 
     def save_trace_log(self, path: Path) -> None:
-        """Persist the current trace log to disk as JSON."""
+        """Persist the current trace log to disk as JSON (see save_trace_log_compact for long runs)."""
         path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.trace_log, option=orjson.OPT_INDENT_2))
+            return
         with path.open("w", encoding="utf-8") as f:
             json.dump(self.trace_log, f, indent=2)
 
+    def save_trace_log_compact(self, path: Path) -> None:
+        """Write the trace as JSON metadata plus a gzip'd float32 ``.trace.f32.gz`` sidecar.
+
+        One row per step: step, time, dt, then every motor's trace fields and every body's
+        x, y, theta, vx, vy, omega. Values are rounded to float32 and missing ones stored
+        as NaN, which with DEFLATE is typically 10x+ smaller than ``save_trace_log``.
+        Read it back with ``load_trace_log_compact``.
+        """
+        path = path.with_suffix(".json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entries = self.trace_log
+        motor_names: Dict[str, None] = {}
+        body_names: Dict[str, None] = {}
+        for entry in entries:
+            motor_names.update(dict.fromkeys(entry["motors"]))
+            body_names.update(dict.fromkeys(entry["bodies"]))
+        motor_fields = tuple(_EMPTY_MOTOR_TRACE)
+        absent_motor = [math.nan] * len(motor_fields)
+        absent_body = [math.nan] * len(_TRACE_BODY_FIELDS)
+        values = array("f")
+        for entry in entries:
+            values.extend((entry["step"], entry["time"], entry["dt"]))
+            motors = entry["motors"]
+            for name in motor_names:
+                motor = motors.get(name)
+                values.extend(absent_motor if motor is None else [_trace_value(motor[key]) for key in motor_fields])
+            bodies = entry["bodies"]
+            for name in body_names:
+                body = bodies.get(name)
+                if body is None:
+                    values.extend(absent_body)
+                    continue
+                pose = body["pose"]
+                vx, vy = body["lin_vel"]
+                values.extend((pose["x"], pose["y"], pose["theta"], vx, vy, body["ang_vel"]))
+        if sys.byteorder == "big":
+            values.byteswap()
+        values_path = path.with_suffix(".trace.f32.gz")
+        values_path.write_bytes(gzip.compress(values.tobytes()))
+        meta = {
+            "rows": len(entries),
+            "row_width": 3 + len(motor_names) * len(motor_fields) + len(body_names) * len(_TRACE_BODY_FIELDS),
+            "motor_names": list(motor_names),
+            "motor_fields": list(motor_fields),
+            "body_names": list(body_names),
+            "body_fields": list(_TRACE_BODY_FIELDS),
+            "values_file": values_path.name,
+        }
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
     def _update_sensors(self, dt: float) -> Dict[str, object]:
         readings: Dict[str, object] = {}
         for name, sensor in self.sensors.items():
@@ -464,14 +746,17 @@ class Simulator:
         return readings
 
     def _tick_controller(self, sensor_readings: Dict[str, object], dt: float) -> None:
-        if not self.controller_instance:
+        instance = self.controller_instance
+        # A failed controller stays off until the error is cleared or it is reloaded.
+        if not instance or self.last_controller_error:
             return
-        tick_fn = getattr(self.controller_instance, "step", None) or getattr(self.controller_instance, "update", None)
+        cached_instance, tick_fn = self._controller_tick
+        if cached_instance is not instance:
+            # Provide simple API
+            tick_fn = getattr(instance, "step", None) or getattr(instance, "update", None)
+            self._controller_tick = (instance, tick_fn)
         if not tick_fn:
             return
-        # Provide simple API
-        if self.last_controller_error:
-            return
         try:
             tick_fn(sensor_readings, dt)
         except Exception:
@@ -486,6 +771,12 @@ class Simulator:
     def _sanitize_velocity(self, body: SimObject) -> None:
         vx, vy = body.state.linear_velocity
         omega = body.state.angular_velocity
+        # Common case in one test: finite and comfortably inside both limits (NaN/inf compare False).
+        # The 1e-9 margin keeps this from skipping a clamp that hypot() would still trigger.
+        max_lin = self.max_linear_speed
+        max_ang = self.max_angular_speed
+        if vx * vx + vy * vy < max_lin * max_lin * (1.0 - 1e-9) and -max_ang <= omega <= max_ang:
+            return
         if not all(math.isfinite(v) for v in (vx, vy)):
             body.state.linear_velocity = (0.0, 0.0)
             self._flag_warning(f"{body.name}: reset invalid linear velocity")
@@ -509,16 +800,13 @@ class Simulator:
             body.pose = Pose2D(0.0, 0.0, 0.0)
             self._flag_warning(f"{body.name}: reset pose due to invalid values")
 
-    def _check_step_sanity(self, prev_poses: Dict[str, Pose2D], dt: float) -> None:
+    def _check_step_sanity(self, prev_poses: List[Tuple[str, SimObject, Pose2D]], dt: float) -> None:
         if self.max_step_translation <= 0.0:
             return
         limit = self.max_step_translation
-        for name, body in self.bodies.items():
+        for name, body, prev in prev_poses:
             if not body.can_move:
                 continue
-            prev = prev_poses.get(name)
-            if not prev:
-                continue
             dx = body.pose.x - prev.x
             dy = body.pose.y - prev.y
             dist = math.hypot(dx, dy)
@@ -535,172 +823,224 @@ class Simulator:
                     body.pose = prev
 
     def _record_trace(self, dt: float) -> None:
-        entry: Dict[str, object] = {
-            "step": self.step_index,
-            "time": self.time,
-            "dt": dt,
-            "motors": {},
-            "bodies": {},
-        }
-        for name, motor in self.motors.items():
-            report = getattr(motor, "last_report", None)
-            entry["motors"][name] = {
-                "command": getattr(motor, "last_command", 0.0),
-                "slip_ratio": getattr(report, "slip_ratio", None) if report else None,
-                "lateral_slip": getattr(report, "lateral_slip", None) if report else None,
-                "wheel_speed": getattr(report, "wheel_speed", None) if report else None,
-                "preferred_speed": getattr(report, "preferred_speed", None) if report else None,
-                "contact_speed": getattr(report, "contact_speed", None) if report else None,
-                "contact_speed_after": getattr(report, "contact_speed_after", None) if report else None,
-                "applied_longitudinal_impulse": getattr(report, "applied_longitudinal_impulse", None) if report else None,
-                "applied_lateral_impulse": getattr(report, "applied_lateral_impulse", None) if report else None,
-                "applied_longitudinal_force": (
-                    getattr(report, "applied_longitudinal_impulse", 0.0) / dt if report and dt > 0 else None
-                ),
-                "applied_lateral_force": (
-                    getattr(report, "applied_lateral_impulse", 0.0) / dt if report and dt > 0 else None
-                ),
-                "normal_load": getattr(report, "normal_load", None) if report else None,
-                "step": getattr(report, "step", None) if report else None,
-            }
-        for name, body in self.bodies.items():
-            entry["bodies"][name] = {
-                "pose": body.pose.as_dict(),
-                "lin_vel": body.state.linear_velocity,
-                "ang_vel": body.state.angular_velocity,
-            }
-        self.trace_log.append(entry)
+        layout = self._trace_layout
+        if layout is None or len(layout[1]) != len(self.motors) or len(layout[3]) != len(self.bodies):
+            layout = self._trace_layout = (
+                tuple(self.motors),
+                list(self.motors.values()),
+                tuple(self.bodies),
+                list(self.bodies.values()),
+            )
+        # Poses, velocity tuples and traction reports are never mutated once set, so
+        # holding references is as good as copying their fields now.
+        row = _TraceRow(
+            layout,
+            self.step_index,
+            self.time,
+            dt,
+            [(getattr(m, "last_command", 0.0), getattr(m, "last_report", None)) for m in layout[1]],
+            [(b.pose, b.state.linear_velocity, b.state.angular_velocity) for b in layout[3]],
+        )
+        if self._trace_fp is None and self.trace_callback is None:
+            self._trace_rows.append(row)
+            return
+        entry = _trace_entry(row)
+        if self._trace_fp is not None:
+            if orjson is not None:
+                self._trace_fp.write(orjson.dumps(entry).decode() + "\n")
+            else:
+                self._trace_fp.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        else:
+            self.trace_log.append(entry)
         if self.trace_callback:
             self.trace_callback(entry)
 
+    def _index_bodies(self) -> None:
+        """Cache the movable/static split so stepping doesn't re-test every static body.
+
+        Also lists the contact candidates: each body with the later bodies it can collide
+        with (everything after a movable body, only the movable ones after a static body),
+        grouped into wavefront colors. Materials don't change after load, so each pair's
+        restitution and friction are combined here once. Static bodies get a zero
+        ``_inv_mass``/``_inv_inertia`` here; movable ones refresh theirs at the start of
+        each step (_refresh_inverse_mass). Call again after
+        changing ``can_move`` or materials on a loaded body.
+        """
+        bodies = list(self.bodies.values())
+        self._movable_bodies = [b for b in bodies if b.can_move]
+        self._movable_items = [(name, b) for name, b in self.bodies.items() if b.can_move]
+        self._static_bodies = [b for b in bodies if not b.can_move]
+        for body in self._static_bodies:
+            body._inv_mass = 0.0
+            body._inv_inertia = 0.0
+        pairs: List[Tuple[SimObject, SimObject, float, float]] = []
+        for i, a in enumerate(bodies):
+            later = bodies[i + 1 :]
+            if not a.can_move:
+                later = [b for b in later if b.can_move]
+            a_restitution = getattr(a.material, "restitution", 0.1)
+            a_friction = getattr(a.material, "friction", 0.6)
+            for b in later:
+                restitution = max(a_restitution, getattr(b.material, "restitution", 0.1))
+                restitution = max(0.0, min(1.0, restitution))
+                mu = 0.5 * (a_friction + getattr(b.material, "friction", 0.6))
+                pairs.append((a, b, restitution, mu))
+        colors = _wavefront_colors([(p[0], p[1]) for p in pairs])
+        self._contact_pairs = [pairs[k] for k in sorted(range(len(pairs)), key=colors.__getitem__)]
+
+    def _ensure_body_index(self) -> None:
+        if len(self._movable_bodies) + len(self._static_bodies) != len(self.bodies):
+            self._index_bodies()
+
+    def _refresh_inverse_mass(self) -> None:
+        """Recompute each movable body's cached ``1 / mass`` and ``1 / inertia``.
+
+        Mass and inertia may be edited between steps; motors and the joint/contact
+        solvers then read the cached inverses instead of dividing per impulse.
+        """
+        for body in self._movable_bodies:
+            state = body.state
+            body._inv_mass = 1.0 / max(state.mass, 1e-6)
+            inertia = state.moment_of_inertia
+            body._inv_inertia = 1.0 / inertia if inertia > 0 else 0.0
+
     def _integrate_bodies(self, dt: float) -> None:
+        self._ensure_body_index()
         gx, gy = self.gravity
-        for body in self.bodies.values():
-            if not body.can_move or body.state.mass <= 0:
+        linear_damping = self.linear_damping
+        angular_damping = self.angular_damping
+        every = self.sanitize_every_n_steps
+        sanitize = self.debug_checks or every <= 1 or self.step_index % every == 0
+        for body in self._static_bodies:
+            if body._pending_forces or body._pending_torque:
+                body.clear_impulses()
+        for body in self._movable_bodies:
+            state = body.state
+            mass = state.mass
+            if mass <= 0:
                 body.clear_impulses()
                 continue
-            # gravity
-            body.apply_force((gx * body.state.mass, gy * body.state.mass))
             # simple damping
-            vx, vy = body.state.linear_velocity
-            body.state.linear_velocity = (vx * self.linear_damping, vy * self.linear_damping)
-            body.state.angular_velocity *= self.angular_damping
-            self._sanitize_velocity(body)
-            body.integrate(dt)
-            self._sanitize_pose(body)
+            vx, vy = state.linear_velocity
+            state.linear_velocity = (vx * linear_damping, vy * linear_damping)
+            state.angular_velocity *= angular_damping
+            if sanitize:
+                self._sanitize_velocity(body)
+            # SimObject.integrate inlined; gravity is summed last, as if appended via apply_force
+            forces = body._pending_forces
+            fx = sum(f[0] for f in forces) + gx * mass
+            fy = sum(f[1] for f in forces) + gy * mass
+            vx, vy = state.linear_velocity
+            vx += (fx / mass) * dt
+            vy += (fy / mass) * dt
+            state.linear_velocity = (vx, vy)
+            if state.moment_of_inertia > 0:
+                state.angular_velocity += (body._pending_torque / state.moment_of_inertia) * dt
+            body.pose = state.advance_pose(body.pose, dt)
+            body.clear_impulses()
+            if sanitize:
+                self._sanitize_pose(body)
+
+    def _color_joints(self) -> None:
+        links = [(self.bodies.get(jr.cfg.parent), self.bodies.get(jr.cfg.child)) for jr in self.joints]
+        for jr, color in zip(self.joints, _wavefront_colors(links)):
+            jr.color = color
+        self._joint_order = sorted(self.joints, key=attrgetter("color"))
 
     def _solve_joints(self, dt: float) -> None:
+        if len(self._joint_order) != len(self.joints):
+            self._color_joints()
         # Minimal XPBD distance constraint for hinge anchors (if any)
-        for jr in self.joints:
+        for jr in self._joint_order:
             parent = self.bodies.get(jr.cfg.parent)
             child = self.bodies.get(jr.cfg.child)
             if not parent or not child or not parent.can_move and not child.can_move:
                 continue
             pa = parent.pose.transform_point(jr.cfg.anchor_parent)
             pb = child.pose.transform_point(jr.cfg.anchor_child)
-            dx = pb[0] - pa[0]
-            dy = pb[1] - pa[1]
-            dist = math.hypot(dx, dy)
             target = jr.cfg.upper_limit if jr.cfg.lower_limit == jr.cfg.upper_limit else 0.0
-            error = dist - target
-            if abs(error) < 1e-5:
-                continue
-            n = (dx / (dist + 1e-6), dy / (dist + 1e-6))
-            inv_mass_a = 0.0 if not parent.can_move else 1.0 / max(parent.state.mass, 1e-6)
-            inv_mass_b = 0.0 if not child.can_move else 1.0 / max(child.state.mass, 1e-6)
-            w = inv_mass_a + inv_mass_b
-            if w == 0:
-                continue
-            alpha = 1.0 / (jr.compliance + 1e-9)
-            dlambda = -(error) * alpha / (w + alpha * dt * dt)
+            inv_mass_a = parent._inv_mass
+            inv_mass_b = child._inv_mass
+            dlambda, nx, ny = joint_projection(
+                pa[0], pa[1], pb[0], pb[1], target, inv_mass_a, inv_mass_b, jr.compliance, dt
+            )
             if not math.isfinite(dlambda):
                 continue
             jr.lambda_accum += dlambda
             correction = max(-self.max_penetration_correction, min(self.max_penetration_correction, dlambda))
             if parent.can_move:
-                parent.pose = parent.pose.translated(-n[0] * correction * inv_mass_a, -n[1] * correction * inv_mass_a)
+                parent.pose = parent.pose.translated(-nx * correction * inv_mass_a, -ny * correction * inv_mass_a)
             if child.can_move:
-                child.pose = child.pose.translated(n[0] * correction * inv_mass_b, n[1] * correction * inv_mass_b)
+                child.pose = child.pose.translated(nx * correction * inv_mass_b, ny * correction * inv_mass_b)
 
     def _solve_contacts(self, dt: float) -> None:
-        names = list(self.bodies.keys())
-        for i in range(len(names)):
-            for j in range(i + 1, len(names)):
-                a = self.bodies[names[i]]
-                b = self.bodies[names[j]]
-                if not (a.can_move or b.can_move):
-                    continue
-                manifold = collision_manifold(a.shape, a.pose, b.shape, b.pose)
-                if not manifold:
-                    continue
-                normal = manifold.normal
-                penetration = manifold.penetration
-                inv_mass_a = 0.0 if not a.can_move else 1.0 / max(a.state.mass, 1e-6)
-                inv_mass_b = 0.0 if not b.can_move else 1.0 / max(b.state.mass, 1e-6)
-                inv_mass_sum = inv_mass_a + inv_mass_b
-                if inv_mass_sum == 0:
-                    continue
-                # positional correction (baumgarte-ish)
-                percent = self.contact_correction_percent
-                slop = self.contact_slop
-                correction_mag = max(penetration - slop, 0.0) * percent / inv_mass_sum
-                correction_mag = min(correction_mag, self.max_penetration_correction)
-                if not math.isfinite(correction_mag):
-                    continue
-                correction = (normal[0] * correction_mag, normal[1] * correction_mag)
-                if a.can_move:
-                    a.pose = a.pose.translated(-correction[0] * inv_mass_a, -correction[1] * inv_mass_a)
-                if b.can_move:
-                    b.pose = b.pose.translated(correction[0] * inv_mass_b, correction[1] * inv_mass_b)
-                # relative velocity
-                rvx = a.state.linear_velocity[0] - b.state.linear_velocity[0]
-                rvy = a.state.linear_velocity[1] - b.state.linear_velocity[1]
-                vel_along_normal = rvx * normal[0] + rvy * normal[1]
-                if vel_along_normal > 0 or not math.isfinite(vel_along_normal):
-                    continue
-                restitution = max(getattr(a.material, "restitution", 0.1), getattr(b.material, "restitution", 0.1))
-                restitution = max(0.0, min(1.0, restitution))
-                j = -(1 + restitution) * vel_along_normal
-                j /= inv_mass_sum
-                if not math.isfinite(j):
-                    continue
-                impulse = (j * normal[0], j * normal[1])
-                if a.can_move:
-                    a.state.linear_velocity = (
-                        a.state.linear_velocity[0] - inv_mass_a * impulse[0],
-                        a.state.linear_velocity[1] - inv_mass_a * impulse[1],
-                    )
-                if b.can_move:
-                    b.state.linear_velocity = (
-                        b.state.linear_velocity[0] + inv_mass_b * impulse[0],
-                        b.state.linear_velocity[1] + inv_mass_b * impulse[1],
-                    )
-                # friction (Coulomb)
-                rvx = a.state.linear_velocity[0] - b.state.linear_velocity[0]
-                rvy = a.state.linear_velocity[1] - b.state.linear_velocity[1]
-                tangent = (-normal[1], normal[0])
-                vt = rvx * tangent[0] + rvy * tangent[1]
-                jt = -vt / inv_mass_sum
-                if not math.isfinite(jt):
+        self._ensure_body_index()
+        percent = self.contact_correction_percent
+        slop = self.contact_slop
+        max_correction = self.max_penetration_correction
+        warm = self._warm_impulses if self.contact_warm_start else None
+        step = self.step_index
+        # Pair order within a color is the original (i, j) order; see _wavefront_colors.
+        for a, b, restitution, mu in self._contact_pairs:
+            # Broadphase: disjoint boxes cannot produce a manifold, so skip the narrowphase.
+            a_box, a_verts = a.world_geometry()
+            b_box, b_verts = b.world_geometry()
+            if a_box[2] < b_box[0] or b_box[2] < a_box[0] or a_box[3] < b_box[1] or b_box[3] < a_box[1]:
+                continue
+            # Pairs always hold a movable body, so inv_mass_sum > 0 (no static-static check needed).
+            inv_mass_a = a._inv_mass
+            inv_mass_b = b._inv_mass
+            inv_mass_sum = inv_mass_a + inv_mass_b
+            manifold = collision_manifold(a.shape, a.pose, b.shape, b.pose, a_verts, b_verts)
+            if not manifold:
+                continue
+            normal = manifold.normal
+            # positional correction (baumgarte-ish)
+            correction_mag = contact_correction(manifold.penetration, inv_mass_sum, percent, slop, max_correction)
+            if not math.isfinite(correction_mag):
+                continue
+            correction = (normal[0] * correction_mag, normal[1] * correction_mag)
+            if a.can_move:
+                a.pose = a.pose.translated(-correction[0] * inv_mass_a, -correction[1] * inv_mass_a)
+            if b.can_move:
+                b.pose = b.pose.translated(correction[0] * inv_mass_b, correction[1] * inv_mass_b)
+            # restitution + friction impulses (pair coefficients precomputed in _index_bodies)
+            vax, vay = a.state.linear_velocity
+            vbx, vby = b.state.linear_velocity
+            prev = None
+            if warm is not None:
+                key = (id(a), id(b))
+                prev = warm.get(key)
+            if prev is not None:
+                # Persistent contact: clamped accumulated impulses instead of a fresh bounce.
+                vax, vay, vbx, vby, jn, jt = contact_warm_impulse(
+                    normal[0], normal[1], vax, vay, vbx, vby,
+                    inv_mass_a, inv_mass_b, inv_mass_sum, mu, prev[0], prev[1],
+                )
+                stage = 2 if jn > 0.0 else 0
+            else:
+                stage, vax, vay, vbx, vby, jn, jt = contact_impulse(
+                    normal[0], normal[1], vax, vay, vbx, vby,
+                    inv_mass_a, inv_mass_b, inv_mass_sum, restitution, mu,
+                )
+                if stage == 0:
                     continue
-                mu = 0.5 * (getattr(a.material, "friction", 0.6) + getattr(b.material, "friction", 0.6))
-                jt_limit = mu * abs(j)
-                jt = max(-jt_limit, min(jt_limit, jt))
-                t_impulse = (jt * tangent[0], jt * tangent[1])
-                if a.can_move:
-                    a.state.linear_velocity = (
-                        a.state.linear_velocity[0] - inv_mass_a * t_impulse[0],
-                        a.state.linear_velocity[1] - inv_mass_a * t_impulse[1],
-                    )
-                if b.can_move:
-                    b.state.linear_velocity = (
-                        b.state.linear_velocity[0] + inv_mass_b * t_impulse[0],
-                        b.state.linear_velocity[1] + inv_mass_b * t_impulse[1],
-                    )
-                if a.can_move:
-                    self._sanitize_velocity(a)
-                if b.can_move:
-                    self._sanitize_velocity(b)
+            if a.can_move:
+                a.state.linear_velocity = (vax, vay)
+            if b.can_move:
+                b.state.linear_velocity = (vbx, vby)
+            if warm is not None and stage:
+                warm[key] = (jn, jt, step)
+            if stage != 2 and prev is None:
+                continue
+            if a.can_move:
+                self._sanitize_velocity(a)
+            if b.can_move:
+                self._sanitize_velocity(b)
+        if warm:
+            # Age out pairs that were not in contact this step.
+            for key in [k for k, v in warm.items() if v[2] != step]:
+                del warm[key]
 
     # --- Snapshot --------------------------------------------------------
     def snapshot(self) -> SnapshotState:
@@ -711,33 +1051,68 @@ class Simulator:
                 "lin_vel": body.state.linear_velocity,
                 "ang_vel": body.state.angular_velocity,
             }
-        ctrl_state = None
-        if self.controller_instance and hasattr(self.controller_instance, "get_state"):
-            try:
-                ctrl_state = self.controller_instance.get_state()
-            except Exception:
-                ctrl_state = None
         return SnapshotState(
             time=self.time,
             step=self.step_index,
             bodies=body_state,
-            controller_state=ctrl_state,
+            controller_state=self._controller_snapshot_state(),
         )
 
     def apply_snapshot(self, snap: SnapshotState) -> None:
         self.time = snap.time
         self.step_index = snap.step
+        bodies = self.bodies
         for name, s in snap.bodies.items():
-            if name not in self.bodies:
+            body = bodies.get(name)
+            if body is None:
                 continue
-            body = self.bodies[name]
             pose = s.get("pose", {})
-            body.pose = Pose2D(pose.get("x", 0.0), pose.get("y", 0.0), pose.get("theta", 0.0))
-            body.state.linear_velocity = tuple(s.get("lin_vel", (0.0, 0.0)))  # type: ignore
-            body.state.angular_velocity = float(s.get("ang_vel", 0.0))
-        if self.controller_instance and snap.controller_state and hasattr(self.controller_instance, "set_state"):
+            self._restore_body(
+                body,
+                pose.get("x", 0.0),
+                pose.get("y", 0.0),
+                pose.get("theta", 0.0),
+                tuple(s.get("lin_vel", (0.0, 0.0))),  # type: ignore[arg-type]
+                float(s.get("ang_vel", 0.0)),
+            )
+        self._restore_controller_state(snap.controller_state)
+
+    @staticmethod
+    def _restore_body(
+        body: SimObject, x: float, y: float, theta: float, lin_vel: Tuple[float, float], ang_vel: float
+    ) -> None:
+        current = body.pose
+        # Keep the pose object when it already matches (always, for static bodies) so the
+        # geometry caches keyed on pose identity survive a rewind.
+        if current.x != x or current.y != y or current.theta != theta:
+            body.pose = Pose2D(x, y, theta)
+        body.state.linear_velocity = lin_vel
+        body.state.angular_velocity = ang_vel
+
+    def _state_hooks(self) -> Tuple[Optional[Callable], Optional[Callable]]:
+        """The controller's ``get_state``/``set_state`` (or None), looked up once per instance."""
+        instance = self.controller_instance
+        cached_instance, get_state, set_state = self._controller_state_hooks
+        if cached_instance is not instance:
+            get_state = getattr(instance, "get_state", None) if instance else None
+            set_state = getattr(instance, "set_state", None) if instance else None
+            self._controller_state_hooks = (instance, get_state, set_state)
+        return get_state, set_state
+
+    def _controller_snapshot_state(self) -> Optional[Dict[str, object]]:
+        get_state = self._state_hooks()[0]
+        if get_state is not None:
             try:
-                self.controller_instance.set_state(snap.controller_state)
+                return get_state()
+            except Exception:
+                return None
+        return None
+
+    def _restore_controller_state(self, state: Optional[Dict[str, object]]) -> None:
+        set_state = self._state_hooks()[1]
+        if set_state is not None and state:
+            try:
+                set_state(state)
             except Exception:
                 pass
 
@@ -755,19 +1130,20 @@ class Simulator:
         """Move the robot bodies to a new spawn pose; optionally update default spawn."""
         if not self.robot_cfg:
             return
+        # Read the config on every call (designs can change between resets), but keep the
+        # per-body work to one lookup, three adds and one Pose2D.
+        sx, sy, stheta = spawn_pose[0], spawn_pose[1], spawn_pose[2]
+        bodies = self.bodies
         for body_cfg in self.robot_cfg.bodies:
-            body = self.bodies.get(body_cfg.name)
+            body = bodies.get(body_cfg.name)
             if not body:
                 continue
-            pose_tuple = (
-                body_cfg.pose[0] + spawn_pose[0],
-                body_cfg.pose[1] + spawn_pose[1],
-                body_cfg.pose[2] + spawn_pose[2],
-            )
-            body.pose = _pose_from_tuple(pose_tuple)
+            ox, oy, otheta = body_cfg.pose[0], body_cfg.pose[1], body_cfg.pose[2]
+            body.pose = Pose2D(ox + sx, oy + sy, otheta + stheta)
             if zero_velocity:
-                body.state.linear_velocity = (0.0, 0.0)
-                body.state.angular_velocity = 0.0
+                state = body.state
+                state.linear_velocity = (0.0, 0.0)
+                state.angular_velocity = 0.0
                 body.clear_impulses()
         if set_as_spawn:
             self.robot_cfg.spawn_pose = spawn_pose
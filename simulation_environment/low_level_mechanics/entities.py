@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import math
 from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
-from .geometry import BoundingBox, Shape2D
+from .geometry import BoundingBox, Polygon, Shape2D
 from .materials import MaterialProperties
 from .world import Pose2D
 
@@ -31,6 +32,30 @@ class DynamicState:
 class SimObject:
     """Physical or logical object placed into the world."""
 
+    # Fixed attribute set: no per-instance __dict__, and slot reads on the step path.
+    __slots__ = (
+        "name",
+        "pose",
+        "shape",
+        "material",
+        "can_move",
+        "state",
+        "metadata",
+        "world",
+        "_pending_forces",
+        "_pending_torque",
+        "_components",
+        "_inv_mass",
+        "_inv_inertia",
+        "_geom_pose",
+        "_geom_shape",
+        "_geom",
+        "_trig_pose",
+        "_trig",
+        "_inv_pose",
+        "_inv_frame",
+    )
+
     def __init__(
         self,
         *,
@@ -53,6 +78,23 @@ class SimObject:
         self._pending_forces: List[Tuple[float, float]] = []
         self._pending_torque: float = 0.0
         self._components: List[Any] = []
+        # 1 / mass and 1 / inertia for solvers, 0.0 for static bodies; kept current by the simulator each step
+        self._inv_mass: float = 1.0 / max(self.state.mass, 1e-6) if can_move else 0.0
+        inertia = self.state.moment_of_inertia
+        self._inv_inertia: float = 1.0 / inertia if can_move and inertia > 0 else 0.0
+        # world_geometry() cache, valid while pose/shape are the same objects
+        self._geom_pose: Optional[Pose2D] = None
+        self._geom_shape: Optional[Shape2D] = None
+        # heading_trig() cache: pose it was computed for and that pose's (cos, sin)
+        self._trig_pose: Optional[Pose2D] = None
+        self._trig: Tuple[float, float] = (1.0, 0.0)
+        # contains_point() cache: pose it was built for and that pose's inverse as (x, y, cos, sin)
+        self._inv_pose: Optional[Pose2D] = None
+        self._inv_frame: Tuple[float, float, float, float] = (0.0, 0.0, 1.0, 0.0)
+        self._geom: Tuple[Tuple[float, float, float, float], Optional[List[Tuple[float, float]]]] = (
+            (0.0, 0.0, 0.0, 0.0),
+            None,
+        )
 
     def on_added_to_world(self, world: Any) -> None:
         self.world = world
@@ -125,9 +167,62 @@ class SimObject:
     def bounding_box(self) -> BoundingBox:
         return self.shape.bounding_box(self.pose)
 
+    def world_geometry(self) -> Tuple[Tuple[float, float, float, float], Optional[List[Tuple[float, float]]]]:
+        """World AABB ``(min_x, min_y, max_x, max_y)`` and polygon world vertices (None for circles).
+
+        Poses are immutable and every move assigns a new one, so the result is cached
+        until ``pose`` or ``shape`` is reassigned: static bodies transform once, and
+        contacts and sensors share one transform per body per move.
+        """
+        pose = self.pose
+        shape = self.shape
+        if self._geom_pose is pose and self._geom_shape is shape:
+            return self._geom
+        if isinstance(shape, Polygon):
+            verts = shape._world_vertices(pose)
+            xs = [v[0] for v in verts]
+            ys = [v[1] for v in verts]
+            box = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            verts = None
+            bb = shape.bounding_box(pose)
+            box = (bb.min_x, bb.min_y, bb.max_x, bb.max_y)
+        self._geom_pose = pose
+        self._geom_shape = shape
+        self._geom = (box, verts)
+        return self._geom
+
     def overlaps_with(self, other: "SimObject") -> bool:
         return self.shape.intersects(other.shape, self.pose, other.pose)
 
+    def heading_trig(self) -> Tuple[float, float]:
+        """``(cos, sin)`` of ``pose.theta``, computed once per pose object.
+
+        Several components on one body (e.g. each wheel motor) can share the trig.
+        """
+        pose = self.pose
+        if self._trig_pose is not pose:
+            self._trig = (math.cos(pose.theta), math.sin(pose.theta))
+            self._trig_pose = pose
+        return self._trig
+
+    def contains_point(self, point: Tuple[float, float]) -> bool:
+        """``shape.contains_point(point, pose)`` with the inverse transform baked per pose.
+
+        Polygons are tested in their local frame; the inverse pose and its cos/sin are
+        computed once per pose object (i.e. once for static bodies) instead of per query.
+        """
+        shape = self.shape
+        if not isinstance(shape, Polygon):
+            return shape.contains_point(point, self.pose)
+        if self._inv_pose is not self.pose:
+            inv = self.pose.inverse()
+            self._inv_frame = (inv.x, inv.y, math.cos(inv.theta), math.sin(inv.theta))
+            self._inv_pose = self.pose
+        ix, iy, cos_t, sin_t = self._inv_frame
+        px, py = point
+        return shape.contains_point((ix + cos_t * px - sin_t * py, iy + sin_t * px + cos_t * py))
+
     def material_field(self, field_name: str, default: float = 0.0) -> float:
         return self.material.field_value(field_name, default)
 
@@ -206,21 +206,30 @@ class CollisionManifold:
 
 
 def collision_manifold(
-    shape_a: Shape2D, pose_a: Pose2D, shape_b: Shape2D, pose_b: Pose2D
+    shape_a: Shape2D,
+    pose_a: Pose2D,
+    shape_b: Shape2D,
+    pose_b: Pose2D,
+    verts_a: Optional[List[Point2D]] = None,
+    verts_b: Optional[List[Point2D]] = None,
 ) -> Optional[CollisionManifold]:
-    """Compute a simple manifold (normal points from A to B)."""
+    """Compute a simple manifold (normal points from A to B).
+
+    ``verts_a``/``verts_b`` may carry precomputed world vertices of polygon shapes
+    (``_world_vertices(pose)``) so callers can reuse them across steps.
+    """
     if isinstance(shape_a, Circle) and isinstance(shape_b, Circle):
         return _circle_vs_circle_manifold(shape_a, pose_a, shape_b, pose_b)
     if isinstance(shape_a, Circle) and isinstance(shape_b, Polygon):
-        return _circle_vs_polygon_manifold(shape_a, pose_a, shape_b, pose_b)
+        return _circle_vs_polygon_manifold(shape_a, pose_a, shape_b, pose_b, verts_b)
     if isinstance(shape_a, Polygon) and isinstance(shape_b, Circle):
-        manifold = _circle_vs_polygon_manifold(shape_b, pose_b, shape_a, pose_a)
+        manifold = _circle_vs_polygon_manifold(shape_b, pose_b, shape_a, pose_a, verts_a)
         if manifold:
             n = manifold.normal
             return CollisionManifold(normal=(-n[0], -n[1]), penetration=manifold.penetration, contact_point=manifold.contact_point)
         return None
     if isinstance(shape_a, Polygon) and isinstance(shape_b, Polygon):
-        return _polygon_vs_polygon_manifold(shape_a, pose_a, shape_b, pose_b)
+        return _polygon_vs_polygon_manifold(shape_a, pose_a, shape_b, pose_b, verts_a, verts_b)
     return None
 
 
@@ -242,8 +251,15 @@ def _circle_vs_circle_manifold(a: Circle, pose_a: Pose2D, b: Circle, pose_b: Pos
     return CollisionManifold(normal=normal, penetration=penetration, contact_point=contact)
 
 
-def _circle_vs_polygon_manifold(circle: Circle, pose_circle: Pose2D, polygon: Polygon, pose_polygon: Pose2D) -> Optional[CollisionManifold]:
-    world_verts = polygon._world_vertices(pose_polygon)
+def _circle_vs_polygon_manifold(
+    circle: Circle,
+    pose_circle: Pose2D,
+    polygon: Polygon,
+    pose_polygon: Pose2D,
+    world_verts: Optional[List[Point2D]] = None,
+) -> Optional[CollisionManifold]:
+    if world_verts is None:
+        world_verts = polygon._world_vertices(pose_polygon)
     center = (pose_circle.x, pose_circle.y)
     closest_dist = float("inf")
     closest_point = None
@@ -283,9 +299,18 @@ def _circle_vs_polygon_manifold(circle: Circle, pose_circle: Pose2D, polygon: Po
     return CollisionManifold(normal=normal, penetration=penetration, contact_point=contact)
 
 
-def _polygon_vs_polygon_manifold(a: Polygon, pose_a: Pose2D, b: Polygon, pose_b: Pose2D) -> Optional[CollisionManifold]:
-    verts_a = a._world_vertices(pose_a)
-    verts_b = b._world_vertices(pose_b)
+def _polygon_vs_polygon_manifold(
+    a: Polygon,
+    pose_a: Pose2D,
+    b: Polygon,
+    pose_b: Pose2D,
+    verts_a: Optional[List[Point2D]] = None,
+    verts_b: Optional[List[Point2D]] = None,
+) -> Optional[CollisionManifold]:
+    if verts_a is None:
+        verts_a = a._world_vertices(pose_a)
+    if verts_b is None:
+        verts_b = b._world_vertices(pose_b)
     penetration = float("inf")
     best_axis = None
     best_point = None
@@ -4,13 +4,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 import random
+import sys
 from typing import Dict, Iterable, Iterator, MutableMapping, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - only for static analyzers
     from .entities import SimObject
 
 
-@dataclass(frozen=True)
+# Slots (3.10+) drop the per-instance __dict__: poses are created every step for every moving
+# body, and the persisted configs and joint state use the same decorators. Plain dataclasses before 3.10.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+slotted_dataclass = dataclass(**_SLOTS)
+frozen_slotted_dataclass = dataclass(frozen=True, **_SLOTS)
+
+
+@frozen_slotted_dataclass
 class Pose2D:
     """A 2D pose with translation (meters) and rotation (radians)."""
 
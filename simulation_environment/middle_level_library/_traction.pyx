@@ -0,0 +1,106 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O2 -ffp-contract=off
+"""Optional compiled twin of ``_traction_kernels.wheel_traction``.
+
+Build in place with ``cythonize -i middle_level_library/_traction.pyx``; the
+kernels module picks it up when importable. Same arguments, return tuple and
+arithmetic order as the Python kernel. ``max``/``min`` are spelled out with
+Python's tie/NaN rules and FP contraction is off, so results stay bit-identical.
+"""
+
+from libc.math cimport fabs
+
+
+cdef inline double _max(double a, double b) noexcept nogil:
+    return b if b > a else a
+
+
+cdef inline double _min(double a, double b) noexcept nogil:
+    return b if b < a else a
+
+
+cpdef tuple wheel_traction(
+    double inv_mass,
+    double inv_inertia,
+    double px,
+    double py,
+    double vx,
+    double vy,
+    double omega,
+    double cx,
+    double cy,
+    double fx,
+    double fy,
+    double preferred_speed,
+    double drive_impulse_cap,
+    double mu_long,
+    double mu_lat,
+    double normal_load,
+    double lateral_damping,
+    double dt,
+):
+    cdef double lx, ly, max_long_impulse, max_lat_impulse, drive_cap, rx, ry
+    cdef double vcx, vcy, v_long, v_lat, slip_denom, slip_ratio
+    cdef double j_lat = 0.0
+    cdef double desired_impulse = 0.0
+    cdef double j_drive = 0.0
+    cdef double r_cross_n, inv_mass_lat, inv_mass_long, target_j_lat, long_limit, lat_ratio
+    cdef double jx, jy, v_post
+
+    normal_load = _max(normal_load, 0.0)
+    lateral_damping = lateral_damping if lateral_damping < 1.0 else 1.0
+    lateral_damping = lateral_damping if lateral_damping > 0.0 else 0.0
+    lx = -fy
+    ly = fx
+    max_long_impulse = _max(0.0, fabs(mu_long) * normal_load * dt)
+    max_lat_impulse = _max(0.0, fabs(mu_lat) * normal_load * dt)
+    drive_cap = _max(0.0, fabs(drive_impulse_cap))
+    rx = cx - px
+    ry = cy - py
+
+    vcx = vx - omega * ry
+    vcy = vy + omega * rx
+    v_long = vcx * fx + vcy * fy
+    v_lat = vcx * lx + vcy * ly
+    slip_denom = _max(_max(fabs(preferred_speed), fabs(v_long)), 0.05)
+    slip_ratio = (preferred_speed - v_long) / slip_denom
+
+    # Lateral slip correction (constraint-like)
+    if max_lat_impulse > 0.0 and fabs(v_lat) > 1e-6:
+        r_cross_n = rx * ly - ry * lx
+        inv_mass_lat = inv_mass + (r_cross_n * r_cross_n) * inv_inertia
+        if inv_mass_lat > 1e-9:
+            target_j_lat = -v_lat / inv_mass_lat
+            target_j_lat *= (1.0 - lateral_damping)
+            j_lat = target_j_lat if target_j_lat < max_lat_impulse else max_lat_impulse
+            j_lat = j_lat if j_lat > -max_lat_impulse else -max_lat_impulse
+            if inv_mass > 0.0:
+                jx = lx * j_lat
+                jy = ly * j_lat
+                vx = vx + jx * inv_mass
+                vy = vy + jy * inv_mass
+                omega += (rx * jy - ry * jx) * inv_inertia
+
+    # Longitudinal drive toward preferred speed with traction + drive caps
+    r_cross_n = rx * fy - ry * fx
+    inv_mass_long = inv_mass + (r_cross_n * r_cross_n) * inv_inertia
+    if inv_mass_long > 1e-9:
+        desired_impulse = (preferred_speed - v_long) / inv_mass_long
+        long_limit = max_long_impulse
+        if max_long_impulse > 0.0 and max_lat_impulse > 0.0:
+            lat_ratio = _min(1.0, fabs(j_lat) / (max_lat_impulse + 1e-9))
+            long_limit = max_long_impulse * _max(0.0, 1.0 - 0.5 * lat_ratio)
+        if drive_cap > 0.0:
+            long_limit = _min(long_limit, drive_cap) if long_limit > 0.0 else drive_cap
+        if long_limit > 0.0:
+            j_drive = desired_impulse if desired_impulse < long_limit else long_limit
+            j_drive = j_drive if j_drive > -long_limit else -long_limit
+            if j_drive != 0.0 and inv_mass > 0.0:
+                jx = fx * j_drive
+                jy = fy * j_drive
+                vx = vx + jx * inv_mass
+                vy = vy + jy * inv_mass
+                omega += (rx * jy - ry * jx) * inv_inertia
+
+    v_post = (vx - omega * ry) * fx + (vy + omega * rx) * fy
+    return vx, vy, omega, slip_ratio, v_lat, v_long, v_post, desired_impulse, j_drive, j_lat, normal_load
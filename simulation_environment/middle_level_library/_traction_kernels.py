@@ -0,0 +1,118 @@
+"""Scalar wheel-traction kernel used by the wheel motors.
+
+Plain float math only, so it compiles under Numba when it is installed and runs
+as ordinary Python otherwise. Arithmetic order matches the original per-helper
+code (contact velocity, effective mass, impulse application), which keeps the
+two paths bit-identical; ``fastmath`` is deliberately off for the same reason.
+When the optional ``_traction`` extension has been built it replaces the kernel.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+try:  # optional: compile the per-wheel math to native code
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def wheel_traction(
+    inv_mass: float,
+    inv_inertia: float,
+    px: float,
+    py: float,
+    vx: float,
+    vy: float,
+    omega: float,
+    cx: float,
+    cy: float,
+    fx: float,
+    fy: float,
+    preferred_speed: float,
+    drive_impulse_cap: float,
+    mu_long: float,
+    mu_lat: float,
+    normal_load: float,
+    lateral_damping: float,
+    dt: float,
+) -> Tuple[float, float, float, float, float, float, float, float, float, float, float]:
+    """Track ``preferred_speed`` at contact ``(cx, cy)`` on a movable body at ``(px, py)``.
+
+    ``inv_mass``/``inv_inertia`` are the body's cached inverses (0.0 for a massless
+    body or no rotational inertia), so the kernel does no division by them.
+    ``(fx, fy)`` is the unit drive direction.
+
+    Returns the body's new ``(vx, vy, omega)`` followed by ``slip_ratio,
+    lateral_slip, contact_speed, contact_speed_after, desired_impulse, j_drive,
+    j_lat, normal_load``.
+    """
+    normal_load = max(normal_load, 0.0)
+    # Clamps below are max(lo, min(hi, v)) written as compares (same result, NaN -> hi).
+    lateral_damping = lateral_damping if lateral_damping < 1.0 else 1.0
+    lateral_damping = lateral_damping if lateral_damping > 0.0 else 0.0
+    lx = -fy
+    ly = fx
+    max_long_impulse = max(0.0, abs(mu_long) * normal_load * dt)
+    max_lat_impulse = max(0.0, abs(mu_lat) * normal_load * dt)
+    drive_cap = max(0.0, abs(drive_impulse_cap))
+    rx = cx - px
+    ry = cy - py
+    vcx = vx - omega * ry
+    vcy = vy + omega * rx
+    v_long = vcx * fx + vcy * fy
+    v_lat = vcx * lx + vcy * ly
+    slip_denom = max(abs(preferred_speed), abs(v_long), 0.05)
+    slip_ratio = (preferred_speed - v_long) / slip_denom
+
+    # Lateral slip correction (constraint-like)
+    j_lat = 0.0
+    if max_lat_impulse > 0.0 and abs(v_lat) > 1e-6:
+        r_cross_n = rx * ly - ry * lx
+        inv_mass_lat = inv_mass + (r_cross_n * r_cross_n) * inv_inertia
+        if inv_mass_lat > 1e-9:
+            target_j_lat = -v_lat / inv_mass_lat
+            target_j_lat *= (1.0 - lateral_damping)
+            j_lat = target_j_lat if target_j_lat < max_lat_impulse else max_lat_impulse
+            j_lat = j_lat if j_lat > -max_lat_impulse else -max_lat_impulse
+            if inv_mass > 0.0:
+                jx = lx * j_lat
+                jy = ly * j_lat
+                vx = vx + jx * inv_mass
+                vy = vy + jy * inv_mass
+                omega += (rx * jy - ry * jx) * inv_inertia
+
+    # Longitudinal drive toward preferred speed with traction + drive caps
+    r_cross_n = rx * fy - ry * fx
+    inv_mass_long = inv_mass + (r_cross_n * r_cross_n) * inv_inertia
+    desired_impulse = 0.0
+    j_drive = 0.0
+    if inv_mass_long > 1e-9:
+        desired_impulse = (preferred_speed - v_long) / inv_mass_long
+        long_limit = max_long_impulse
+        if max_long_impulse > 0.0 and max_lat_impulse > 0.0:
+            lat_ratio = min(1.0, abs(j_lat) / (max_lat_impulse + 1e-9))
+            long_limit = max_long_impulse * max(0.0, 1.0 - 0.5 * lat_ratio)
+        if drive_cap > 0.0:
+            long_limit = min(long_limit, drive_cap) if long_limit > 0.0 else drive_cap
+        if long_limit > 0.0:
+            j_drive = desired_impulse if desired_impulse < long_limit else long_limit
+            j_drive = j_drive if j_drive > -long_limit else -long_limit
+            if j_drive != 0.0 and inv_mass > 0.0:
+                jx = fx * j_drive
+                jy = fy * j_drive
+                vx = vx + jx * inv_mass
+                vy = vy + jy * inv_mass
+                omega += (rx * jy - ry * jx) * inv_inertia
+
+    v_post = (vx - omega * ry) * fx + (vy + omega * rx) * fy
+    return vx, vy, omega, slip_ratio, v_lat, v_long, v_post, desired_impulse, j_drive, j_lat, normal_load
+
+
+try:  # optional: prebuilt Cython twin (see _traction.pyx) beats numba's per-call dispatch
+    from ._traction import wheel_traction  # type: ignore[no-redef]  # noqa: F811
+except ImportError:
+    pass
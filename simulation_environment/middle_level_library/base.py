@@ -39,6 +39,9 @@ class SensorReading:
 class MountedComponent:
     """Base class for things that mount onto a SimObject."""
 
+    # Subclasses without __slots__ (e.g. sensors) still get a __dict__.
+    __slots__ = ("name", "mount_pose", "parent")
+
     def __init__(self, name: str, mount_pose: Pose2D | None = None) -> None:
         self.name = name
         self.mount_pose = mount_pose or Pose2D(0.0, 0.0, 0.0)
@@ -109,6 +112,8 @@ class Sensor(MountedComponent):
 class Motor(MountedComponent):
     """Base motor/actuator interface."""
 
+    __slots__ = ("max_command", "_last_command", "last_report", "_last_report_step")
+
     def __init__(
         self,
         name: str,
@@ -8,47 +8,36 @@ from typing import Optional
 from low_level_mechanics.world import Pose2D, World
 from low_level_mechanics.entities import SimObject
 
+from ._traction_kernels import wheel_traction
 from .base import Motor
 from .presets import WHEEL_PRESETS, WheelMotorPreset
 
 
-def _apply_impulse(body: SimObject, impulse: tuple[float, float], contact_point: tuple[float, float]) -> None:
-    """Apply an impulse at a world point, updating linear and angular velocity."""
-    if not body.can_move or body.state.mass <= 0:
-        return
-    inv_mass = 1.0 / max(body.state.mass, 1e-9)
-    inv_inertia = 0.0 if body.state.moment_of_inertia <= 0 else 1.0 / body.state.moment_of_inertia
-    rx = contact_point[0] - body.pose.x
-    ry = contact_point[1] - body.pose.y
-    jx, jy = impulse
-    vx, vy = body.state.linear_velocity
-    body.state.linear_velocity = (vx + jx * inv_mass, vy + jy * inv_mass)
-    body.state.angular_velocity += (rx * jy - ry * jx) * inv_inertia
+def _wheel_frame(parent: SimObject, mount: Pose2D) -> tuple[float, float, float, float]:
+    """World contact point and drive direction ``(cx, cy, fx, fy)`` of a wheel.
 
-
-def _contact_velocity(body: SimObject, contact_point: tuple[float, float]) -> tuple[float, float]:
-    """Compute the velocity of a world-space contact point on the body."""
-    vx, vy = body.state.linear_velocity
-    omega = body.state.angular_velocity
-    rx = contact_point[0] - body.pose.x
-    ry = contact_point[1] - body.pose.y
-    return (vx - omega * ry, vy + omega * rx)
-
-
-def _inv_mass_term(body: SimObject, contact_point: tuple[float, float], axis: tuple[float, float]) -> float:
-    """Effective inverse mass along an axis at a contact point (2D rigid body)."""
-    inv_mass = 0.0 if not body.can_move or body.state.mass <= 0 else 1.0 / body.state.mass
-    inv_inertia = 0.0 if body.state.moment_of_inertia <= 0 else 1.0 / body.state.moment_of_inertia
-    rx = contact_point[0] - body.pose.x
-    ry = contact_point[1] - body.pose.y
-    r_cross_n = rx * axis[1] - ry * axis[0]
-    return inv_mass + (r_cross_n * r_cross_n) * inv_inertia
+    ``parent.pose.compose(mount)`` inlined: reuses the parent's cached heading trig
+    (shared by every wheel on the body) and builds no Pose2D or nested tuples; an
+    unrotated mount needs no trig of its own.
+    """
+    pose = parent.pose
+    cos_t, sin_t = parent.heading_trig()
+    mx = mount.x
+    my = mount.y
+    cx = pose.x + cos_t * mx - sin_t * my
+    cy = pose.y + sin_t * mx + cos_t * my
+    if mount.theta == 0.0:
+        return cx, cy, cos_t, sin_t
+    theta = pose.theta + mount.theta
+    return cx, cy, math.cos(theta), math.sin(theta)
 
 
 def _solve_wheel_traction(
     body: SimObject,
-    contact_point: tuple[float, float],
-    forward: tuple[float, float],
+    cx: float,
+    cy: float,
+    fx: float,
+    fy: float,
     preferred_speed: float,
     drive_impulse_cap: float,
     *,
@@ -58,7 +47,10 @@ def _solve_wheel_traction(
     lateral_damping: float,
     dt: float,
 ) -> "TractionReport":
-    """Track a preferred tangential speed with friction/traction-limited impulses."""
+    """Track a preferred tangential speed with friction/traction-limited impulses.
+
+    ``(cx, cy)`` is the world contact point and ``(fx, fy)`` the unit drive direction.
+    """
     preferred_speed = float(preferred_speed)
     if not body.can_move:
         return TractionReport(
@@ -74,48 +66,50 @@ def _solve_wheel_traction(
             applied_lateral_impulse=0.0,
             normal_load=normal_load,
         )
-    normal_load = max(normal_load, 0.0)
-    lateral_damping = _clamp(lateral_damping, 0.0, 1.0)
-    lateral = (-forward[1], forward[0])
-    max_long_impulse = max(0.0, abs(mu_long) * normal_load * dt)
-    max_lat_impulse = max(0.0, abs(mu_lat) * normal_load * dt)
-    drive_cap = max(0.0, abs(drive_impulse_cap))
-
-    vcx, vcy = _contact_velocity(body, contact_point)
-    v_long = vcx * forward[0] + vcy * forward[1]
-    v_lat = vcx * lateral[0] + vcy * lateral[1]
-    slip_denom = max(abs(preferred_speed), abs(v_long), 0.05)
-    slip_ratio = (preferred_speed - v_long) / slip_denom
-
-    # Lateral slip correction (constraint-like)
-    j_lat = 0.0
-    if max_lat_impulse > 0.0 and abs(v_lat) > 1e-6:
-        inv_mass_lat = _inv_mass_term(body, contact_point, lateral)
-        if inv_mass_lat > 1e-9:
-            target_j_lat = -v_lat / inv_mass_lat
-            target_j_lat *= (1.0 - lateral_damping)
-            j_lat = _clamp(target_j_lat, -max_lat_impulse, max_lat_impulse)
-            _apply_impulse(body, (lateral[0] * j_lat, lateral[1] * j_lat), contact_point)
-
-    # Longitudinal drive toward preferred speed with traction + drive caps
-    inv_mass_long = _inv_mass_term(body, contact_point, forward)
-    desired_impulse = 0.0
-    j_drive = 0.0
-    if inv_mass_long > 1e-9:
-        desired_impulse = (preferred_speed - v_long) / inv_mass_long
-        long_limit = max_long_impulse
-        if max_long_impulse > 0.0 and max_lat_impulse > 0.0:
-            lat_ratio = min(1.0, abs(j_lat) / (max_lat_impulse + 1e-9))
-            long_limit = max_long_impulse * max(0.0, 1.0 - 0.5 * lat_ratio)
-        if drive_cap > 0.0:
-            long_limit = min(long_limit, drive_cap) if long_limit > 0.0 else drive_cap
-        if long_limit > 0.0:
-            j_drive = _clamp(desired_impulse, -long_limit, long_limit)
-            if j_drive != 0.0:
-                _apply_impulse(body, (forward[0] * j_drive, forward[1] * j_drive), contact_point)
-
-    v_post_long = _contact_velocity(body, contact_point)
-    v_post = v_post_long[0] * forward[0] + v_post_long[1] * forward[1]
+    state = body.state
+    vx, vy = state.linear_velocity
+    if preferred_speed == 0.0 and vx == 0.0 and vy == 0.0 and state.angular_velocity == 0.0:
+        # Idle wheel on a body at rest: zero contact speed, so no slip and no impulse.
+        return TractionReport(
+            step=None,
+            slip_ratio=0.0,
+            lateral_slip=0.0,
+            wheel_speed=preferred_speed,
+            preferred_speed=preferred_speed,
+            contact_speed=0.0,
+            contact_speed_after=0.0,
+            desired_longitudinal_impulse=0.0,
+            applied_longitudinal_impulse=0.0,
+            applied_lateral_impulse=0.0,
+            normal_load=max(normal_load, 0.0),
+        )
+    pose = body.pose
+    # One kernel call per wheel: locals in, updated velocity and telemetry out.
+    (
+        vx, vy, omega, slip_ratio, v_lat, v_long, v_post, desired_impulse, j_drive, j_lat, normal_load
+    ) = wheel_traction(
+        body._inv_mass if state.mass > 0 else 0.0,
+        body._inv_inertia,
+        pose.x,
+        pose.y,
+        vx,
+        vy,
+        state.angular_velocity,
+        cx,
+        cy,
+        fx,
+        fy,
+        preferred_speed,
+        drive_impulse_cap,
+        mu_long,
+        mu_lat,
+        normal_load,
+        lateral_damping,
+        dt,
+    )
+    if j_lat != 0.0 or j_drive != 0.0:
+        state.linear_velocity = (vx, vy)
+        state.angular_velocity = omega
 
     return TractionReport(
         step=None,
@@ -152,6 +146,20 @@ class TractionReport:
 class WheelMotor(Motor):
     """Applies a longitudinal force along the wheel's heading with traction limits."""
 
+    __slots__ = (
+        "max_force",
+        "mu_long",
+        "mu_lat",
+        "g_equiv",
+        "normal_force",
+        "lateral_damping",
+        "wheel_count",
+        "wheel_radius",
+        "response_time",
+        "max_wheel_omega",
+        "angular_speed",
+    )
+
     def __init__(
         self,
         name: str,
@@ -183,22 +191,25 @@ class WheelMotor(Motor):
         self.last_report: Optional[TractionReport] = None
 
     def _apply(self, value: float, world: World, dt: float) -> None:
-        if not self.parent or not self.parent.can_move:
+        parent = self.parent
+        if not parent or not parent.can_move:
             return
-        pose = self.parent.pose.compose(self.mount_pose)
-        direction = (math.cos(pose.theta), math.sin(pose.theta))
+        cx, cy, fx, fy = _wheel_frame(parent, self.mount_pose)
         normal_load = self.normal_force
         if normal_load is None:
-            normal_load = self.parent.state.mass * self.g_equiv / float(max(self.wheel_count, 1))
+            normal_load = parent.state.mass * self.g_equiv / float(max(self.wheel_count, 1))
         blend = min(1.0, dt / self.response_time)
         target_omega = value * self.max_wheel_omega
-        self.angular_speed += (target_omega - self.angular_speed) * blend
-        wheel_speed = self.angular_speed * self.wheel_radius
+        angular_speed = self.angular_speed
+        angular_speed += (target_omega - angular_speed) * blend
+        wheel_speed = angular_speed * self.wheel_radius
         drive_impulse_cap = abs(self.max_force) * dt
         report = _solve_wheel_traction(
-            self.parent,
-            (pose.x, pose.y),
-            direction,
+            parent,
+            cx,
+            cy,
+            fx,
+            fy,
             wheel_speed,
             drive_impulse_cap,
             mu_long=self.mu_long,
@@ -208,10 +219,11 @@ class WheelMotor(Motor):
             dt=dt,
         )
         traction_ratio = 0.0
-        if abs(report.desired_longitudinal_impulse) > 1e-9:
-            traction_ratio = min(1.0, abs(report.applied_longitudinal_impulse) / abs(report.desired_longitudinal_impulse))
+        desired = abs(report.desired_longitudinal_impulse)
+        if desired > 1e-9:
+            traction_ratio = min(1.0, abs(report.applied_longitudinal_impulse) / desired)
         ground_omega = report.contact_speed_after / max(self.wheel_radius, 1e-6)
-        self.angular_speed = self.angular_speed * (1.0 - 0.4 * traction_ratio) + ground_omega * (0.4 * traction_ratio)
+        self.angular_speed = angular_speed * (1.0 - 0.4 * traction_ratio) + ground_omega * (0.4 * traction_ratio)
         report.step = getattr(world, "step_index", None)
         self.last_report = report
 
@@ -248,6 +260,8 @@ class WheelMotor(Motor):
 class WheelMotorDetailed(Motor):
     """Wheel model that converts commands into torque/speed with traction limits."""
 
+    __slots__ = ("preset", "angular_speed", "_terms")
+
     def __init__(
         self,
         name: str,
@@ -260,41 +274,61 @@ class WheelMotorDetailed(Motor):
         self.preset = preset_info
         self.angular_speed = 0.0
         self.last_report: Optional[TractionReport] = None
+        self._terms: Optional[tuple] = None
+
+    def _preset_terms(self) -> tuple:
+        """Per-preset constants used every step, derived once per preset object."""
+        preset = self.preset
+        terms = self._terms
+        if terms is None or terms[0] is not preset:
+            terms = self._terms = (
+                preset,
+                abs(preset.max_torque * preset.gear_ratio / preset.wheel_radius),
+                float(max(preset.wheel_count, 1)),
+                max(preset.gear_ratio, 1e-6),
+                max(preset.motor_inertia, 1e-6),
+                max(preset.wheel_radius, 1e-6),
+            )
+        return terms
 
     def _apply(self, value: float, world: World, dt: float) -> None:
-        if not self.parent or not self.parent.can_move:
+        parent = self.parent
+        if not parent or not parent.can_move:
             return
-        torque = self.preset.max_torque * value
-        heading = self.parent.pose.compose(self.mount_pose)
-        direction = (math.cos(heading.theta), math.sin(heading.theta))
-        normal_load = self.preset.normal_force
+        preset, drive_cap_rate, wheel_share, gear_guard, inertia_guard, radius_guard = self._preset_terms()
+        torque = preset.max_torque * value
+        cx, cy, fx, fy = _wheel_frame(parent, self.mount_pose)
+        normal_load = preset.normal_force
         if normal_load is None:
-            normal_load = self.parent.state.mass * self.preset.g_equiv / float(max(self.preset.wheel_count, 1))
-        wheel_speed = self.angular_speed * self.preset.wheel_radius
-        drive_impulse_cap = abs(self.preset.max_torque * self.preset.gear_ratio / self.preset.wheel_radius) * dt
+            normal_load = parent.state.mass * preset.g_equiv / wheel_share
+        wheel_speed = self.angular_speed * preset.wheel_radius
+        drive_impulse_cap = drive_cap_rate * dt
         report = _solve_wheel_traction(
-            self.parent,
-            (heading.x, heading.y),
-            direction,
+            parent,
+            cx,
+            cy,
+            fx,
+            fy,
             wheel_speed,
             drive_impulse_cap,
-            mu_long=self.preset.mu_long,
-            mu_lat=self.preset.mu_lat,
+            mu_long=preset.mu_long,
+            mu_lat=preset.mu_lat,
             normal_load=normal_load,
-            lateral_damping=self.preset.lateral_damping,
+            lateral_damping=preset.lateral_damping,
             dt=dt,
         )
         reaction_torque = 0.0
         if dt > 0:
-            reaction_torque = (report.applied_longitudinal_impulse / dt) * self.preset.wheel_radius / max(self.preset.gear_ratio, 1e-6)
+            reaction_torque = (report.applied_longitudinal_impulse / dt) * preset.wheel_radius / gear_guard
         net_torque = torque - reaction_torque
-        self.angular_speed += (net_torque / max(self.preset.motor_inertia, 1e-6)) * dt
-        self.angular_speed = _clamp(self.angular_speed, -100.0, 100.0)
+        angular_speed = self.angular_speed + (net_torque / inertia_guard) * dt
+        angular_speed = _clamp(angular_speed, -100.0, 100.0)
         traction_ratio = 0.0
-        if abs(report.desired_longitudinal_impulse) > 1e-9:
-            traction_ratio = min(1.0, abs(report.applied_longitudinal_impulse) / abs(report.desired_longitudinal_impulse))
-        ground_omega = report.contact_speed_after / max(self.preset.wheel_radius, 1e-6)
-        self.angular_speed = self.angular_speed * (1.0 - 0.3 * traction_ratio) + ground_omega * (0.3 * traction_ratio)
+        desired = abs(report.desired_longitudinal_impulse)
+        if desired > 1e-9:
+            traction_ratio = min(1.0, abs(report.applied_longitudinal_impulse) / desired)
+        ground_omega = report.contact_speed_after / radius_guard
+        self.angular_speed = angular_speed * (1.0 - 0.3 * traction_ratio) + ground_omega * (0.3 * traction_ratio)
         report.step = getattr(world, "step_index", None)
         self.last_report = report
 
@@ -386,4 +420,6 @@ class DifferentialDrive:
 
 
 def _clamp(value: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, value))
+    # Same result as max(lo, min(hi, value)), NaN -> hi included, without the two builtin calls.
+    value = value if value < hi else hi
+    return value if value > lo else lo
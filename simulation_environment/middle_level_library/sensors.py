@@ -12,8 +12,14 @@ from .base import NoiseProfile, Sensor, SensorReading
 from .presets import LINE_SENSOR_PRESETS, LineSensorPreset, DISTANCE_SENSOR_PRESETS, DistanceSensorPreset
 
 
+# Slack on the ray's bounding box so rounding in the pose round trip can't drop a hit.
+_RAY_BOX_MARGIN = 1e-6
+
+
 def _clamp(value: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, value))
+    # Same result as max(lo, min(hi, value)), NaN -> hi included, without the two builtin calls.
+    value = value if value < hi else hi
+    return value if value > lo else lo
 
 
 def _sample_line_intensity(world: World, point: tuple[float, float]) -> float:
@@ -21,7 +27,7 @@ def _sample_line_intensity(world: World, point: tuple[float, float]) -> float:
         intensity = obj.material_field("line_intensity", 0.0)
         if intensity <= 0.0:
             continue
-        if obj.shape.contains_point(point, obj.pose):
+        if obj.contains_point(point):
             return intensity
     return 0.0
 
@@ -190,16 +196,30 @@ class DistanceSensor(Sensor):
         origin: tuple[float, float],
         direction: tuple[float, float],
     ) -> Optional[float]:
+        # Only bodies whose (cached) world AABB touches the ray's box can contain a sample.
+        end_x = origin[0] + direction[0] * self.preset.max_range
+        end_y = origin[1] + direction[1] * self.preset.max_range
+        lo_x = min(origin[0], end_x) - _RAY_BOX_MARGIN
+        hi_x = max(origin[0], end_x) + _RAY_BOX_MARGIN
+        lo_y = min(origin[1], end_y) - _RAY_BOX_MARGIN
+        hi_y = max(origin[1], end_y) + _RAY_BOX_MARGIN
+        candidates = []
+        for obj in world:
+            if obj is self.parent:
+                continue
+            box = obj.world_geometry()[0]
+            if box[0] <= hi_x and box[2] >= lo_x and box[1] <= hi_y and box[3] >= lo_y:
+                candidates.append(obj)
+        if not candidates:
+            return None
         distance = 0.0
         while distance <= self.preset.max_range:
             sample_point = (
                 origin[0] + direction[0] * distance,
                 origin[1] + direction[1] * distance,
             )
-            for obj in world:
-                if obj.shape.contains_point(sample_point, obj.pose):
-                    if obj is self.parent:
-                        continue
+            for obj in candidates:
+                if obj.contains_point(sample_point):
                     return distance
             distance += self.preset.step
         return None
@@ -0,0 +1,154 @@
+"""Config decoding against the bundled scenario and asset files."""
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Dict, get_args, get_origin, get_type_hints
+
+import pytest
+
+BASE = Path(__file__).resolve().parents[1]
+if str(BASE) not in sys.path:
+    sys.path.insert(0, str(BASE))
+
+import core.config as config_module  # noqa: E402
+from core.config import CustomObjectConfig, RobotConfig, WorldConfig, _dataclass_from_dict, load_json, save_json  # noqa: E402
+
+CONFIG_FILES = sorted(
+    [(p, WorldConfig) for p in BASE.glob("scenarios/*/world.json")]
+    + [(p, RobotConfig) for p in BASE.glob("scenarios/*/robot.json")]
+    + [(p, WorldConfig) for p in BASE.glob("assets/environments/*.json")]
+    + [(p, RobotConfig) for p in BASE.glob("assets/robots/*.json")]
+)
+
+
+def _param_id(value) -> str:
+    return value.name if isinstance(value, Path) else getattr(value, "__name__", str(value))
+
+
+def _reference_decode(cls, data: Dict) -> object:
+    """The original per-key decoder: resolve each value's annotation as it is read."""
+    field_types = get_type_hints(cls)
+    kwargs = {}
+    for key, value in data.items():
+        expected = field_types.get(key)
+        origin = get_origin(expected)
+        if origin is list:
+            inner = get_args(expected)[0]
+            if hasattr(inner, "__dataclass_fields__"):
+                kwargs[key] = [_reference_decode(inner, v) for v in value]
+                continue
+        if origin is not None:
+            args = [a for a in get_args(expected) if a is not type(None)]
+            if len(args) == 1 and hasattr(args[0], "__dataclass_fields__"):
+                kwargs[key] = None if value is None else _reference_decode(args[0], value)
+                continue
+        if hasattr(expected, "__dataclass_fields__"):
+            kwargs[key] = _reference_decode(expected, value)
+        else:
+            kwargs[key] = value
+    return cls(**kwargs)
+
+
+@pytest.mark.parametrize("path,cls", CONFIG_FILES, ids=_param_id)
+def test_bundled_configs_decode_like_reference(path: Path, cls):
+    expected = _reference_decode(cls, json.loads(path.read_text(encoding="utf-8")))
+    assert load_json(path, cls) == expected
+
+
+_BODY = {"name": "b", "points": [[0.0, 0.0], [0.1, 0.0], [0.1, 0.1]], "edges": [[0, 1], [1, 2], [2, 0]]}
+
+
+@pytest.mark.parametrize(
+    "cls,data",
+    [
+        (WorldConfig, {}),  # every field defaulted
+        (WorldConfig, {"bounds": None, "drawings": []}),
+        (WorldConfig, {"bounds": {"min_x": -1.0, "min_y": -1.0, "max_x": 1.0, "max_y": 1.0}}),
+        (WorldConfig, {"designer_state": {}, "custom_objects": [{"name": "c", "body": _BODY}]}),
+        (CustomObjectConfig, {"name": "c", "body": dict(_BODY, material={"friction": 0.3})}),
+        (RobotConfig, {"bodies": [_BODY], "joints": [], "controller_module": "controller"}),
+    ],
+)
+def test_optional_nested_and_defaulted_fields_decode_like_reference(cls, data):
+    assert _dataclass_from_dict(cls, data) == _reference_decode(cls, data)
+
+
+# Minimal data for the config classes with required fields; the rest use their defaults.
+_REQUIRED = {
+    "ActuatorConfig": {"name": "m", "type": "motor", "body": "b"},
+    "BodyConfig": _BODY,
+    "CustomObjectConfig": {"name": "c", "body": _BODY},
+    "JointConfig": {"name": "j", "parent": "a", "child": "b"},
+    "MeasurementConfig": {"name": "m", "signal": "s"},
+    "SensorConfig": {"name": "s", "type": "line", "body": "b"},
+    "SnapshotState": {"time": 0.5, "step": 3, "bodies": {"b": {"pose": {"x": 1.0}}}},
+    "WorldObjectConfig": {"name": "w", "body": _BODY},
+}
+CONFIG_CLASSES = sorted(
+    (obj for obj in vars(config_module).values() if isinstance(obj, type) and dataclasses.is_dataclass(obj)),
+    key=lambda cls: cls.__name__,
+)
+
+
+@pytest.mark.parametrize("cls", CONFIG_CLASSES, ids=lambda cls: cls.__name__)
+def test_to_dict_covers_every_field(cls):
+    """Hand-written to_dict() must stay in step with the dataclass fields it saves."""
+    cfg = _dataclass_from_dict(cls, _REQUIRED.get(cls.__name__, {}))
+    assert cfg.to_dict() == dataclasses.asdict(cfg)
+
+
+@pytest.mark.parametrize("path,cls", CONFIG_FILES, ids=_param_id)
+def test_bundled_configs_to_dict_match_asdict(path: Path, cls):
+    cfg = load_json(path, cls)
+    assert cfg.to_dict() == dataclasses.asdict(cfg)
+
+
+# One file per config kind, plus a text field to put non-ASCII characters in.
+_ONE_OF_EACH = [
+    (*next(item for item in CONFIG_FILES if item[1] is cls), text_field)
+    for cls, text_field in ((WorldConfig, "name"), (RobotConfig, "controller_module"))
+]
+
+
+@pytest.mark.parametrize("path,cls,text_field", _ONE_OF_EACH, ids=_param_id)
+def test_orjson_and_stdlib_configs_load_alike(tmp_path: Path, monkeypatch, path: Path, cls, text_field: str):
+    orjson = pytest.importorskip("orjson")
+    cfg = load_json(path, cls)
+    setattr(cfg, text_field, "café")
+    save_json(tmp_path / "fast.json", cfg)
+    monkeypatch.setattr(config_module, "orjson", None)
+    save_json(tmp_path / "stdlib.json", cfg)
+    # Not byte-identical (raw UTF-8, float spelling), but the same config through either loader.
+    loaded = [load_json(tmp_path / name, cls) for name in ("fast.json", "stdlib.json")]
+    monkeypatch.setattr(config_module, "orjson", orjson)
+    loaded += [load_json(tmp_path / name, cls) for name in ("fast.json", "stdlib.json")]
+    assert all(other == loaded[0] for other in loaded)
+    assert loaded[0].to_dict() == json.loads(json.dumps(cfg.to_dict()))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_int_keys_round_trip(tmp_path: Path, monkeypatch, use_orjson: bool):
+    orjson = pytest.importorskip("orjson")
+    cfg = WorldConfig(metadata={1: "one", "nested": {2: [0.5, 1e16]}})
+    monkeypatch.setattr(config_module, "orjson", orjson if use_orjson else None)
+    save_json(tmp_path / "world.json", cfg)
+    for loader_orjson in (orjson, None):
+        monkeypatch.setattr(config_module, "orjson", loader_orjson)
+        assert load_json(tmp_path / "world.json", WorldConfig).metadata == {"1": "one", "nested": {"2": [0.5, 1e16]}}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_non_finite_values_round_trip(tmp_path: Path, monkeypatch, use_orjson: bool):
+    orjson = pytest.importorskip("orjson")
+    cfg = WorldConfig(metadata={"gain": math.nan, "limit": -math.inf, 1: "one", "nested": {2: [0.5, math.inf]}})
+    monkeypatch.setattr(config_module, "orjson", orjson if use_orjson else None)
+    save_json(tmp_path / "world.json", cfg)
+    for loader_orjson in (orjson, None):
+        monkeypatch.setattr(config_module, "orjson", loader_orjson)
+        metadata = load_json(tmp_path / "world.json", WorldConfig).metadata
+        assert math.isnan(metadata.pop("gain"))
+        assert metadata == {"limit": -math.inf, "1": "one", "nested": {"2": [0.5, math.inf]}}
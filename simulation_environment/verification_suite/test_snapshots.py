@@ -0,0 +1,96 @@
+"""Snapshot round trips: in-memory restore and the on-disk layouts."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE = Path(__file__).resolve().parents[1]
+if str(BASE) not in sys.path:
+    sys.path.insert(0, str(BASE))
+
+import core.persistence as persistence  # noqa: E402
+from core import (  # noqa: E402
+    Simulator,
+    flush_snapshots,
+    load_scenario,
+    load_snapshot,
+    save_snapshot,
+    save_snapshot_async,
+    save_snapshot_binary,
+)
+
+
+def _loaded_sim(name: str = "composed_generic") -> Simulator:
+    scenario_path = BASE / "scenarios" / name
+    world_cfg, robot_cfg = load_scenario(scenario_path)
+    sim = Simulator()
+    sim.load(scenario_path, world_cfg, robot_cfg, top_down=True)
+    return sim
+
+
+def test_apply_snapshot_restores_body_state():
+    sim = _loaded_sim()
+    for _ in range(40):
+        sim.step()
+    snap = sim.snapshot()
+    for _ in range(25):
+        sim.step()
+    assert sim.snapshot().bodies != snap.bodies
+    sim.apply_snapshot(snap)
+    restored = sim.snapshot()
+    assert restored.bodies == snap.bodies
+    assert (restored.time, restored.step) == (snap.time, snap.step)
+
+
+def test_binary_snapshot_loads_like_json(tmp_path: Path):
+    sim = _loaded_sim()
+    for _ in range(30):
+        sim.step()
+    snap = sim.snapshot()
+    save_snapshot(tmp_path / "plain.json", snap)
+    save_snapshot_binary(tmp_path / "packed.json", snap)
+    plain = load_snapshot(tmp_path / "plain.json")
+    packed = load_snapshot(tmp_path / "packed.json")
+    assert packed.to_dict() == plain.to_dict()
+
+
+def test_truncated_body_sidecar_is_rejected(tmp_path: Path):
+    sim = _loaded_sim()
+    save_snapshot_binary(tmp_path / "packed.json", sim.snapshot())
+    sidecar = tmp_path / "packed.bodies.bin"
+    sidecar.write_bytes(sidecar.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        load_snapshot(tmp_path / "packed.json")
+
+
+def test_async_save_keeps_controller_state_at_queue_time(tmp_path: Path):
+    sim = _loaded_sim()
+    snap = sim.snapshot()
+    snap.controller_state = {"phase": 1, "history": [0.5]}
+    save_snapshot_async(tmp_path / "queued.json", snap)
+    # The controller keeps running while the worker encodes.
+    snap.controller_state["phase"] = 2
+    snap.controller_state["history"].append(0.75)
+    flush_snapshots()
+    assert load_snapshot(tmp_path / "queued.json").controller_state == {"phase": 1, "history": [0.5]}
+
+
+@pytest.mark.parametrize("indent", [True, False])
+def test_orjson_and_stdlib_snapshots_load_alike(tmp_path: Path, monkeypatch, indent: bool):
+    orjson = pytest.importorskip("orjson")
+    sim = _loaded_sim()
+    for _ in range(30):
+        sim.step()
+    snap = sim.snapshot()
+    snap.controller_state = {"label": "café", "gain": 1e-05, 3: [1e16, -0.0]}
+    save_snapshot(tmp_path / "fast.json", snap, indent=indent)
+    monkeypatch.setattr(persistence, "orjson", None)
+    save_snapshot(tmp_path / "stdlib.json", snap, indent=indent)
+    # Not byte-identical (raw UTF-8, float spelling), but the same data through either loader.
+    loaded = [load_snapshot(tmp_path / name).to_dict() for name in ("fast.json", "stdlib.json")]
+    monkeypatch.setattr(persistence, "orjson", orjson)
+    loaded += [load_snapshot(tmp_path / name).to_dict() for name in ("fast.json", "stdlib.json")]
+    assert all(data == loaded[0] for data in loaded)
+    assert loaded[0]["controller_state"] == {"label": "café", "gain": 1e-05, "3": [1e16, -0.0]}
@@ -1,11 +1,13 @@
 """Tests for traction-aware wheel dynamics and slip handling."""
 from __future__ import annotations
 
+from array import array
 import json
 import math
 import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 SIM_ENV_ROOT = Path(__file__).resolve().parents[1]
 if str(SIM_ENV_ROOT) not in sys.path:
@@ -53,7 +55,7 @@ from low_level_mechanics.geometry import Circle
 from low_level_mechanics.materials import MaterialProperties
 from middle_level_library.motors import WheelMotor, DifferentialDrive
 from core.config import ActuatorConfig, BodyConfig, MaterialConfig, RobotConfig, WorldConfig
-from core.simulator import Simulator
+from core.simulator import Simulator, load_trace_log_compact
 
 
 FIXTURE_PATH = Path(__file__).parent / "fixtures" / "traction_trace.json"
@@ -204,7 +206,7 @@ def check_locked_vs_spin() -> Tuple[bool, str]:
     return passed, msg
 
 
-def _build_trace() -> List[Dict[str, object]]:
+def _run_trace_sim(trace_path: Optional[Path] = None) -> Simulator:
     world_cfg = WorldConfig(name="trace_world", seed=11, timestep=0.01)
     body_cfg = BodyConfig(
         name="chassis",
@@ -241,14 +243,18 @@ def _build_trace() -> List[Dict[str, object]]:
     )
     sim = Simulator()
     sim.load(SIM_ENV_ROOT / "verification_suite", world_cfg, robot_cfg, ignore_terrain=True)
-    sim.enable_trace_logging(True)
+    sim.enable_trace_logging(True, path=trace_path)
 
     commands = [(0.35, 0.35), (0.35, 0.15), (0.0, 0.4)]
     for left_cmd, right_cmd in commands:
         sim.motors["left_motor"].command(left_cmd, sim, sim.dt)
         sim.motors["right_motor"].command(right_cmd, sim, sim.dt)
         sim.step(sim.dt)
-    return _round_trace(sim.export_trace_log())
+    return sim
+
+
+def _build_trace() -> List[Dict[str, object]]:
+    return _round_trace(_run_trace_sim().export_trace_log())
 
 
 def check_trace_regression() -> Tuple[bool, str]:
@@ -261,6 +267,40 @@ def check_trace_regression() -> Tuple[bool, str]:
     return passed, "trace regression" if passed else "trace mismatch"
 
 
+def _as_float32(value):
+    if isinstance(value, float):
+        return array("f", [value])[0]
+    if isinstance(value, (tuple, list)):
+        return [_as_float32(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _as_float32(v) for k, v in value.items()}
+    return value
+
+
+def check_compact_trace_roundtrip() -> Tuple[bool, str]:
+    sim = _run_trace_sim()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "trace.json"
+        sim.save_trace_log_compact(path)
+        loaded = load_trace_log_compact(path)
+    expected = _as_float32(sim.trace_log)
+    passed = len(loaded) == len(expected) and _as_float32(loaded) == expected
+    return passed, f"compact trace: {len(loaded)} rows" if passed else "compact trace mismatch"
+
+
+def check_streamed_trace() -> Tuple[bool, str]:
+    expected = _run_trace_sim().export_trace_log()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "trace.jsonl"
+        sim = _run_trace_sim(path)
+        # Read while the file is still open: every recorded step must already be on disk.
+        streamed = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        sim.load(SIM_ENV_ROOT / "verification_suite", sim.world_cfg, sim.robot_cfg, ignore_terrain=True)
+        closed = sim._trace_fp is None and not sim.trace_enabled
+    passed = closed and _round_trace(streamed) == _round_trace(expected)
+    return passed, f"streamed trace: {len(streamed)} lines" if passed else "streamed trace mismatch or left open"
+
+
 def run() -> bool:
     checks = [
         ("longitudinal_no_slip", check_longitudinal_no_slip),
@@ -268,6 +308,8 @@ def run() -> bool:
         ("lateral_bounded", check_lateral_slip_bounded),
         ("one_wheel_spin", check_locked_vs_spin),
         ("trace_regression", check_trace_regression),
+        ("compact_trace_roundtrip", check_compact_trace_roundtrip),
+        ("streamed_trace", check_streamed_trace),
     ]
     results = []
     for name, fn in checks:
@@ -17,6 +17,7 @@ if str(PACKAGE_ROOT) not in sys.path:
 import pygame  # noqa: E402
 
 from apps.runner import RunnerApp  # noqa: E402
+from apps.shared_ui import GlyphAtlas  # noqa: E402
 
 
 def _snapshot_menu(app: RunnerApp) -> list[dict]:
@@ -58,16 +59,74 @@ def _check_rounding(app: RunnerApp) -> bool:
     }
 
 
+def _resume_labels(app: RunnerApp) -> list[str]:
+    run_entries = next(entries for label, entries in app.hover_menu.menus if label == "Run")
+    resume = next(e for e in run_entries if e.get("label") == "Resume from snapshot")
+    return [str(child.get("label")) for child in resume["children"]]
+
+
+def _check_snapshot_menu(app: RunnerApp) -> bool:
+    """A quick snapshot shows up under Run > Resume from snapshot once its save lands."""
+    app._refresh_hover_menu()
+    app.sim.step()
+    snap_path = app.scenario_root / app.scenario_name / "snapshots" / f"snap_{app.sim.step_index:06d}.json"
+    existed = snap_path.exists()
+    try:
+        app._save_snapshot()
+        app._poll_snapshot_saves(wait=True)
+        return snap_path.name in _resume_labels(app)
+    finally:
+        if not existed:
+            snap_path.unlink(missing_ok=True)
+
+
+def _ink(surface: pygame.Surface) -> tuple[int, pygame.Rect]:
+    width, height = surface.get_size()
+    total = sum(surface.get_at((x, y)).a for x in range(width) for y in range(height))
+    return total, surface.get_bounding_rect()
+
+
+def _check_glyph_atlas() -> bool:
+    """Atlas text carries the same glyph ink as font.render(); only unkerned placement differs."""
+    color = (230, 230, 230)
+    ok = True
+    for size in (12, 14):
+        font = pygame.font.Font(pygame.font.get_default_font(), size)
+        atlas = GlyphAtlas(font, color)
+        for text in ("left_motor: 0.124", "speed 1.50 m/s", "{ang: 1.23, lin: (0.11, -0.22)}", "dist \u2192 0.4"):
+            rendered = font.render(text, True, color)
+            # Room past the rendered width so atlas drift isn't clipped.
+            canvas = (rendered.get_width() + 16, rendered.get_height())
+            expected = pygame.Surface(canvas, pygame.SRCALPHA)
+            expected.blit(rendered, (0, 0))
+            drawn = pygame.Surface(canvas, pygame.SRCALPHA)
+            atlas.draw(drawn, text, (0, 0))
+            if not text.isascii():
+                # Falls back to font.render() as a whole.
+                ok = ok and pygame.image.tobytes(drawn, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+                continue
+            ink, rect = _ink(drawn)
+            ref_ink, ref_rect = _ink(expected)
+            ok = ok and ink == ref_ink and (rect.left, rect.top, rect.height) == (ref_rect.left, ref_rect.top, ref_rect.height)
+            # No kerning: the line end may drift a little with length.
+            ok = ok and abs(rect.right - ref_rect.right) <= 2 + len(text) // 10
+    return ok
+
+
 def run() -> bool:
     app = RunnerApp()
     menu_snapshot = _snapshot_menu(app)
     devices_snapshot = _snapshot_devices(app)
     rounding_ok = _check_rounding(app)
+    snapshot_menu_ok = _check_snapshot_menu(app)
+    glyph_atlas_ok = _check_glyph_atlas()
 
     payload = {
         "menus": menu_snapshot,
         "devices": devices_snapshot,
         "rounding": rounding_ok,
+        "snapshot_menu": snapshot_menu_ok,
+        "glyph_atlas": glyph_atlas_ok,
     }
     print(json.dumps(payload, indent=2))
 
@@ -94,7 +153,7 @@ def run() -> bool:
         and all("Reposition" not in label for label in view_labels)
     )
 
-    passed = bool(menu_snapshot) and rounding_ok and nested_ok
+    passed = bool(menu_snapshot) and rounding_ok and nested_ok and snapshot_menu_ok and glyph_atlas_ok
     print(f"UI snapshot + rounding test -> {'PASS' if passed else 'FAIL'}")
     return passed
 